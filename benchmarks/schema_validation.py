@@ -0,0 +1,107 @@
+"""
+Compares the per-value cost of validating against a schema using the
+`validate_object` engine and the compiled engine from `flex.validation.codegen`
+as the nesting depth of the schema grows, and for a wide schema that declares
+keywords for every type.
+
+    python benchmarks/schema_validation.py
+"""
+from __future__ import print_function
+
+import functools
+import timeit
+
+from flex.validation.common import validate_object
+from flex.validation.schema import construct_schema_validators
+from flex.validation.codegen import compile_schema_validator
+
+
+DEPTHS = (1, 5, 20)
+NUMBER = 1000
+
+
+def generate_context(depth):
+    definitions = {
+        'Leaf': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'minimum': 0},
+                'name': {'type': 'string', 'minLength': 1, 'maxLength': 20},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            },
+        },
+    }
+    for level in range(depth):
+        definitions['Level{0}'.format(level)] = {
+            'type': 'object',
+            'properties': {
+                'child': {'$ref': 'Level{0}'.format(level - 1) if level else 'Leaf'},
+                'siblings': {'type': 'array', 'items': {'$ref': 'Leaf'}},
+            },
+        }
+    return {'definitions': definitions}
+
+
+def generate_value(depth):
+    leaf = {'id': 1, 'name': 'leaf', 'tags': ['a', 'b', 'c']}
+    value = leaf
+    for _ in range(depth):
+        value = {'child': value, 'siblings': [leaf, leaf]}
+    return value
+
+
+WIDE_SCHEMA = {
+    'type': ['string', 'integer', 'number', 'array', 'object'],
+    'format': 'uuid',
+    'minimum': 0,
+    'maximum': 1000,
+    'multipleOf': 1,
+    'minLength': 1,
+    'maxLength': 64,
+    'pattern': '^[a-z0-9-]+$',
+    'minItems': 1,
+    'maxItems': 10,
+    'uniqueItems': True,
+    'minProperties': 1,
+    'maxProperties': 10,
+}
+WIDE_VALUES = ('7c3b2ec1-7b1c-4b66-a8b0-3b9e8b8c3b1a', 42, 4.0, [1, 2, 3], {'a': 1})
+
+
+def compare(label, validate, compiled, value):
+    validate(value)
+    compiled(value)
+    interpreted_duration = timeit.timeit(lambda: validate(value), number=NUMBER)
+    compiled_duration = timeit.timeit(lambda: compiled(value), number=NUMBER)
+    print("{0:>12}: {1:8.1f} us/value interpreted, {2:8.1f} us/value compiled".format(
+        label,
+        interpreted_duration / NUMBER * 1000000,
+        compiled_duration / NUMBER * 1000000,
+    ))
+
+
+def main():
+    for depth in DEPTHS:
+        context = generate_context(depth)
+        schema = {'$ref': 'Level{0}'.format(depth - 1)}
+        validators = construct_schema_validators(schema, context)
+        compare(
+            'depth {0}'.format(depth),
+            functools.partial(validate_object, validators=validators, inner=True),
+            compile_schema_validator(schema, context),
+            generate_value(depth),
+        )
+
+    validators = construct_schema_validators(WIDE_SCHEMA, {})
+    compiled = compile_schema_validator(WIDE_SCHEMA, {})
+    for value in WIDE_VALUES:
+        compare(
+            'wide {0}'.format(type(value).__name__),
+            functools.partial(validate_object, validators=validators, inner=True),
+            compiled,
+            value,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,654 @@
+"""
+Benchmark suite for the stages of the validation pipeline: importing flex,
+loading schemas, routing request paths, validating requests and responses and
+the format validators.
+
+Results are written as JSON so they can be saved and compared against a
+later run.
+
+    python benchmarks/suite.py                          # run everything
+    python benchmarks/suite.py -k routing -k request    # only matching names
+    python benchmarks/suite.py -o baseline.json         # save the results
+    python benchmarks/suite.py --compare baseline.json  # compare to a baseline
+
+With `--compare` the exit status is non-zero if any benchmark is slower than
+the baseline by more than `--threshold`.  Progress and the comparison are
+written to stderr so that stdout only contains the JSON results.
+"""
+from __future__ import print_function
+from __future__ import division
+
+import argparse
+import atexit
+import collections
+import functools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import flex
+from flex.core import (
+    load,
+    load_source,
+    generate_api_call_validator,
+)
+from flex.formats import registry
+from flex.registry import SchemaRegistry
+from flex.http import (
+    Request,
+    Response,
+)
+from flex.paths import (
+    PathMatchCache,
+    PathRouter,
+    RegexPathRouter,
+    match_request_path_to_api_path,
+    path_to_regex,
+)
+from flex.validation.request import (
+    generate_request_validator,
+    generate_resolved_request_validator,
+)
+from flex.validation.response import (
+    ResponseValidatorCache,
+    validate_response,
+)
+
+
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR)
+
+PETSTORE = os.path.join(ROOT, 'tests', 'core', 'example_schemas', 'petstore.yaml')
+UBER = os.path.join(ROOT, 'tests', 'core', 'example_schemas', 'uber.yaml')
+HTTPBIN = os.path.join(ROOT, 'tests', 'schemas', 'httpbin.yaml')
+
+BENCHMARKS = collections.OrderedDict()
+
+
+def benchmark(name, number, repeat=5):
+    """
+    Registers a benchmark.  The decorated function does any setup and returns
+    the callable that is timed.  Each of the `repeat` timings calls it
+    `number` times.
+    """
+    def outer(setup):
+        BENCHMARKS[name] = (setup, number, repeat)
+        return setup
+    return outer
+
+
+#
+# Generated schemas
+#
+def generate_raw_schema(num_paths):
+    """
+    A deterministic schema with `num_paths` api paths.  Each path has a path
+    parameter, a query parameter and a response body that references a shared
+    definition.
+    """
+    paths = {}
+    for index in range(num_paths):
+        paths['/resource-{0}/{{id}}/items'.format(index)] = {
+            'parameters': [
+                {'name': 'id', 'in': 'path', 'type': 'integer', 'required': True},
+            ],
+            'get': {
+                'parameters': [
+                    {'name': 'sort', 'in': 'query', 'type': 'string'},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {'type': 'array', 'items': {'$ref': 'Item'}},
+                    },
+                },
+            },
+        }
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'Benchmark', 'version': '1.0'},
+        'produces': ['application/json'],
+        'paths': paths,
+        'definitions': {
+            'Item': {
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer', 'minimum': 0},
+                    'name': {'type': 'string', 'minLength': 1, 'maxLength': 100},
+                    'tags': {'type': 'array', 'items': {'type': 'string'}},
+                },
+            },
+        },
+    }
+
+
+def generate_raw_schema_with_definitions(num_paths):
+    """
+    The generated schema with a separate definition for the response of each
+    api path, so that the definitions grow with the paths.
+    """
+    raw_schema = generate_raw_schema(num_paths)
+    item = json.dumps(raw_schema['definitions'].pop('Item'))
+    for index, path_definition in enumerate(raw_schema['paths'].values()):
+        name = 'Item{0}'.format(index)
+        raw_schema['definitions'][name] = json.loads(item)
+        response = path_definition['get']['responses']['200']
+        response['schema']['items'] = {'$ref': name}
+    return raw_schema
+
+
+def load_generated_schema(num_paths, _cache={}):
+    if num_paths not in _cache:
+        _cache[num_paths] = load(generate_raw_schema(num_paths))
+    return _cache[num_paths]
+
+
+def generate_request(num_paths):
+    return Request(
+        url='http://www.example.com/resource-{0}/1234/items?sort=name'.format(
+            num_paths // 2,
+        ),
+        method='get',
+    )
+
+
+#
+# Importing
+#
+def run_python(statement):
+    """
+    Runs `statement` in a fresh interpreter that imports flex from the same
+    location as this process.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (
+        os.path.dirname(os.path.dirname(os.path.abspath(flex.__file__))),
+        env.get('PYTHONPATH'),
+    )))
+    subprocess.check_call([sys.executable, '-c', statement], env=env)
+
+
+@benchmark('import.python', number=5)
+def bench_import_python():
+    """
+    Interpreter startup, to subtract from the import benchmarks.
+    """
+    return functools.partial(run_python, 'pass')
+
+
+@benchmark('import.flex', number=5)
+def bench_import_flex():
+    return functools.partial(run_python, 'import flex')
+
+
+@benchmark('import.flex-and-load', number=5)
+def bench_import_flex_and_load():
+    return functools.partial(
+        run_python, 'import flex; flex.load({0!r})'.format(generate_raw_schema(1)),
+    )
+
+
+#
+# Loading
+#
+def attempt_load(source):
+    """
+    The bundled example schemas use features that flex does not support yet,
+    so they fail meta-validation.  Reaching that verdict still exercises the
+    whole loading pipeline, which is what is being measured.
+    """
+    try:
+        load(source)
+    except ValueError:
+        pass
+
+
+@benchmark('load.petstore', number=10)
+def bench_load_petstore():
+    return functools.partial(attempt_load, PETSTORE)
+
+
+@benchmark('load.uber', number=10)
+def bench_load_uber():
+    return functools.partial(attempt_load, UBER)
+
+
+@benchmark('load.httpbin', number=10)
+def bench_load_httpbin():
+    return functools.partial(attempt_load, HTTPBIN)
+
+
+@benchmark('load.generated-1k', number=1, repeat=3)
+def bench_load_generated_1k():
+    return functools.partial(load, json.dumps(generate_raw_schema(1000)))
+
+
+@benchmark('load.generated-10k', number=1, repeat=1)
+def bench_load_generated_10k():
+    return functools.partial(load, json.dumps(generate_raw_schema(10000)))
+
+
+@benchmark('load.processes-4.generated-10k', number=1, repeat=1)
+def bench_load_processes_4_generated_10k():
+    return functools.partial(load, json.dumps(generate_raw_schema(10000)), processes=4)
+
+
+@benchmark('load.definitions-5k', number=1, repeat=1)
+def bench_load_definitions_5k():
+    return functools.partial(load, json.dumps(generate_raw_schema_with_definitions(5000)))
+
+
+@benchmark('load.processes-4.definitions-5k', number=1, repeat=1)
+def bench_load_processes_4_definitions_5k():
+    return functools.partial(
+        load, json.dumps(generate_raw_schema_with_definitions(5000)), processes=4,
+    )
+
+
+@benchmark('load.trusted.generated-1k', number=1, repeat=3)
+def bench_load_trusted_generated_1k():
+    return functools.partial(load, json.dumps(generate_raw_schema(1000)), trusted=True)
+
+
+@benchmark('load.trusted.generated-10k', number=1, repeat=3)
+def bench_load_trusted_generated_10k():
+    return functools.partial(load, json.dumps(generate_raw_schema(10000)), trusted=True)
+
+
+@benchmark('load.cached.generated-1k', number=10)
+def bench_load_cached_generated_1k():
+    cache_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, cache_dir, True)
+    return functools.partial(
+        load, json.dumps(generate_raw_schema(1000)), cache_dir=cache_dir,
+    )
+
+
+@benchmark('load-source.json.generated-1k', number=1, repeat=3)
+def bench_load_source_json_generated_1k():
+    return functools.partial(load_source, json.dumps(generate_raw_schema(1000)))
+
+
+@benchmark('load-source.yaml.generated-1k', number=1, repeat=3)
+def bench_load_source_yaml_generated_1k():
+    import yaml
+    return functools.partial(load_source, yaml.safe_dump(generate_raw_schema(1000)))
+
+
+#
+# Routing
+#
+@benchmark('routing.match-request-path.100', number=100)
+def bench_match_request_path_100():
+    paths = load_generated_schema(100)['paths']
+    return functools.partial(
+        match_request_path_to_api_path, paths, '/resource-50/1234/items',
+    )
+
+
+@benchmark('routing.router.1k', number=10000)
+def bench_router_1k():
+    router = PathRouter(load_generated_schema(1000)['paths'])
+    return functools.partial(router.match, '/resource-500/1234/items')
+
+
+@benchmark('routing.router.10k', number=10000)
+def bench_router_10k():
+    router = PathRouter(load_generated_schema(10000)['paths'])
+    return functools.partial(router.match, '/resource-5000/1234/items')
+
+
+@benchmark('routing.cached-router.10k', number=10000)
+def bench_cached_router_10k():
+    router = PathMatchCache(PathRouter(load_generated_schema(10000)['paths']))
+    return functools.partial(router.match, '/resource-5000/1234/items')
+
+
+def match_each_path_regex(path_regexes, request_path):
+    return [
+        api_path for api_path, path_regex in path_regexes if path_regex.match(request_path)
+    ]
+
+
+@benchmark('routing.regex-loop.1k', number=100)
+def bench_regex_loop_1k():
+    path_regexes = [
+        (api_path, path_to_regex(api_path, path_definition.get('parameters', [])))
+        for api_path, path_definition in load_generated_schema(1000)['paths'].items()
+    ]
+    return functools.partial(match_each_path_regex, path_regexes, '/resource-500/1234/items')
+
+
+@benchmark('routing.regex-router.1k', number=1000)
+def bench_regex_router_1k():
+    router = RegexPathRouter(load_generated_schema(1000)['paths'])
+    return functools.partial(router.match, '/resource-500/1234/items')
+
+
+@benchmark('routing.regex-router.10k', number=100)
+def bench_regex_router_10k():
+    router = RegexPathRouter(load_generated_schema(10000)['paths'])
+    return functools.partial(router.match, '/resource-5000/1234/items')
+
+
+@benchmark('routing.build-regex-router.1k', number=1)
+def bench_build_regex_router_1k():
+    return functools.partial(RegexPathRouter, load_generated_schema(1000)['paths'])
+
+
+#
+# Gateway dispatch
+#
+def load_service_schemas(num_schemas, _cache={}):
+    """
+    `num_schemas` generated schemas of 10 paths each, one per service, which
+    differ by their `basePath`.
+    """
+    if num_schemas not in _cache:
+        schemas = []
+        for index in range(num_schemas):
+            raw_schema = generate_raw_schema(10)
+            raw_schema['host'] = 'api.example.com'
+            raw_schema['basePath'] = '/service-{0}/v1'.format(index)
+            schemas.append(load(raw_schema))
+        _cache[num_schemas] = schemas
+    return _cache[num_schemas]
+
+
+def generate_service_request(num_schemas):
+    return Request(
+        url='http://api.example.com/service-{0}/v1/resource-5/1234/items'.format(
+            num_schemas - 1,
+        ),
+        method='get',
+    )
+
+
+def match_each_schema(schemas, request):
+    for schema in schemas:
+        if not request.path.startswith(schema['basePath']):
+            continue
+        try:
+            return schema, match_request_path_to_api_path(
+                schema['paths'], request.path, schema['basePath'],
+            )
+        except LookupError:
+            continue
+
+
+@benchmark('gateway.schema-loop.300-schemas', number=10)
+def bench_gateway_schema_loop_300():
+    schemas = load_service_schemas(300)
+    return functools.partial(match_each_schema, schemas, generate_service_request(300))
+
+
+@benchmark('gateway.registry.300-schemas', number=10000)
+def bench_gateway_registry_300():
+    schema_registry = SchemaRegistry()
+    for schema in load_service_schemas(300):
+        schema_registry.add(schema)
+    return functools.partial(schema_registry.match, generate_service_request(300))
+
+
+@benchmark('gateway.registry.10-schemas', number=10000)
+def bench_gateway_registry_10():
+    schema_registry = SchemaRegistry()
+    for schema in load_service_schemas(10):
+        schema_registry.add(schema)
+    return functools.partial(schema_registry.match, generate_service_request(10))
+
+
+#
+# Request validation
+#
+@benchmark('request.generate-validator.1k', number=10)
+def bench_generate_request_validator_1k():
+    return functools.partial(generate_request_validator, load_generated_schema(1000))
+
+
+@benchmark('request.validate.10', number=1000)
+def bench_validate_request_10():
+    validator = generate_request_validator(load_generated_schema(10))
+    return functools.partial(validator, generate_request(10))
+
+
+@benchmark('request.validate.1k', number=1000)
+def bench_validate_request_1k():
+    validator = generate_request_validator(load_generated_schema(1000))
+    return functools.partial(validator, generate_request(1000))
+
+
+@benchmark('request.validate.10k', number=1000)
+def bench_validate_request_10k():
+    validator = generate_request_validator(load_generated_schema(10000))
+    return functools.partial(validator, generate_request(10000))
+
+
+@benchmark('request.validate-resolved.10k', number=1000)
+def bench_validate_resolved_request_10k():
+    validator = generate_resolved_request_validator(load_generated_schema(10000))
+    return functools.partial(
+        validator,
+        generate_request(10000),
+        api_path='/resource-5000/{id}/items',
+        method='get',
+        path_parameters={'id': '1234'},
+    )
+
+
+#
+# Response validation
+#
+def generate_response(num_items):
+    items = [
+        {'id': index, 'name': 'item-{0}'.format(index), 'tags': ['a', 'b']}
+        for index in range(num_items)
+    ]
+    return Response(
+        request=None,
+        content=json.dumps(items),
+        url='http://www.example.com/resource-5/1234/items',
+        status_code='200',
+        content_type='application/json',
+    )
+
+
+def response_validator(num_items, compiled=False):
+    schema = load_generated_schema(10)
+    operation_definition = schema['paths']['/resource-5/{id}/items']['get']
+    return functools.partial(
+        validate_response,
+        generate_response(num_items),
+        operation_definition=operation_definition,
+        context=schema,
+        response_validators=ResponseValidatorCache(schema, compiled=compiled),
+    )
+
+
+def generate_validators_for_every_response(schema, compiled=False):
+    response_validators = ResponseValidatorCache(schema, compiled=compiled)
+    for path_definition in schema['paths'].values():
+        response_validators.get_response_validator(path_definition['get'], '200')
+
+
+def load_inline_schema(num_paths, _cache={}):
+    """
+    The generated schema with a separate copy of the `Item` definition inlined
+    in each response, as generators of large specs often produce.
+    """
+    if num_paths not in _cache:
+        raw_schema = generate_raw_schema(num_paths)
+        item = json.dumps(raw_schema['definitions']['Item'])
+        for path_definition in raw_schema['paths'].values():
+            response = path_definition['get']['responses']['200']
+            response['schema']['items'] = json.loads(item)
+        _cache[num_paths] = load(raw_schema)
+    return _cache[num_paths]
+
+
+@benchmark('response.generate-validators.inline-1k', number=1)
+def bench_generate_response_validators_inline_1k():
+    return functools.partial(generate_validators_for_every_response, load_inline_schema(1000))
+
+
+@benchmark('response.generate-validators-compiled.inline-1k', number=1)
+def bench_generate_response_validators_compiled_inline_1k():
+    return functools.partial(
+        generate_validators_for_every_response, load_inline_schema(1000), compiled=True,
+    )
+
+
+@benchmark('response.validate.10-items', number=1000)
+def bench_validate_response_10():
+    return response_validator(10)
+
+
+@benchmark('response.validate.1k-items', number=10)
+def bench_validate_response_1k():
+    return response_validator(1000)
+
+
+@benchmark('response.validate-compiled.1k-items', number=10)
+def bench_validate_response_compiled_1k():
+    return response_validator(1000, compiled=True)
+
+
+@benchmark('api-call.validate.1k', number=100)
+def bench_validate_api_call_1k():
+    schema = load_generated_schema(1000)
+    response = generate_response(10)
+    response.request = generate_request(1000)
+    validator = generate_api_call_validator(schema)
+    return functools.partial(validator, response.request, response)
+
+
+#
+# Formats
+#
+FORMAT_VALUES = (
+    ('uuid', '7c3b2ec1-7b1c-4b66-a8b0-3b9e8b8c3b1a'),
+    ('date-time', '2011-10-18T10:29:47+03:00'),
+    ('email', 'piper@example.com'),
+    ('uri', 'http://www.example.com/path?query=value'),
+    ('int32', 1234),
+    ('int64', 1234),
+)
+
+
+def register_format_benchmark(format_, value):
+    @benchmark('formats.{0}'.format(format_), number=10000)
+    def bench_format():
+        return functools.partial(registry[format_], value)
+
+
+for format_, value in FORMAT_VALUES:
+    register_format_benchmark(format_, value)
+
+
+#
+# Running and reporting
+#
+def run_benchmark(name):
+    setup, number, repeat = BENCHMARKS[name]
+    func = setup()
+    # Warm up any lazily constructed state before timing.
+    func()
+    timings = sorted(
+        duration / number
+        for duration in timeit.repeat(func, number=number, repeat=repeat)
+    )
+    return {
+        'min': timings[0],
+        'median': timings[len(timings) // 2],
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def run(names):
+    results = collections.OrderedDict()
+    for name in names:
+        results[name] = run_benchmark(name)
+        print('{0:<40} {1:>14}'.format(name, format_duration(results[name]['min'])),
+              file=sys.stderr)
+    return collections.OrderedDict((
+        ('flex', flex.VERSION),
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('platform', platform.platform()),
+        ('results', results),
+    ))
+
+
+def format_duration(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * scale >= 1:
+            return '{0:.2f} {1}'.format(seconds * scale, unit)
+    return '{0:.2f} ns'.format(seconds * 1e9)
+
+
+def compare(report, baseline, threshold):
+    """
+    Prints the ratio of each benchmark's time to its time in the baseline and
+    returns the names of the benchmarks that got slower than `threshold`.
+    """
+    regressions = []
+    print('{0:<40} {1:>14} {2:>14} {3:>9}'.format('name', 'baseline', 'current', 'ratio'),
+          file=sys.stderr)
+    for name, result in report['results'].items():
+        if name not in baseline['results']:
+            continue
+        ratio = result['min'] / baseline['results'][name]['min']
+        if ratio > threshold:
+            regressions.append(name)
+        print('{0:<40} {1:>14} {2:>14} {3:>8.2f}x{4}'.format(
+            name,
+            format_duration(baseline['results'][name]['min']),
+            format_duration(result['min']),
+            ratio,
+            '  SLOWER' if ratio > threshold else '',
+        ), file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '-k', dest='patterns', action='append', default=[],
+        help='Only run benchmarks whose name contains this string.',
+    )
+    parser.add_argument('-o', '--output', help='Write the results to this file.')
+    parser.add_argument('--compare', help='A previously saved results file.')
+    parser.add_argument(
+        '--threshold', type=float, default=1.25,
+        help='Ratio to the baseline above which a benchmark is a regression.',
+    )
+    args = parser.parse_args(argv)
+
+    names = [
+        name for name in BENCHMARKS
+        if not args.patterns or any(pattern in name for pattern in args.patterns)
+    ]
+    report = run(names)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2, separators=(',', ': '))
+    else:
+        print(json.dumps(report, indent=2, separators=(',', ': ')))
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(report, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Runs a single shared validator from a growing number of threads, checking
+that every thread sees the correct result and reporting the throughput for
+each thread count.  Both the `validate_object` engine and the compiled engine
+from `flex.validation.codegen` are exercised.
+
+    python benchmarks/threaded_validation.py
+"""
+from __future__ import print_function
+
+import functools
+import threading
+import time
+
+from django.core.exceptions import ValidationError
+
+from flex.validation.common import validate_object
+from flex.validation.schema import construct_schema_validators
+from flex.validation.codegen import compile_schema_validator
+
+
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+ITERATIONS = 2000
+
+CONTEXT = {
+    'definitions': {
+        'Name': {'type': 'string', 'minLength': 2},
+        'Alias': {'$ref': 'Name', 'maxLength': 10},
+        'Node': {
+            'type': 'object',
+            'properties': {
+                'parent': {'$ref': 'Node'},
+                'name': {'$ref': 'Alias', 'required': True},
+                'tags': {'type': 'array', 'items': {'$ref': 'Name'}},
+            },
+        },
+    },
+}
+SCHEMA = {'$ref': 'Node'}
+
+VALID = {
+    'name': 'root',
+    'tags': ['ab', 'cd'],
+    'parent': {'name': 'parent', 'parent': {'name': 'grand'}},
+}
+INVALID = {
+    'name': 'r',
+    'tags': ['ab', 'c'],
+    'parent': {'parent': {'name': 'a-name-that-is-too-long'}},
+}
+
+
+def get_messages(validator, value):
+    try:
+        validator(value)
+    except ValidationError as err:
+        return err.messages
+    return None
+
+
+def run(validator, expected_errors, iterations, failures):
+    for _ in range(iterations):
+        if get_messages(validator, VALID) is not None:
+            failures.append(VALID)
+        if get_messages(validator, INVALID) != expected_errors:
+            failures.append(INVALID)
+
+
+def stress(validator, thread_count):
+    """
+    Returns the number of validations per second across all of the threads.
+    """
+    expected_errors = get_messages(validator, INVALID)
+    assert expected_errors is not None
+    failures = []
+    threads = [
+        threading.Thread(
+            target=run,
+            args=(validator, expected_errors, ITERATIONS // thread_count, failures),
+        )
+        for _ in range(thread_count)
+    ]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.time() - start
+
+    if failures:
+        raise AssertionError(
+            "{0} incorrect results with {1} threads".format(len(failures), thread_count),
+        )
+    return 2 * (ITERATIONS // thread_count) * thread_count / duration
+
+
+def main():
+    engines = (
+        ('interpreted', functools.partial(
+            validate_object,
+            validators=construct_schema_validators(SCHEMA, CONTEXT),
+            inner=True,
+        )),
+        ('compiled', compile_schema_validator(SCHEMA, CONTEXT)),
+    )
+    for name, validator in engines:
+        for thread_count in THREAD_COUNTS:
+            print("{0:>12} {1:>3} threads: {2:10.0f} validations/s".format(
+                name, thread_count, stress(validator, thread_count),
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+On-disk cache of loaded schemas.
+
+Meta-validating a large schema is slow, so `flex.core.load` can store the
+validated schema in a directory and reuse it on later loads.  Entries are
+keyed by a hash of the raw schema along with the versions of flex and python,
+so a change to any of them results in the schema being validated again.
+
+Cache entries are pickles, so the cache directory must only be writable by
+trusted users.
+"""
+import collections
+import errno
+import hashlib
+import json
+import os
+import sys
+
+from six.moves import cPickle as pickle
+
+import flex
+
+
+def canonicalize(value):
+    """
+    Convert a raw schema into nested lists and strings which serialize the
+    same way regardless of dictionary ordering.  Containers are tagged with
+    their type, so that an empty dictionary and an empty list, or a
+    dictionary and the list of its items, have different forms.
+    """
+    if isinstance(value, list):
+        return ['list', [canonicalize(item) for item in value]]
+    elif isinstance(value, tuple):
+        return ['tuple', [canonicalize(item) for item in value]]
+    elif isinstance(value, dict) or isinstance(value, collections.Mapping):
+        return ['dict', sorted(
+            [repr(key), canonicalize(item)] for key, item in value.items()
+        )]
+    return repr(value)
+
+
+def get_cache_key(raw_schema):
+    """
+    Returns the key under which the validated version of `raw_schema` is
+    cached.
+    """
+    content = json.dumps([
+        flex.VERSION,
+        list(sys.version_info[:2]),
+        canonicalize(raw_schema),
+    ])
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def get_cache_path(cache_dir, key):
+    return os.path.join(os.path.expanduser(cache_dir), '{0}.pickle'.format(key))
+
+
+def get_cached_schema(cache_dir, key):
+    """
+    Returns the cached schema for `key`, or `None` if there is no usable
+    entry.
+    """
+    try:
+        with open(get_cache_path(cache_dir, key), 'rb') as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        # A missing, truncated or otherwise unreadable entry is treated as a
+        # miss and will be replaced.
+        return None
+
+
+def set_cached_schema(cache_dir, key, schema):
+    """
+    Stores the validated schema under `key`.  The entry is written to a
+    temporary file and renamed into place so that processes loading the same
+    schema concurrently never see a partial entry.  Failing to write the
+    cache is not an error.
+    """
+    import tempfile
+
+    cache_dir = os.path.expanduser(cache_dir)
+    try:
+        try:
+            os.makedirs(cache_dir)
+        except OSError as err:
+            if err.errno != errno.EEXIST:
+                raise
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                pickle.dump(schema, temp_file, pickle.HIGHEST_PROTOCOL)
+            os.rename(temp_path, get_cache_path(cache_dir, key))
+        except Exception:
+            os.remove(temp_path)
+            raise
+    except (IOError, OSError):
+        pass
@@ -0,0 +1,103 @@
+"""
+Compact runtime representation of a loaded schema.
+
+A loaded schema keeps all of the documentation from the source, and the same
+strings, such as type names, formats and the keys of every object, are held
+as separate copies.  `compact_schema` returns a copy of a loaded schema which
+only holds what is needed to validate requests and responses:
+
+- documentation-only fields such as `description` and `summary` are dropped.
+- keys and strings are interned, so that each distinct string is stored once.
+
+Lists stay lists, so that errors quote them, such as the allowed types of a
+value, the same way as for the full schema.  Values that are data rather
+than structure, like `default`, `enum` and vendor extensions, are kept as
+they are.
+"""
+import collections
+
+import six
+
+
+DOCUMENTATION_FIELDS = frozenset((
+    'description',
+    'summary',
+    'externalDocs',
+    'example',
+    'examples',
+    'termsOfService',
+    'contact',
+    'license',
+))
+
+# Fields whose value is data, which is kept unchanged.
+DATA_FIELDS = frozenset((
+    'default',
+    'enum',
+))
+
+# Fields whose value maps names to objects.  The names are never treated as
+# field names, so that a property called `description` is kept.
+NAME_MAP_FIELDS = frozenset((
+    'paths',
+    'definitions',
+    'parameters',
+    'responses',
+    'headers',
+    'properties',
+    'securityDefinitions',
+    'scopes',
+))
+
+
+class Compactor(object):
+    """
+    Builds compact copies of schemas.  Strings are interned in `strings`,
+    which may be shared by several compactors so that schemas loaded in the
+    same process share their strings.
+    """
+    def __init__(self, strings=None):
+        self.strings = {} if strings is None else strings
+
+    def intern(self, value):
+        if isinstance(value, six.string_types):
+            # keyed by type as well, since on python 2 a byte string and the
+            # equal unicode string are the same key.
+            return self.strings.setdefault((type(value), value), value)
+        return value
+
+    def compact_value(self, value):
+        if isinstance(value, collections.Mapping):
+            return self.compact_object(value)
+        elif isinstance(value, (list, tuple)):
+            return [self.compact_value(item) for item in value]
+        return self.intern(value)
+
+    def compact_name_map(self, value):
+        return dict(
+            (self.intern(name), self.compact_value(item)) for name, item in value.items()
+        )
+
+    def compact_object(self, value):
+        compacted = {}
+        for key, item in value.items():
+            if key in DOCUMENTATION_FIELDS:
+                continue
+            elif key in DATA_FIELDS or key.startswith('x-'):
+                pass
+            elif key in NAME_MAP_FIELDS and isinstance(item, collections.Mapping):
+                item = self.compact_name_map(item)
+            elif key == 'security' and isinstance(item, (list, tuple)):
+                item = [self.compact_name_map(requirement) for requirement in item]
+            else:
+                item = self.compact_value(item)
+            compacted[self.intern(key)] = item
+        return compacted
+
+
+def compact_schema(schema, strings=None):
+    """
+    Returns a compact copy of a loaded `schema`.  Passing the same `strings`
+    dictionary when compacting several schemas shares strings between them.
+    """
+    return Compactor(strings).compact_object(schema)
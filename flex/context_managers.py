@@ -1,8 +1,9 @@
 import collections
 
-from django.core.exceptions import ValidationError
-
-from flex.exceptions import SafeNestedValidationError
+from flex.exceptions import (
+    SafeNestedValidationError,
+    ValidationError,
+)
 from flex.utils import (
     prettify_errors,
 )
@@ -28,3 +29,32 @@ class ErrorCollection(object):
                 raise SafeNestedValidationError(dict(self.errors))
             else:
                 raise ValueError(self.message + '\n' + prettify_errors(self.errors))
+
+
+class ProcessPool(object):
+    """
+    A `multiprocessing` pool of `processes` workers which is shut down when
+    the block exits.  No pool is started, and `None` is returned, unless
+    more than one process is asked for.  Each worker calls
+    `initializer(*initargs)` when it starts.
+    """
+    def __init__(self, processes=None, initializer=None, initargs=()):
+        self.processes = processes
+        self.initializer = initializer
+        self.initargs = initargs
+        self.pool = None
+
+    def __enter__(self):
+        if self.processes is not None and self.processes > 1:
+            import multiprocessing
+
+            self.pool = multiprocessing.Pool(
+                self.processes, initializer=self.initializer, initargs=self.initargs,
+            )
+        return self.pool
+
+    def __exit__(self, type_, value, traceback):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        return False
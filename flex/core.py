@@ -3,26 +3,109 @@ from __future__ import unicode_literals
 from six.moves import urllib_parse as urlparse
 import os
 import collections
-import requests
+import functools
 
 import six
 import json
-import yaml
 
-from django.core.exceptions import ValidationError
+from flex.exceptions import ValidationError
 
 from flex.context_managers import ErrorCollection
-from flex.serializers.core import (
-    SwaggerSerializer,
-    SchemaSerializer,
+from flex.meta.fields import Context
+from flex.meta.core import (
+    SwaggerField,
+    SchemaField,
 )
-from flex.serializers.definitions import SwaggerDefinitionsSerializer
+from flex.meta.definitions import SwaggerDefinitionsField
 from flex.utils import prettify_errors
+from flex.cache import (
+    get_cache_key,
+    get_cached_schema,
+    set_cached_schema,
+)
+from flex.compact import compact_schema
+from flex.references import (
+    get_base_uri,
+    resolve_references,
+)
+from flex.http import (
+    normalize_request,
+    normalize_response,
+)
+from flex.validation.common import validate_object
+from flex.validation.schema import construct_schema_validators
 from flex.validation.request import generate_request_validator
-from flex.validation.response import generate_response_validator
+from flex.validation.response import generate_operation_response_validator
+
+
+JSON = 'json'
+YAML = 'yaml'
+
+SOURCE_FORMAT_EXTENSIONS = {
+    '.json': JSON,
+    '.yaml': YAML,
+    '.yml': YAML,
+}
+
+
+def get_source_format(raw_source, name=None, content_type=None):
+    """
+    Guess whether `raw_source` is json or yaml, from the extension of the
+    file `name` or the `content_type` it was served with if there is one, and
+    otherwise from its first non-whitespace character.
+    """
+    if name:
+        extension = os.path.splitext(name)[1].lower()
+        if extension in SOURCE_FORMAT_EXTENSIONS:
+            return SOURCE_FORMAT_EXTENSIONS[extension]
+    if content_type:
+        if JSON in content_type:
+            return JSON
+        elif YAML in content_type:
+            return YAML
+    if raw_source.lstrip()[:1] in ('{', '[', b'{', b'['):
+        return JSON
+    return YAML
+
+
+def get_yaml_loader(_cache={}):
+    """
+    The libyaml based safe loader when it is available, otherwise the pure
+    python one.  Python 2's `yaml.dump` tags unicode strings, so the string
+    tags are accepted as well.
+    """
+    if 'loader' not in _cache:
+        import yaml
+
+        class Loader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+            pass
 
+        for tag in ('tag:yaml.org,2002:python/unicode', 'tag:yaml.org,2002:python/str'):
+            Loader.add_constructor(tag, Loader.construct_yaml_str)
+        _cache['loader'] = Loader
+    return _cache['loader']
 
-def load_source(source):
+
+def parse_source(raw_source, source_format):
+    """
+    Parse `raw_source` as `source_format`.
+    """
+    if source_format == JSON:
+        try:
+            return json.loads(raw_source)
+        except ValueError:
+            # json is a subset of yaml, which may still be able to parse it.
+            pass
+
+    import yaml
+
+    try:
+        return yaml.load(raw_source, Loader=get_yaml_loader())
+    except yaml.YAMLError as err:
+        raise ValueError(six.text_type(err))
+
+
+def load_source(source, session=None):
     """
     Common entry point for loading some form of raw swagger schema.
 
@@ -33,77 +116,128 @@ def load_source(source):
         - file object (json or yaml).
         - json string.
         - yaml string.
+        - url (fetched with `session` if one is provided).
     """
     if isinstance(source, collections.Mapping):
         return source
 
-    elif hasattr(source, 'read') and callable(source.read):
+    name = None
+    content_type = None
+    if hasattr(source, 'read') and callable(source.read):
         raw_source = source.read()
+        name = getattr(source, 'name', None)
     elif os.path.exists(os.path.expanduser(str(source))):
-        with open(os.path.expanduser(str(source)), 'r') as source_file:
+        name = os.path.expanduser(str(source))
+        with open(name, 'r') as source_file:
             raw_source = source_file.read()
     elif isinstance(source, six.string_types):
         parts = urlparse.urlparse(source)
         if parts.scheme and parts.netloc:
-            response = requests.get(source)
+            if session is None:
+                import requests
+                session = requests
+
+            response = session.get(source)
+            name = parts.path
+            content_type = response.headers.get('Content-Type')
             if isinstance(response.content, six.binary_type):
                 raw_source = six.text_type(response.content, encoding='utf-8')
             else:
                 raw_source = response.content
         else:
             raw_source = source
+    else:
+        raw_source = None
 
-    try:
+    if raw_source is not None:
         try:
-            return json.loads(raw_source)
+            return parse_source(
+                raw_source,
+                get_source_format(raw_source, name=name, content_type=content_type),
+            )
         except ValueError:
             pass
 
-        try:
-            return yaml.load(raw_source)
-        except (yaml.scanner.ScannerError, yaml.parser.ParserError):
-            pass
-    except NameError:
-        pass
-
     raise ValueError(
         "Unable to parse `{0}`.  Tried yaml and json.".format(source),
     )
 
 
-def parse(raw_schema):
-    definitions_serializer = SwaggerDefinitionsSerializer(
-        data=raw_schema,
-    )
-    if not definitions_serializer.is_valid():
+def parse(raw_schema, trusted=False, processes=None):
+    """
+    Validate a raw swagger schema against the swagger spec and return it's
+    python representation.
+
+    If `trusted` is set, only the checks needed to build validators from the
+    schema are performed, such as references to undeclared definitions.
 
+    If `processes` is more than one, the `paths` and `definitions` of large
+    schemas are split into chunks which are validated by a pool of that many
+    processes.  The result, and any errors, are the same as validating them
+    in this process.
+    """
+    context = Context(trusted=trusted)
+    with context.process_pool(processes) as context.pool:
+        swagger_definitions, errors = SwaggerDefinitionsField().from_native(
+            raw_schema, context,
+        )
+    if errors:
         message = "Swagger definitions did not validate:\n\n"
-        message += prettify_errors(definitions_serializer.errors)
+        message += prettify_errors(errors)
         raise ValueError(message)
 
-    swagger_definitions = definitions_serializer.object
-
-    swagger_serializer = SwaggerSerializer(
-        swagger_definitions,
-        data=raw_schema,
-        context=swagger_definitions,
-    )
-
-    if not swagger_serializer.is_valid():
+    context = Context(swagger_definitions, trusted=trusted)
+    with context.process_pool(processes) as context.pool:
+        swagger, errors = SwaggerField().from_native(raw_schema, context)
+    if errors:
         message = "Swagger schema did not validate:\n\n"
-        message += prettify_errors(swagger_serializer.errors)
+        message += prettify_errors(errors)
         raise ValueError(message)
 
-    return swagger_serializer.object
+    swagger_definitions.update(swagger)
+    return swagger_definitions
 
 
-def load(target):
+def load(target, cache_dir=None, trusted=False, documents=None, processes=None,
+         compact=False):
     """
     Given one of the supported target formats, load a swagger schema into it's
     python representation.
+
+    If `cache_dir` is provided the validated schema is stored in that
+    directory, and later loads of the same schema skip validation.
+
+    If `trusted` is set the schema is assumed to be valid, and only the checks
+    needed to build validators from it are performed.  Trusted loads use
+    schemas found in `cache_dir` but never store them, since they were not
+    fully validated.
+
+    `$ref` values that point into other documents are resolved relative to
+    `target`.  Passing a `flex.references.DocumentCache` as `documents` shares
+    the loaded documents between calls.
+
+    `processes` is passed on to `parse`.
+
+    If `compact` is set, the schema returned is the compact version built by
+    `flex.compact.compact_schema`, which leaves out the documentation and
+    uses less memory.
     """
-    raw_schema = load_source(target)
-    return parse(raw_schema)
+    raw_schema = resolve_references(
+        load_source(target), get_base_uri(target), documents=documents,
+    )
+    if cache_dir is None:
+        schema = parse(raw_schema, trusted=trusted, processes=processes)
+    else:
+        key = get_cache_key(raw_schema)
+        schema = get_cached_schema(cache_dir, key)
+        if schema is None:
+            schema = parse(raw_schema, trusted=trusted, processes=processes)
+            if not trusted:
+                set_cached_schema(cache_dir, key, schema)
+
+    if compact:
+        schema = compact_schema(schema)
+    return schema
 
 
 def validate(schema, target=None, **kwargs):
@@ -111,27 +245,63 @@ def validate(schema, target=None, **kwargs):
     Given the python representation of a JSONschema as defined in the swagger
     spec, validate that the schema complies to spec.  If `target` is provided,
     that target will be validated against the provided schema.
+
+    A `context` of swagger definitions may be passed for the schema to
+    reference.
     """
-    schema_serializer = SchemaSerializer(data=schema, **kwargs)
-    if not schema_serializer.is_valid():
+    context = kwargs.get('context') or {}
+    schema, errors = SchemaField().from_native(schema, Context(context))
+    if errors:
         message = "JSON Schema did not validate:\n\n"
-        message += prettify_errors(schema_serializer.errors)
+        message += prettify_errors(errors)
         raise ValueError(message)
 
     if target is not None:
-        validator = schema_serializer.save()
+        validators = construct_schema_validators(schema, context)
+        validator = functools.partial(validate_object, validators=validators)
         validator(target)
 
 
-def validate_api_call(schema, request, response):
+def generate_api_call_validator(schema):
+    """
+    Returns a validator for request/response cycles against `schema`.  The
+    request and response validators are constructed once, so reuse the
+    returned validator when validating many api calls.  `schema` must not be
+    modified after the validator has been generated.
+    """
+    request_validator = generate_request_validator(schema, inner=True)
+    response_validator = generate_operation_response_validator(schema, inner=True)
+    return functools.partial(
+        validate_api_call_with_validators,
+        request_validator=request_validator,
+        response_validator=response_validator,
+    )
+
+
+def validate_api_call_with_validators(request, response, request_validator,
+                                      response_validator):
+    request = normalize_request(request)
+    response = normalize_response(response, request=request)
+
     with ErrorCollection() as errors:
         try:
-            operation_definition = generate_request_validator(schema, inner=True)(request)
+            operation_definition = request_validator(request)
         except ValidationError as err:
             errors['request'].append(err.messages)
             return
 
+        if operation_definition is None:
+            return
+
         try:
-            generate_response_validator(operation_definition, schema, inner=True)(response)
+            response_validator(response, operation_definition=operation_definition)
         except ValidationError as err:
             errors['response'].append(err.messages)
+
+
+def validate_api_call(schema, request, response):
+    """
+    Validate a request/response cycle against the schema.
+    """
+    validator = generate_api_call_validator(schema)
+    validator(request, response)
@@ -1,8 +1,9 @@
 import functools
 
 from flex.utils import (
+    get_known_types,
+    get_types_for_value,
     is_non_string_iterable,
-    is_value_of_any_type,
 )
 from flex.constants import EMPTY
 
@@ -18,11 +19,15 @@ def maybe_iterable(func):
 
 
 def skip_if_not_of_type(*types):
+    types = get_known_types(types)
+
     def outer(func):
         @functools.wraps(func)
         def inner(value, *args, **kwargs):
-            if value is EMPTY or is_value_of_any_type(value, types):
+            if value is EMPTY or not types.isdisjoint(get_types_for_value(value)):
                 return func(value, *args, **kwargs)
+        # lets `validate_object` skip the validator for values of other types.
+        inner.applicable_types = types
         return inner
     return outer
 
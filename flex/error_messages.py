@@ -31,6 +31,18 @@ MINIMUM_AND_MAXIMUM_MESSAGES = {
 }
 
 
+MIN_LENGTH_MESSAGES = {
+    'invalid': "Ensure this value has at least {0} characters (it has {1}).",
+    'invalid_singular': "Ensure this value has at least {0} character (it has {1}).",
+}
+
+
+MAX_LENGTH_MESSAGES = {
+    'invalid': "Ensure this value has at most {0} characters (it has {1}).",
+    'invalid_singular': "Ensure this value has at most {0} character (it has {1}).",
+}
+
+
 MIN_ITEMS_MESSAGES = {
     'invalid': "Array must have at least {0} items.  It had only had {1} items.",
 }
@@ -58,6 +70,8 @@ PATTERN_MESSAGES = {
 
 REQUEST_MESSAGES = {
     'unknown_path': 'Request path did not match any of the known api paths.',
+    'ambiguous_path': 'Request path matched more than one api path: `{0}`.',
+    'unknown_operation': 'Request operation `{0}` is not one of the known operations.',
     'invalid_method': (
         'Request was not one of the allowed request methods.  Got '
         '`{0}`: Expected one of: `{1}`'
@@ -89,6 +103,8 @@ MESSAGES = {
     'multiple_of': MULTIPLE_OF_MESSAGES,
     'minimum': MINIMUM_AND_MAXIMUM_MESSAGES,
     'maximum': MINIMUM_AND_MAXIMUM_MESSAGES,
+    'min_length': MIN_LENGTH_MESSAGES,
+    'max_length': MAX_LENGTH_MESSAGES,
     'min_items': MIN_ITEMS_MESSAGES,
     'max_items': MAX_ITEMS_MESSAGES,
     'unique_items': UNIQUE_ITEMS_MESSAGES,
@@ -1,6 +1,73 @@
-from rest_framework.serializers import NestedValidationError
+import six
 
+try:
+    from django.core.exceptions import ValidationError
+except ImportError:
+    class ValidationError(Exception):
+        """
+        Stand-in for django's `ValidationError` when django is not installed.
+        Messages may be a string, a list of messages or a dictionary of lists
+        of messages keyed by field name.
+        """
+        def __init__(self, message, code=None, params=None):
+            super(ValidationError, self).__init__(message, code, params)
+            if isinstance(message, ValidationError):
+                if hasattr(message, 'error_dict'):
+                    message = message.error_dict
+                else:
+                    message = message.messages
+
+            if isinstance(message, dict):
+                self.error_dict = dict(
+                    (field, ValidationError(messages).messages)
+                    for field, messages in message.items()
+                )
+            elif isinstance(message, list):
+                self.error_list = [
+                    error for item in message for error in ValidationError(item).messages
+                ]
+            else:
+                self.message = message
+                self.code = code
+                self.params = params
+                if params:
+                    message %= params
+                self.error_list = [six.text_type(message)]
+
+        @property
+        def message_dict(self):
+            return self.error_dict
+
+        @property
+        def messages(self):
+            if hasattr(self, 'error_dict'):
+                return sum(self.error_dict.values(), [])
+            return list(self.error_list)
+
+        def __iter__(self):
+            return iter(self.messages)
+
+        def __str__(self):
+            if hasattr(self, 'error_dict'):
+                return repr(self.error_dict)
+            return repr(self.messages)
+
+
+class SafeNestedValidationError(ValidationError):
+    """
+    A `ValidationError` whose messages are the nested dictionaries and lists
+    of errors produced by validating nested objects.  A dictionary of errors
+    is wrapped in a list, while a list is used as is.
+    """
+    def __init__(self, message):
+        if isinstance(message, dict):
+            self._messages = [message]
+        else:
+            self._messages = message
+
+    @property
+    def messages(self):
+        return self._messages
 
-class SafeNestedValidationError(NestedValidationError):
     def __repr__(self):
         return 'ValidationError({0})'.format(self.messages)
@@ -3,18 +3,11 @@ import functools
 
 import six
 
-import iso8601
-import rfc3987
-
-if six.PY2:
-    import validate_email
-else:
-    # TODO: when a new version is released, this can be removed.
-    from flex.compat import validate_email
-
-from django.core.exceptions import ValidationError
-
-from flex.utils import is_value_of_any_type
+from flex.exceptions import ValidationError
+from flex.utils import (
+    get_known_types,
+    get_types_for_value,
+)
 from flex.constants import (
     STRING,
     INTEGER,
@@ -31,6 +24,7 @@ from flex.error_messages import MESSAGES
 class FormatRegistry(object):
     def __init__(self):
         self.formats = {}
+        self.types = {}
 
     def register(self, format_name, *types):
         if format_name in self.formats:
@@ -38,6 +32,8 @@ class FormatRegistry(object):
                 "The format `{0}` is already registered".format(format_name),
             )
 
+        known_types = get_known_types(types)
+
         def outer(func):
             @functools.wraps(func)
             def inner(value, *args, **kwargs):
@@ -47,10 +43,12 @@ class FormatRegistry(object):
 
                 http://json-schema.org/latest/json-schema-validation.html#anchor105
                 """
-                if is_value_of_any_type(value, types):
+                if not known_types.isdisjoint(get_types_for_value(value)):
                     return func(value, *args, **kwargs)
 
+            inner.applicable_types = known_types
             self.formats[format_name] = inner
+            self.types[format_name] = types
             return inner
         return outer
 
@@ -75,6 +73,8 @@ register = registry.register
 
 @register(URI, STRING)
 def uri_validator(value):
+    import rfc3987
+
     parts = rfc3987.parse(value, rule='URI')
     if not parts['scheme'] or not parts['authority']:
         raise ValidationError(MESSAGES['format']['invalid_uri'].format(value))
@@ -107,12 +107,20 @@ def int64_validator(value):
 
 @register(EMAIL, STRING)
 def email_validator(value):
+    if six.PY2:
+        import validate_email
+    else:
+        # TODO: when a new version is released, this can be removed.
+        from flex.compat import validate_email
+
     if not validate_email.validate_email(value):
         raise ValidationError(MESSAGES['format']['invalid_email'].format(value))
 
 
 @register(DATETIME, STRING)
 def date_time_format_validator(value):
+    import iso8601
+
     try:
         iso8601.parse_date(value)
     except iso8601.ParseError:
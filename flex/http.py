@@ -1,8 +1,5 @@
 import six
 
-import http
-import urllib
-
 from six.moves import urllib_parse as urlparse
 import json
 
@@ -31,8 +28,12 @@ class Request(URLMixin):
     """
     Generic request object.  All supported requests are normalized to an
     instance of Request.
+
+    `path_parameters` holds the raw values of the path parameters once the
+    request path has been matched to an api path.
     """
     method = None
+    path_parameters = None
 
     def __init__(self, url, method, content_type=None, body=None, request=None, headers=None):
         self._request = request
@@ -87,6 +88,7 @@ def _normalize_python2_urllib_request(request):
 
 def _normalize_python3_urllib_request(request):
     if six.PY3:
+        import urllib.request
         if not isinstance(request, urllib.request.Request):
             raise TypeError("Cannot normalize this request object")
     else:
@@ -181,9 +183,11 @@ def _normalize_requests_response(response, request=None):
 
 def _normalize_urllib_response(response, request=None):
     if six.PY2:
+        import urllib
         if not isinstance(response, urllib.addinfourl):
             raise TypeError("Cannot normalize this response object")
     else:
+        import http.client
         if not isinstance(response, http.client.HTTPResponse):
             raise TypeError("Cannot normalize this response object")
 
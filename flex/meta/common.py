@@ -0,0 +1,313 @@
+"""
+Objects shared by both passes over a swagger schema.
+"""
+import collections
+
+import six
+
+from flex.utils import (
+    is_value_of_any_type,
+    is_value_of_type,
+)
+from flex.exceptions import ValidationError
+from flex.meta.fields import (
+    Field,
+    CharField,
+    MaybeListCharField,
+    IntegerField,
+    FloatField,
+    BooleanField,
+    ObjectField,
+)
+from flex.meta.validators import (
+    type_validator,
+    format_validator,
+    parameter_in_validator,
+    collection_format_validator,
+    regex_validator,
+    is_array_validator,
+    header_type_validator,
+    min_value_validator,
+)
+from flex.constants import (
+    BODY,
+    PATH,
+    CSV,
+    QUERY,
+    FORM_DATA,
+    MULTI,
+    ARRAY,
+    INTEGER,
+    NUMBER,
+    STRING,
+    OBJECT,
+)
+
+
+class BaseResponseField(ObjectField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#responseObject
+    """
+    description = CharField(required=True)
+
+
+class CommonJSONSchemaField(ObjectField):
+    error_messages = dict(
+        ObjectField.error_messages,
+        invalid_type_for_minimum='`minimum` can only be used for json number types',
+        invalid_type_for_maximum='`maximum` can only be used for json number types',
+        invalid_type_for_multiple_of='`multipleOf` can only be used for json number types',
+        invalid_type_for_min_length='`minLength` can only be used for string types',
+        invalid_type_for_max_length='`maxLength` can only be used for string types',
+        invalid_type_for_min_items='`minItems` can only be used for array types',
+        invalid_type_for_max_items='`maxItems` can only be used for array types',
+        invalid_type_for_unique_items='`uniqueItems` can only be used for array types',
+        exclusive_minimum_requires_minimum='`exclusiveMinimum` requires `minimum` to be set',
+        exclusive_maximum_requires_maximum='`exclusiveMaximum` requires `maximum` to be set',
+        enum_must_be_of_array_type='enum value must be an array',
+    )
+
+    multipleOf = FloatField(validators=[min_value_validator(0)])
+
+    maximum = FloatField()
+    exclusiveMaximum = BooleanField()
+
+    minimum = FloatField()
+    exclusiveMinimum = BooleanField()
+
+    maxLength = IntegerField(validators=[min_value_validator(0)])
+    minLength = IntegerField(validators=[min_value_validator(0)])
+
+    pattern = CharField(validators=[regex_validator])
+
+    maxItems = IntegerField()
+    minItems = IntegerField()
+    uniqueItems = BooleanField()
+
+    enum = Field(validators=[is_array_validator])
+
+    def check_type_for_attr(self, attrs, field_name, types, errors, error_key):
+        """
+        Shortcut for common pattern of having a keyword that depends on the
+        type of the object.  If the types provided do not have any intersection
+        with the required types, then an error is created.
+        """
+        if field_name in attrs and 'type' in attrs:
+            declared_types = attrs['type']
+            if isinstance(declared_types, six.string_types):
+                declared_types = [declared_types]
+
+            if isinstance(types, six.string_types):
+                types = [types]
+
+            if not set(types).intersection(declared_types):
+                errors[field_name].append(
+                    self.error_messages[error_key],
+                )
+
+    def validate(self, attrs, context):
+        errors = collections.defaultdict(list)
+
+        self.check_type_for_attr(
+            attrs, 'minimum', (INTEGER, NUMBER), errors, 'invalid_type_for_minimum',
+        )
+        if 'exclusiveMinimum' in attrs and 'minimum' not in attrs:
+            errors['exclusiveMinimum'].append(
+                self.error_messages['exclusive_minimum_requires_minimum'],
+            )
+
+        self.check_type_for_attr(
+            attrs, 'maximum', (INTEGER, NUMBER), errors, 'invalid_type_for_maximum',
+        )
+        if 'exclusiveMaximum' in attrs and 'maximum' not in attrs:
+            errors['exclusiveMaximum'].append(
+                self.error_messages['exclusive_maximum_requires_maximum'],
+            )
+
+        self.check_type_for_attr(
+            attrs, 'multipleOf', (INTEGER, NUMBER), errors, 'invalid_type_for_multiple_of',
+        )
+        self.check_type_for_attr(
+            attrs, 'minLength', STRING, errors, 'invalid_type_for_min_length',
+        )
+        self.check_type_for_attr(
+            attrs, 'maxLength', STRING, errors, 'invalid_type_for_max_length',
+        )
+        self.check_type_for_attr(
+            attrs, 'minItems', ARRAY, errors, 'invalid_type_for_min_items',
+        )
+        self.check_type_for_attr(
+            attrs, 'maxItems', ARRAY, errors, 'invalid_type_for_max_items',
+        )
+        self.check_type_for_attr(
+            attrs, 'uniqueItems', ARRAY, errors, 'invalid_type_for_unique_items',
+        )
+
+        # enum null value special case.
+        if 'enum' in attrs and attrs['enum'] is None:
+            errors['enum'].append(
+                self.error_messages['enum_must_be_of_array_type'],
+            )
+
+        if errors:
+            return errors
+        return super(CommonJSONSchemaField, self).validate(attrs, context)
+
+
+class TypedDefaultMixin(object):
+    error_messages = {
+        'default_is_incorrect_type': (
+            "The value supplied for 'default' must match the specified type."
+        ),
+    }
+
+    def validate_default_type(self, attrs, errors):
+        if 'default' in attrs and 'type' in attrs:
+            if not is_value_of_type(attrs['default'], attrs['type']):
+                errors['default'].append(self.error_messages['default_is_incorrect_type'])
+
+
+class BaseSchemaField(CommonJSONSchemaField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#schemaObject
+    """
+    error_messages = dict(
+        CommonJSONSchemaField.error_messages,
+        invalid_type_for_min_properties='minProperties can only be used for `object` types',
+        invalid_type_for_max_properties='maxProperties can only be used for `object` types',
+    )
+
+    format = CharField(validators=[format_validator])
+    title = CharField()
+    default = Field()
+
+    minProperties = IntegerField(validators=[min_value_validator(0)])
+    maxProperties = IntegerField(validators=[min_value_validator(0)])
+
+    required = BooleanField()
+    type = MaybeListCharField(validators=[type_validator])
+
+    readOnly = BooleanField()
+    externalDocs = CharField()
+
+    def validate(self, attrs, context):
+        errors = collections.defaultdict(list)
+
+        self.check_type_for_attr(
+            attrs, 'minProperties', OBJECT, errors, 'invalid_type_for_min_properties',
+        )
+        self.check_type_for_attr(
+            attrs, 'maxProperties', OBJECT, errors, 'invalid_type_for_max_properties',
+        )
+
+        if errors:
+            return errors
+        return super(BaseSchemaField, self).validate(attrs, context)
+
+
+BaseSchemaField.fields['$ref'] = CharField()
+
+
+class BaseItemsField(BaseSchemaField):
+    """
+    A single items object, or a list of them.
+    """
+    error_messages = dict(
+        BaseSchemaField.error_messages,
+        invalid_type_for_items='`items` must be a referenc, a schema, or an array of schemas.',
+    )
+
+    def is_many(self, data):
+        if isinstance(data, (collections.Mapping, six.string_types)):
+            return False
+        return self.many
+
+    def from_native(self, data, context):
+        if not is_value_of_any_type(data, (ARRAY, OBJECT, STRING)):
+            raise ValidationError(self.error_messages['invalid_type_for_items'])
+        return super(BaseItemsField, self).from_native(data, context)
+
+
+class BaseParameterField(TypedDefaultMixin, CommonJSONSchemaField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#parameterObject
+    """
+    error_messages = dict(
+        CommonJSONSchemaField.error_messages,
+        path_parameters_are_required=(
+            "A Parameter who's `in` value is 'path' must be declared as required."
+        ),
+        schema_required="A Parameter who's `in` value is 'body' must declare a schema.",
+        type_required="A Parameter who's `in` value is not 'body' must declare a type.",
+        collection_format_must_be_multi=(
+            "The collectionFormat 'multi' is only valid for `in` values of "
+            "\"query\" or \"formData\"."
+        ),
+        items_required="For type \"array\", the items parameter is required.",
+    )
+    error_messages.update(TypedDefaultMixin.error_messages)
+
+    name = CharField(required=True)
+    description = CharField()
+    required = BooleanField()
+
+    type = MaybeListCharField(validators=[type_validator])
+    format = CharField(validators=[format_validator])
+    collectionFormat = CharField(validators=[collection_format_validator], default=CSV)
+    default = Field()
+
+    def validate(self, attrs, context):
+        errors = collections.defaultdict(list)
+
+        if attrs['in'] == PATH and not attrs.get('required'):
+            errors['required'].append(self.error_messages['path_parameters_are_required'])
+        if attrs['in'] == BODY and not attrs.get('schema'):
+            errors['schema'].append(self.error_messages['schema_required'])
+        if attrs['in'] != BODY:
+            if 'type' not in attrs:
+                errors['type'].append(self.error_messages['type_required'])
+            if attrs.get('collectionFormat') == MULTI:
+                if attrs['in'] not in (QUERY, FORM_DATA):
+                    errors['collectionFormat'].append(
+                        self.error_messages['collection_format_must_be_multi'],
+                    )
+            self.validate_default_type(attrs, errors)
+
+        if attrs.get('type') == ARRAY and not attrs.get('items'):
+            errors['items'].append(self.error_messages['items_required'])
+
+        if errors:
+            return errors
+        return super(BaseParameterField, self).validate(attrs, context)
+
+
+# `in` is a reserved word so it cannot be declared on the class.
+BaseParameterField.fields['in'] = CharField(required=True, validators=[parameter_in_validator])
+
+
+class BaseHeaderField(TypedDefaultMixin, CommonJSONSchemaField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#header-object-
+    """
+    error_messages = dict(
+        CommonJSONSchemaField.error_messages,
+        items_required="When type is \"array\" the \"items\" is required",
+    )
+    error_messages.update(TypedDefaultMixin.error_messages)
+
+    description = CharField()
+    type = CharField(required=True, validators=[header_type_validator])
+    format = CharField(validators=[format_validator])
+    collectionFormat = CharField(validators=[collection_format_validator], default=CSV)
+    default = Field()
+
+    def validate(self, attrs, context):
+        errors = collections.defaultdict(list)
+
+        if attrs.get('type') == ARRAY and 'items' not in attrs:
+            errors['items'].append(self.error_messages['items_required'])
+        self.validate_default_type(attrs, errors)
+
+        if errors:
+            return errors
+        return super(BaseHeaderField, self).validate(attrs, context)
@@ -0,0 +1,220 @@
+"""
+The second pass over a swagger schema, which validates the rest of the schema
+against the definitions gathered by the first pass.
+"""
+from __future__ import unicode_literals
+
+import six
+
+from flex.exceptions import ValidationError
+from flex.meta.fields import (
+    CharField,
+    ChoiceField,
+    BooleanField,
+    ListField,
+    ObjectField,
+    HomogenousDictField,
+)
+from flex.meta.common import (
+    BaseResponseField,
+    BaseParameterField,
+    BaseSchemaField,
+    BaseItemsField,
+    BaseHeaderField,
+)
+from flex.meta.validators import (
+    host_validator,
+    path_validator,
+    scheme_validator,
+    mimetype_validator,
+    string_type_validator,
+)
+from flex.paths import (
+    get_missing_path_parameter_errors,
+)
+
+
+class InfoField(ObjectField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#infoObject
+    """
+    title = CharField(required=True)
+    description = CharField()
+    termsOfService = CharField()
+    contact = CharField()
+    license = CharField()
+    version = CharField()
+
+
+class ItemsField(BaseItemsField):
+    error_messages = dict(
+        BaseItemsField.error_messages,
+        unknown_reference='Unknown definition reference `{0}`',
+    )
+
+    def from_native(self, data, context):
+        if isinstance(data, six.string_types):
+            if data not in context.get_definitions('definitions'):
+                raise ValidationError(
+                    self.error_messages['unknown_reference'].format(data),
+                )
+            return data, {}
+        return super(ItemsField, self).from_native(data, context)
+
+
+class HeaderField(BaseHeaderField):
+    items = ItemsField(required=False, many=True)
+
+
+class SchemaField(BaseSchemaField):
+    error_messages = dict(
+        BaseSchemaField.error_messages,
+        unknown_reference='Unknown definition reference `{0}`',
+    )
+
+    def validate_references(self, attrs, context):
+        if '$ref' in attrs and attrs['$ref'] not in context.get_definitions('definitions'):
+            return {
+                '$ref': [self.error_messages['unknown_reference'].format(attrs['$ref'])],
+            }
+        return super(SchemaField, self).validate_references(attrs, context)
+
+
+class ResponseField(BaseResponseField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#responseObject
+    """
+    schema = SchemaField(required=False)
+    headers = HomogenousDictField(HeaderField(), required=False)
+
+
+class SecurityRequirementReferenceField(CharField):
+    """
+    Field that references a defined security scheme declared in the Security
+    Definitions.
+    """
+    error_messages = dict(
+        CharField.error_messages,
+        unknown_reference="Unknown Security Scheme reference `{0}`",
+    )
+
+    def validate(self, value, context):
+        if value not in context.get_definitions('securityDefinitions'):
+            raise ValidationError(
+                self.error_messages['unknown_reference'].format(value),
+            )
+
+
+class ParameterField(BaseParameterField):
+    """
+    A list of parameters, each of which is either a parameter object or a
+    reference to one of the parameter definitions.
+    """
+    error_messages = dict(
+        BaseParameterField.error_messages,
+        unknown_reference="Unknown reference `{0}`",
+    )
+
+    schema = SchemaField(required=False)
+    items = ItemsField(required=False, many=True)
+
+    def is_many(self, data):
+        return True
+
+    def from_native(self, data, context):
+        if isinstance(data, six.string_types):
+            if data not in context.get_definitions('parameters'):
+                return None, {
+                    'non_field_errors': [
+                        self.error_messages['unknown_reference'].format(data),
+                    ],
+                }
+            return data, {}
+        return super(ParameterField, self).from_native(data, context)
+
+
+class OperationField(ObjectField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#operationObject
+    """
+    tags = ListField(validators=[string_type_validator])
+    summary = CharField()
+    description = CharField()
+    externalDocs = CharField()
+    operationId = CharField()
+    consumes = ListField(validators=[mimetype_validator])
+    produces = ListField(validators=[mimetype_validator])
+    parameters = ParameterField(required=False)
+    responses = HomogenousDictField(ResponseField())
+    schemes = ListField(validators=[scheme_validator])
+    deprecated = BooleanField()
+    security = HomogenousDictField(
+        SecurityRequirementReferenceField(required=True), required=False,
+    )
+
+
+class PathItemField(ObjectField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#pathsObject
+    """
+    get = OperationField(required=False)
+    put = OperationField(required=False)
+    post = OperationField(required=False)
+    delete = OperationField(required=False)
+    options = OperationField(required=False)
+    head = OperationField(required=False)
+    patch = OperationField(required=False)
+    parameters = ParameterField(required=False)
+
+
+class TagField(ObjectField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#tagObject
+    """
+    name = CharField(required=True)
+    description = CharField()
+    externalDocs = CharField()
+
+
+# These fields include recursive use of the `SchemaField` so they have to be
+# attached after the `SchemaField` class has been created.
+SchemaField.fields['properties'] = HomogenousDictField(SchemaField(), required=False)
+SchemaField.fields['items'] = ItemsField(required=False, many=True)
+SchemaField.fields['allOf'] = SchemaField(required=False, many=True)
+
+
+class PathsField(HomogenousDictField):
+    def __init__(self, **kwargs):
+        super(PathsField, self).__init__(
+            PathItemField(), allow_empty=True, chunked=True, **kwargs
+        )
+
+    def validate(self, attrs, context):
+        errors = get_missing_path_parameter_errors(
+            attrs, context.get_definitions('parameters'),
+        )
+        if errors:
+            return {'non_field_errors': [errors]}
+        return super(PathsField, self).validate(attrs, context)
+
+
+class SwaggerField(ObjectField):
+    """
+    The swagger schema as a whole.
+    """
+    swagger = ChoiceField(choices=['2.0'], required=True)
+    info = InfoField()
+    host = CharField(validators=[host_validator])
+    basePath = CharField(validators=[path_validator])
+    schemes = ListField(validators=[scheme_validator])
+    consumes = ListField(validators=[mimetype_validator])
+    produces = ListField(validators=[mimetype_validator])
+
+    paths = PathsField()
+
+    security = HomogenousDictField(
+        SecurityRequirementReferenceField(required=True), required=False,
+    )
+
+    tags = TagField(required=False, many=True)
+    externalDocs = CharField()
@@ -0,0 +1,182 @@
+"""
+The first pass over a swagger schema, which gathers the definitions that are
+referenced from the rest of the schema.
+"""
+import collections
+
+import six
+
+from flex.meta.fields import (
+    CharField,
+    ObjectField,
+    HomogenousDictField,
+)
+from flex.meta.common import (
+    BaseResponseField,
+    BaseSchemaField,
+    BaseParameterField,
+    BaseItemsField,
+    BaseHeaderField,
+)
+from flex.meta.validators import (
+    security_type_validator,
+    security_api_key_location_validator,
+    security_flow_validator,
+)
+from flex.constants import (
+    API_KEY,
+    OAUTH_2,
+    IMPLICIT,
+    PASSWORD,
+    APPLICATION,
+    ACCESS_CODE,
+)
+
+
+def get_reference_index(swagger_definitions):
+    """
+    Maps the name of each of the `definitions`, `parameters`, `responses` and
+    `securityDefinitions` to the sections that declare it, so that references
+    can be checked with a single lookup.
+    """
+    reference_index = collections.defaultdict(list)
+    for section, definitions in swagger_definitions.items():
+        for name in definitions or ():
+            reference_index[name].append(section)
+    return reference_index
+
+
+class SchemaField(BaseSchemaField):
+    def from_native(self, data, context):
+        if isinstance(data, six.string_types):
+            context.deferred_references.add(data)
+            return data, {}
+        elif isinstance(data, dict) and '$ref' in data:
+            context.deferred_references.add(data['$ref'])
+        return super(SchemaField, self).from_native(data, context)
+
+
+class DefinitionsField(HomogenousDictField):
+    error_messages = dict(
+        HomogenousDictField.error_messages,
+        unknown_references="Unknown references `{0}`",
+    )
+
+    def validate_references(self, attrs, context):
+        missing_references = context.deferred_references.difference(attrs.keys())
+        if missing_references:
+            return {
+                'non_field_errors': [
+                    self.error_messages['unknown_references'].format(
+                        list(missing_references),
+                    ),
+                ],
+            }
+        return super(DefinitionsField, self).validate_references(attrs, context)
+
+
+class ItemsField(BaseItemsField):
+    def from_native(self, data, context):
+        if isinstance(data, six.string_types):
+            context.deferred_references.add(data)
+            return [data], {}
+        return super(ItemsField, self).from_native(data, context)
+
+
+# These fields include recursive use of the `SchemaField` so they have to be
+# attached after the `SchemaField` class has been created.
+SchemaField.fields['properties'] = HomogenousDictField(SchemaField(), required=False)
+SchemaField.fields['items'] = ItemsField(required=False, many=True)
+SchemaField.fields['allOf'] = SchemaField(required=False, many=True)
+
+
+class HeaderField(BaseHeaderField):
+    items = ItemsField(required=False, many=True)
+    schema = SchemaField(required=False)
+
+
+class ParameterField(BaseParameterField):
+    schema = SchemaField(required=False)
+    items = ItemsField(required=False, many=True)
+
+
+class SecuritySchemeField(ObjectField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#securityDefinitionsObject
+    """
+    error_messages = dict(
+        ObjectField.error_messages,
+        name_required='When type is "apiKey", "name" is required.',
+        in_required='When type is "apiKey", "in" is required.',
+        flow_required='When type is "oath2" flow is required.',
+        authorization_url_required=(
+            'When type is "oath2" and flow is one of ("implicit", '
+            '"accessCode"), "authorizationUrl" is required.'
+        ),
+        token_url_required=(
+            'When type is "oath2" and flow is one of ("password", '
+            '"application", "accessCode"), "authorizationUrl" is required.'
+        ),
+    )
+
+    type = CharField(required=True, validators=[security_type_validator])
+    description = CharField()
+    name = CharField()
+    flow = CharField(validators=[security_flow_validator])
+    authorizationUrl = CharField()
+    tokenUrl = CharField()
+
+    scopes = HomogenousDictField(CharField(required=True), required=False)
+
+    def validate(self, attrs, context):
+        errors = collections.defaultdict(list)
+
+        if attrs['type'] == API_KEY:
+            if 'name' not in attrs:
+                errors['name'].append(self.error_messages['name_required'])
+            if 'in' not in attrs:
+                errors['in'].append(self.error_messages['in_required'])
+        elif attrs['type'] == OAUTH_2:
+            if 'flow' not in attrs:
+                errors['flow'].append(self.error_messages['flow_required'])
+            if attrs.get('flow') in (IMPLICIT, ACCESS_CODE):
+                if 'authorizationUrl' not in attrs:
+                    errors['authorizationUrl'].append(
+                        self.error_messages['authorization_url_required'],
+                    )
+            if attrs.get('flow') in (PASSWORD, APPLICATION, ACCESS_CODE):
+                if 'tokenUrl' not in attrs:
+                    errors['tokenUrl'].append(self.error_messages['token_url_required'])
+
+        if errors:
+            return errors
+        return super(SecuritySchemeField, self).validate(attrs, context)
+
+
+SecuritySchemeField.fields['in'] = CharField(validators=[security_api_key_location_validator])
+
+
+class ResponseField(BaseResponseField):
+    """
+    https://github.com/wordnik/swagger-spec/blob/master/versions/2.0.md#responseObject
+    """
+    schema = SchemaField(required=False)
+    headers = HomogenousDictField(HeaderField(), required=False)
+
+
+class SwaggerDefinitionsField(ObjectField):
+    """
+    Step 1 in the schema validation process is to gather all of the
+    definitions.
+    """
+    definitions = DefinitionsField(SchemaField(), required=False, chunked=True)
+    parameters = HomogenousDictField(ParameterField(), required=False)
+    securityDefinitions = HomogenousDictField(SecuritySchemeField(), required=False)
+    responses = HomogenousDictField(ResponseField(), required=False)
+
+    def validate_references(self, attrs, context):
+        reference_index = get_reference_index(attrs)
+        missing_references = context.deferred_references.difference(reference_index)
+        if missing_references:
+            return {'missing_references': list(missing_references)}
+        return super(SwaggerDefinitionsField, self).validate_references(attrs, context)
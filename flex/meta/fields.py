@@ -0,0 +1,399 @@
+"""
+Fields used to describe the objects of the swagger spec.
+
+These reproduce the behavior of the django rest framework fields and
+serializers that schemas used to be validated with, using plain python data
+structures.  Values are converted and validated in the same way, and errors
+are reported in the same nested structure of dictionaries and lists.
+"""
+from __future__ import unicode_literals
+
+import collections
+
+import six
+
+from flex.context_managers import ProcessPool
+from flex.exceptions import (
+    SafeNestedValidationError,
+    ValidationError,
+)
+from flex.utils import is_non_string_iterable
+
+
+EMPTY_VALUES = (None, '', [], (), {})
+
+
+class Context(object):
+    """
+    State shared by the fields while a schema is validated.
+
+    `definitions` holds the objects gathered from the first pass over the
+    schema, which references in the second pass are resolved against.  When
+    `trusted` is set the schema is assumed to be valid, so only conversion,
+    required fields and references are checked.
+
+    With a `multiprocessing` `pool`, the values of fields declared with
+    `chunked` are split into chunks of `chunk_size` which are converted in
+    the pool.  The pool must be started by `process_pool`, which sends the
+    definitions to each worker once rather than with every chunk.
+    """
+    def __init__(self, definitions=None, trusted=False, pool=None, chunk_size=100):
+        self.definitions = definitions or {}
+        self.trusted = trusted
+        self.pool = pool
+        self.chunk_size = chunk_size
+        self.deferred_references = set()
+
+    def get_definitions(self, kind):
+        return self.definitions.get(kind) or {}
+
+    def process_pool(self, processes):
+        """
+        A `ProcessPool` of `processes` workers that convert chunks for this
+        context.
+        """
+        return ProcessPool(
+            processes,
+            initializer=init_chunk_worker,
+            initargs=(self.definitions, self.trusted),
+        )
+
+
+class Field(object):
+    """
+    A single value.  Missing values are filled in from `default`, then the
+    value is converted by `from_native`, checked by `validate` and by each of
+    the `validators`.  Validators are skipped for empty values.
+    """
+    error_messages = {
+        'required': 'This field is required.',
+        'invalid': 'Invalid value.',
+    }
+    creation_counter = 0
+
+    def __init__(self, required=False, default=None, validators=()):
+        self.required = required
+        self.default = default
+        self.validators = validators
+        self.creation_counter = Field.creation_counter
+        Field.creation_counter += 1
+
+    def from_native(self, value, context):
+        return value
+
+    def validate(self, value, context):
+        if self.required and value in EMPTY_VALUES:
+            raise ValidationError(self.error_messages['required'])
+
+    def run_validators(self, value):
+        if value in EMPTY_VALUES:
+            return
+        errors = []
+        for validator in self.validators:
+            try:
+                validator(value)
+            except ValidationError as err:
+                errors.extend(err.messages)
+        if errors:
+            raise ValidationError(errors)
+
+    def field_from_native(self, data, field_name, into, context):
+        try:
+            value = data[field_name]
+        except KeyError:
+            if self.default is None:
+                if self.required:
+                    raise ValidationError(self.error_messages['required'])
+                return
+            value = self.default
+
+        value = self.from_native(value, context)
+        if not context.trusted:
+            self.validate(value, context)
+            self.run_validators(value)
+        into[field_name] = value
+
+
+class CharField(Field):
+    def from_native(self, value, context):
+        if isinstance(value, six.string_types):
+            return value
+        elif value is None:
+            return ''
+        return six.text_type(value)
+
+
+class MaybeListCharField(CharField):
+    def from_native(self, value, context):
+        if is_non_string_iterable(value):
+            return value
+        return super(MaybeListCharField, self).from_native(value, context)
+
+
+class ChoiceField(Field):
+    error_messages = dict(
+        Field.error_messages,
+        invalid_choice='Select a valid choice. %(value)s is not one of the available choices.',
+    )
+
+    def __init__(self, choices, **kwargs):
+        self.choices = choices
+        super(ChoiceField, self).__init__(**kwargs)
+
+    def from_native(self, value, context):
+        if value in EMPTY_VALUES:
+            return ''
+        return value
+
+    def validate(self, value, context):
+        super(ChoiceField, self).validate(value, context)
+        if value and not any(value == six.text_type(choice) or value == choice
+                             for choice in self.choices):
+            raise ValidationError(
+                self.error_messages['invalid_choice'] % {'value': value},
+            )
+
+
+class IntegerField(Field):
+    error_messages = dict(Field.error_messages, invalid='Enter a whole number.')
+
+    def from_native(self, value, context):
+        if value in EMPTY_VALUES:
+            return None
+        try:
+            return int(str(value))
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages['invalid'])
+
+
+class FloatField(Field):
+    error_messages = dict(Field.error_messages, invalid="'%s' value must be a float.")
+
+    def from_native(self, value, context):
+        if value in EMPTY_VALUES:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages['invalid'] % (value,))
+
+
+class BooleanField(Field):
+    def from_native(self, value, context):
+        if isinstance(value, six.string_types):
+            if value in ('true', 't', 'True', '1'):
+                return True
+            elif value in ('false', 'f', 'False', '0'):
+                return False
+        return bool(value)
+
+
+class ListField(Field):
+    error_messages = dict(Field.error_messages, invalid_type='%(value)s is not a list')
+
+    def from_native(self, value, context):
+        if value is not None and not isinstance(value, list):
+            raise ValidationError(
+                self.error_messages['invalid_type'] % {'value': value},
+            )
+        return value
+
+
+def fields_from_native(fields, data, context):
+    """
+    Converts the keys of `data` described by `fields`, a list of
+    `(field_name, field)` pairs, returning the converted values along with a
+    dictionary of errors.
+    """
+    attrs = {}
+    errors = {}
+    for field_name, field in fields:
+        try:
+            field.field_from_native(data, field_name, attrs, context)
+        except ValidationError as err:
+            errors[field_name] = list(err.messages)
+    return attrs, errors
+
+
+# The definitions and `trusted` flag of the context that a worker process
+# converts chunks for, set by `init_chunk_worker` when the worker starts.
+WORKER_CONTEXT = {}
+
+
+def init_chunk_worker(definitions, trusted):
+    WORKER_CONTEXT['definitions'] = definitions
+    WORKER_CONTEXT['trusted'] = trusted
+
+
+def chunk_from_native(chunk):
+    """
+    Converts one chunk of a `chunked` field in a worker process, returning
+    the references it deferred along with the converted values and errors.
+    """
+    value_field, items = chunk
+    context = Context(WORKER_CONTEXT['definitions'], trusted=WORKER_CONTEXT['trusted'])
+    attrs, errors = fields_from_native(
+        [(key, value_field) for key, _ in items], dict(items), context,
+    )
+    return attrs, errors, context.deferred_references
+
+
+class ObjectMeta(type):
+    """
+    Collects the fields declared on an `ObjectField` class, along with those
+    of its bases, into an ordered `fields` dictionary.
+    """
+    def __new__(mcs, name, bases, attrs):
+        declared = sorted(
+            ((field_name, attrs.pop(field_name)) for field_name, value in list(attrs.items())
+             if isinstance(value, Field)),
+            key=lambda item: item[1].creation_counter,
+        )
+        fields = collections.OrderedDict()
+        for base in bases:
+            fields.update(getattr(base, 'fields', {}))
+        fields.update(declared)
+        attrs['fields'] = fields
+        return super(ObjectMeta, mcs).__new__(mcs, name, bases, attrs)
+
+
+@six.add_metaclass(ObjectMeta)
+class ObjectField(Field):
+    """
+    A nested object whose keys are described by the declared fields.  Keys
+    which are not declared are dropped.  With `many` the value is a list of
+    such objects.
+
+    Once all of the fields are valid the object as a whole is checked by
+    `validate_references` and `validate`, which return a dictionary of errors.
+    `validate` is skipped for trusted schemas.
+    """
+    def __init__(self, required=True, many=False):
+        self.many = many
+        self.field_items = None
+        super(ObjectField, self).__init__(required=required)
+
+    def get_fields(self, data):
+        """
+        The fields for the keys present in `data`, along with those that have
+        to be filled in or reported as required when their key is missing, in
+        the order they were declared.
+        """
+        if self.field_items is None:
+            # Computed on first use since some fields are attached after the
+            # class is created.
+            self.field_items = [
+                (field_name, field, field.required or field.default is not None)
+                for field_name, field in self.fields.items()
+            ]
+        return [
+            (field_name, field) for field_name, field, defaulted in self.field_items
+            if defaulted or field_name in data
+        ]
+
+    def convert_fields(self, data, context):
+        return fields_from_native(self.get_fields(data), data, context)
+
+    def validate_references(self, attrs, context):
+        return {}
+
+    def validate(self, attrs, context):
+        return {}
+
+    def from_native(self, data, context):
+        """
+        Returns the object along with a dictionary of errors.
+        """
+        if data is None:
+            return None, {'non_field_errors': ['No input provided']}
+        elif not isinstance(data, dict):
+            return None, {'non_field_errors': ['Invalid data']}
+
+        attrs, errors = self.convert_fields(data, context)
+        if not errors:
+            errors = dict(self.validate_references(attrs, context))
+        if not errors and not context.trusted:
+            errors = dict(self.validate(attrs, context))
+        return attrs, errors
+
+    def is_many(self, data):
+        return self.many
+
+    def deserialize(self, data, context):
+        """
+        Returns the python representation of `data`, raising a
+        `SafeNestedValidationError` with the nested errors if it is invalid.
+        """
+        if not self.is_many(data):
+            obj, errors = self.from_native(data, context)
+            if errors:
+                raise SafeNestedValidationError(errors)
+            return obj
+
+        if not hasattr(data, '__iter__') or isinstance(data, (dict, six.text_type)):
+            raise SafeNestedValidationError({
+                'non_field_errors': ['Expected a list of items.'],
+            })
+        objects = []
+        errors = []
+        for item in data:
+            obj, item_errors = self.from_native(item, context)
+            objects.append(obj)
+            errors.append(item_errors)
+        if any(errors):
+            raise SafeNestedValidationError(errors)
+        return objects
+
+    def field_from_native(self, data, field_name, into, context):
+        try:
+            value = data[field_name]
+        except KeyError:
+            if self.required:
+                raise ValidationError(self.error_messages['required'])
+            return
+
+        if value in (None, ''):
+            into[field_name] = None
+        else:
+            into[field_name] = self.deserialize(value, context)
+
+
+class HomogenousDictField(ObjectField):
+    """
+    An object whose values are all described by `value_field`.  Keys whose
+    value is `None` are ignored unless `allow_empty` is set.
+
+    When `chunked` is set and the context has a process pool, the values are
+    converted in the pool.  The results are merged in the order of the keys,
+    so they are the same as converting them in this process.
+    """
+    def __init__(self, value_field, allow_empty=False, chunked=False, **kwargs):
+        self.value_field = value_field
+        self.allow_empty = allow_empty
+        self.chunked = chunked
+        super(HomogenousDictField, self).__init__(**kwargs)
+
+    def get_fields(self, data):
+        return [
+            (key, self.value_field) for key, value in data.items()
+            if value is not None or self.allow_empty
+        ]
+
+    def convert_fields(self, data, context):
+        if not self.chunked or context.pool is None or len(data) <= context.chunk_size:
+            return super(HomogenousDictField, self).convert_fields(data, context)
+
+        items = [(key, data[key]) for key, _ in self.get_fields(data)]
+        chunks = [
+            (self.value_field, items[i:i + context.chunk_size])
+            for i in range(0, len(items), context.chunk_size)
+        ]
+        attrs = {}
+        errors = {}
+        for chunk_attrs, chunk_errors, deferred_references in context.pool.map(
+            chunk_from_native, chunks,
+        ):
+            attrs.update(chunk_attrs)
+            errors.update(chunk_errors)
+            context.deferred_references.update(deferred_references)
+        return attrs, errors
@@ -1,5 +1,6 @@
 import collections
 
+from flex.constants import PATH
 from flex.decorators import rewrite_reserved_words
 
 
@@ -49,3 +50,15 @@ def dereference_parameter_list(parameters, parameter_definitions):
         (p if isinstance(p, collections.Mapping) else parameter_definitions[p])
         for p in parameters
     ]
+
+
+def get_path_parameter_names(parameters):
+    """
+    The names of the parameters whose `in` value is `path`, without
+    duplicates, in the order they are declared.
+    """
+    names = collections.OrderedDict()
+    for parameter in parameters:
+        if parameter.get('in') == PATH:
+            names[parameter['name']] = None
+    return list(names)
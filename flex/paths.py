@@ -1,12 +1,20 @@
 import functools
 import re
+import sys
+import threading
+
+import collections
 
 from flex.constants import (
     PATH,
+    REQUEST_METHODS,
 )
 from flex.parameters import (
     find_parameter,
+    dereference_parameter_list,
+    get_path_parameter_names,
 )
+from flex.error_messages import MESSAGES
 
 
 REGEX_REPLACEMENTS = (
@@ -41,7 +49,7 @@ def construct_parameter_pattern(parameter):
     """
     name = parameter['name']
 
-    return "(?P<{name}>.+)".format(name=name)
+    return "(?P<{name}>[^/]+)".format(name=name)
 
 
 def process_path_part(part, parameters):
@@ -67,6 +75,85 @@ def get_parameter_names_from_path(api_path):
     return tuple(p.strip('{}') for p in PARAMETER_REGEX.findall(api_path))
 
 
+def get_missing_path_parameter_errors(path_definitions, parameter_definitions):
+    """
+    Returns the errors for path parameters that are declared for an api path,
+    or for one of its operations, but which do not appear in the api path.
+    Errors for an operation are keyed by `METHOD:api_path`.
+    """
+    errors = collections.defaultdict(list)
+
+    for api_path, path_definition in path_definitions.items():
+        if path_definition is None:
+            continue
+
+        path_parameter_names = set(get_parameter_names_from_path(api_path))
+        api_path_level_parameters = dereference_parameter_list(
+            path_definition.get('parameters', []),
+            parameter_definitions=parameter_definitions,
+        )
+        path_request_methods = set(REQUEST_METHODS).intersection(path_definition.keys())
+
+        if not path_request_methods:
+            for parameter in api_path_level_parameters:
+                if parameter['name'] not in path_parameter_names:
+                    errors[api_path].append(
+                        MESSAGES["path"]["missing_parameter"].format(
+                            parameter['name'], api_path,
+                        ),
+                    )
+
+        # The path parameters declared for the whole path are merged into
+        # those of every operation, so they are only checked once.
+        api_path_level_names = get_path_parameter_names(api_path_level_parameters)
+        missing_api_path_level_names = [
+            name for name in api_path_level_names if name not in path_parameter_names
+        ]
+        api_path_level_names = set(api_path_level_names)
+
+        for method in path_request_methods:
+            operation_definition = path_definition[method] or {}
+            operation_level_names = get_path_parameter_names(dereference_parameter_list(
+                operation_definition.get('parameters', []),
+                parameter_definitions=parameter_definitions,
+            ))
+            missing_names = missing_api_path_level_names + [
+                name for name in operation_level_names
+                if name not in path_parameter_names and name not in api_path_level_names
+            ]
+            if missing_names:
+                key = "{method}:{api_path}".format(method=method.upper(), api_path=api_path)
+                errors[key].extend(
+                    MESSAGES["path"]["missing_parameter"].format(name, api_path)
+                    for name in missing_names
+                )
+
+    return dict(errors)
+
+
+def get_operation_index(path_definitions):
+    """
+    Returns a mapping of the `operationId` of each operation to its
+    `(api_path, method)`.  Operation ids must be unique.
+    """
+    index = {}
+    for api_path, path_definition in path_definitions.items():
+        for method, operation_definition in (path_definition or {}).items():
+            if method not in REQUEST_METHODS or not operation_definition:
+                continue
+            operation_id = operation_definition.get('operationId')
+            if operation_id is None:
+                continue
+            if operation_id in index:
+                raise ValueError("Duplicate operationId `{0}` for `{1}` and `{2}`".format(
+                    operation_id,
+                    "{0}:{1}".format(index[operation_id][1].upper(), index[operation_id][0]),
+                    "{0}:{1}".format(method.upper(), api_path),
+                ))
+            index[operation_id] = (api_path, method)
+    return index
+
+
 def path_to_pattern(api_path, parameters):
     """
     Given an api path, possibly with parameter notation, return a pattern
@@ -89,29 +176,310 @@ def path_to_regex(api_path, parameters):
     return re.compile(pattern)
 
 
-def match_request_path_to_api_path(path_definitions, request_path, base_path=''):
+class PathNode(object):
     """
-    Given a request_path and a set of api path definitions, return the one that
-    matches.
+    A single node in a `PathRouter`.  Each node corresponds to one `/`
+    delimited segment of an api path.
+
+    - literals: mapping of exact segment text to the child node.
+    - patterns: mapping of segment regex patterns to `(regex, child)` pairs
+      for segments that contain declared path parameters.
+    - api_paths: the api paths which terminate at this node.
+    """
+    def __init__(self):
+        self.literals = {}
+        self.patterns = {}
+        self.api_paths = []
+
+    def get_or_create_child(self, segment, parameters):
+        parts = re.split(PARAMETER_REGEX, segment)
+        pattern = ''.join(process_path_part(part, parameters) for part in parts)
+        if pattern == escape_regex_special_chars(segment):
+            # No declared path parameters in this segment, so it can be
+            # matched with a dictionary lookup.
+            return self.literals.setdefault(segment, PathNode())
+
+        pattern = "^{0}$".format(pattern)
+        if pattern not in self.patterns:
+            self.patterns[pattern] = (re.compile(pattern), PathNode())
+        return self.patterns[pattern][1]
+
+    def iter_matches(self, segments, index, captures):
+        """
+        Yield `(api_path, captures)` for every api path below this node that
+        matches the remaining request path segments.
+        """
+        if index == len(segments):
+            for api_path in self.api_paths:
+                yield api_path, captures
+            return
+
+        segment = segments[index]
+        if segment in self.literals:
+            for match in self.literals[segment].iter_matches(segments, index + 1, captures):
+                yield match
+
+        for regex, child in self.patterns.values():
+            segment_match = regex.match(segment)
+            if segment_match is None:
+                continue
+            child_captures = dict(captures)
+            child_captures.update(segment_match.groupdict())
+            for match in child.iter_matches(segments, index + 1, child_captures):
+                yield match
+
+
+class AmbiguousPathError(LookupError):
+    """
+    Raised by the routers when a request path matches more than one api path,
+    as opposed to a plain `LookupError` when it matches none.
+    """
+    def __init__(self, request_path, api_paths):
+        super(AmbiguousPathError, self).__init__(
+            'Multipue paths found for {0}.  Found `{1}`'.format(request_path, api_paths),
+        )
+        self.api_paths = api_paths
+
+
+class PathRouter(object):
+    """
+    Routing index for the api paths of a schema.  The api paths are stored as
+    a trie keyed on their `/` delimited segments so that the cost of matching
+    a request path depends on the depth of the path rather than the number of
+    api paths.  This is meant to be constructed once per schema and reused
+    across requests.
+    """
+    def __init__(self, path_definitions):
+        self.root = PathNode()
+        for api_path, path_definition in path_definitions.items():
+            self.add(api_path, (path_definition or {}).get('parameters', []))
+
+    def add(self, api_path, parameters):
+        node = self.root
+        for segment in api_path.split('/'):
+            node = node.get_or_create_child(segment, parameters)
+        node.api_paths.append(api_path)
+
+    def match(self, request_path):
+        """
+        Given a request path (with any basePath already removed), return a
+        two-tuple of the matching api path and a dictionary of the raw values
+        captured for the path parameters.
+
+        Anything other than exactly one match is an error condition.
+        """
+        matches = list(self.root.iter_matches(request_path.split('/'), 0, {}))
+
+        if not matches:
+            raise LookupError('No paths found for {0}'.format(request_path))
+        elif len(matches) > 1:
+            raise AmbiguousPathError(
+                request_path, [api_path for api_path, _ in matches],
+            )
+        else:
+            return matches[0]
+
+
+# Before python 3.5 a regular expression may have at most 99 groups, so the
+# combined expression of a `RegexPathRouter` is split into several.
+MAX_REGEX_GROUPS = 99 if sys.version_info < (3, 5) else None
+
+
+def get_branch_pattern(api_path, parameters, branch):
+    """
+    Return the pattern for one api path within the combined expression of a
+    `RegexPathRouter`, and a mapping of the names of its groups to the path
+    parameters they capture.  Group names are made unique with the index of
+    the branch, as a parameter name may appear in many api paths.
+    """
+    pattern = []
+    group_names = {}
+    for part in re.split(PARAMETER_REGEX, api_path):
+        if PARAMETER_REGEX.match(part):
+            parameter_name = part.strip('{}')
+            try:
+                find_parameter(parameters, name=parameter_name, in_=PATH)
+            except ValueError:
+                pass
+            else:
+                group_name = 'p{0}_{1}'.format(branch, len(group_names))
+                group_names[group_name] = parameter_name
+                pattern.append('(?P<{0}>[^/]+)'.format(group_name))
+                continue
+        pattern.append(escape_regex_special_chars(part))
+    return ''.join(pattern), group_names
+
+
+class RegexPathRouter(object):
+    """
+    Routing index for the api paths of a schema which joins the pattern of
+    every api path into a single regular expression, as alternation branches
+    wrapped in a named group.  A request path is scanned once and the branch
+    that matched is read from `lastindex`.
+
+    To tell whether a request path matches more than one api path, the same
+    branches are also joined in reverse order.  The request path matches
+    exactly one api path when both expressions match the same branch.
+
+    Like `PathRouter`, this is meant to be constructed once per schema and
+    reused across requests.
+    """
+    def __init__(self, path_definitions):
+        self.api_paths = []
+        self.group_names = []
+        self.patterns = []
+        for api_path, path_definition in path_definitions.items():
+            self.add(api_path, (path_definition or {}).get('parameters', []))
+        self.compile()
+
+    def add(self, api_path, parameters):
+        pattern, group_names = get_branch_pattern(
+            api_path, parameters, len(self.api_paths),
+        )
+        self.api_paths.append(api_path)
+        self.group_names.append(group_names)
+        self.patterns.append(pattern)
+
+    def compile(self):
+        """
+        Build the combined expressions.  Each of `regexes` and
+        `reverse_regexes` holds `(regex, branches)` pairs, where `branches`
+        maps the index of the group wrapping each branch to the branch.
+        """
+        chunks = []
+        group_count = 0
+        for branch, group_names in enumerate(self.group_names):
+            branch_groups = 1 + len(group_names)
+            if not chunks or (MAX_REGEX_GROUPS and
+                              group_count + branch_groups > MAX_REGEX_GROUPS):
+                chunks.append([])
+                group_count = 0
+            chunks[-1].append(branch)
+            group_count += branch_groups
+
+        self.regexes = [self.compile_branches(chunk) for chunk in chunks]
+        self.reverse_regexes = [self.compile_branches(chunk[::-1]) for chunk in chunks[::-1]]
+
+    def compile_branches(self, branches):
+        regex = re.compile('^(?:{0})$'.format('|'.join(
+            '(?P<b{0}>{1})'.format(branch, self.patterns[branch]) for branch in branches
+        )))
+        return regex, dict(
+            (regex.groupindex['b{0}'.format(branch)], branch) for branch in branches
+        )
+
+    def find_branch(self, request_path, regexes):
+        """
+        Return the first branch of `regexes` that matches the request path,
+        and the match object.
+        """
+        for regex, branches in regexes:
+            path_match = regex.match(request_path)
+            if path_match is not None:
+                return branches[path_match.lastindex], path_match
+        return None, None
+
+    def get_captures(self, branch, path_match):
+        return dict(
+            (parameter_name, path_match.group(group_name))
+            for group_name, parameter_name in self.group_names[branch].items()
+        )
+
+    def match(self, request_path):
+        """
+        Given a request path (with any basePath already removed), return a
+        two-tuple of the matching api path and a dictionary of the raw values
+        captured for the path parameters.
+
+        Anything other than exactly one match is an error condition.
+        """
+        branch, path_match = self.find_branch(request_path, self.regexes)
+        if branch is None:
+            raise LookupError('No paths found for {0}'.format(request_path))
+        elif self.find_branch(request_path, self.reverse_regexes)[0] != branch:
+            raise AmbiguousPathError(request_path, [
+                api_path for api_path, pattern in zip(self.api_paths, self.patterns)
+                if re.match('^{0}$'.format(pattern), request_path)
+            ])
+        return self.api_paths[branch], self.get_captures(branch, path_match)
+
+
+class PathMatchCache(object):
+    """
+    Bounded, least recently used cache of the matches of a router, keyed by
+    the request path (with any basePath already removed).  It has the same
+    `match` interface as the router it wraps, so that the traffic to the same
+    concrete urls is only routed once.  Request paths that do not match
+    exactly one api path are not cached.
+
+    `hits` and `misses` count the lookups that were and were not answered by
+    the cache.  A cache may be shared between threads.
+    """
+    def __init__(self, router, max_size=4096):
+        self.router = router
+        self.max_size = max_size
+        self.matches = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def match(self, request_path):
+        with self.lock:
+            match = self.matches.pop(request_path, None)
+            if match is not None:
+                self.matches[request_path] = match
+                self.hits += 1
+            else:
+                self.misses += 1
+        if match is None:
+            match = self.router.match(request_path)
+            with self.lock:
+                self.matches[request_path] = match
+                while len(self.matches) > self.max_size:
+                    self.matches.popitem(last=False)
+        api_path, captures = match
+        # the captures are copied as callers are free to modify them.
+        return api_path, dict(captures)
+
+    @property
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.matches),
+        }
+
+
+def match_request_path(path_definitions, request_path, base_path='', router=None):
+    """
+    Given a request_path and a set of api path definitions, return a two-tuple
+    of the api path that matches and a dictionary of the raw values captured
+    for its path parameters.
 
     Anything other than exactly one match is an error condition.
+
+    A prebuilt `PathRouter` for the `path_definitions` may be provided to avoid
+    constructing the routing index on every call.
     """
     if request_path.startswith(base_path):
         request_path = request_path[len(base_path):]
 
-    # Convert all of the api paths into Path instances for easier regex matching.
-    paths = {
-        p: path_to_regex(p, (v or {}).get('parameters', {}))
-        for p, v in path_definitions.items()
-    }
-
-    matches = [p for p, r in paths.items() if r.match(request_path)]
-
-    if not matches:
-        raise LookupError('No paths found for {0}'.format(request_path))
-    elif len(matches) > 1:
-        raise LookupError('Multipue paths found for {0}.  Found `{1}`'.format(
-            request_path, matches,
-        ))
-    else:
-        return matches[0]
+    if router is None:
+        router = PathRouter(path_definitions)
+
+    return router.match(request_path)
+
+
+def match_request_path_to_api_path(path_definitions, request_path, base_path='',
+                                   router=None):
+    """
+    Given a request_path and a set of api path definitions, return the one that
+    matches.
+
+    Anything other than exactly one match is an error condition.
+
+    A prebuilt `PathRouter` for the `path_definitions` may be provided to avoid
+    constructing the routing index on every call.
+    """
+    api_path, _ = match_request_path(path_definitions, request_path, base_path, router)
+    return api_path
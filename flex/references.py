@@ -0,0 +1,384 @@
+"""
+Resolution of `$ref` values that point into other documents, such as
+`$ref: common.yaml#/definitions/Pet`.
+
+Each referenced schema is added to the `definitions` of the schema being
+loaded, and each referenced parameter to its `parameters`, keyed by the path
+or URL of its document relative to the schema's own document followed by the
+JSON pointer.  The `$ref` values pointing at it are rewritten to that key.
+The rest of flex then treats it like any other definition, including
+references between documents that form a cycle.  Responses in other documents
+cannot be referenced, as flex has no way to refer to a shared response.
+
+Only `$ref` values in the position of a schema, parameter or response are
+resolved, so a `$ref` within data such as an `enum` or an `example` is left
+alone.  A `$ref` without a `#` keeps its existing meaning of the name of a
+definition or parameter.  Within a referenced document such names, and local
+pointers like `#/definitions/Tag`, are relative to that document.
+"""
+import collections
+import os
+import threading
+
+import six
+from six.moves import urllib_parse as urlparse
+
+from flex.constants import REQUEST_METHODS
+
+
+def is_url(value):
+    parts = urlparse.urlparse(value)
+    return bool(parts.scheme and parts.netloc)
+
+
+def get_base_uri(target):
+    """
+    Returns the uri that references in the schema loaded from `target` are
+    relative to.
+    """
+    if hasattr(target, 'read') and callable(target.read):
+        name = getattr(target, 'name', None)
+        if isinstance(name, six.string_types) and os.path.exists(name):
+            return os.path.abspath(name)
+    elif isinstance(target, six.string_types):
+        if is_url(target):
+            return target
+        elif os.path.exists(os.path.expanduser(target)):
+            return os.path.abspath(os.path.expanduser(target))
+    # references from a schema that did not come from a file are relative to
+    # the working directory.
+    return os.path.join(os.getcwd(), '')
+
+
+def join_uri(base_uri, uri):
+    if is_url(uri):
+        return uri
+    elif is_url(base_uri):
+        return urlparse.urljoin(base_uri, uri)
+    return os.path.normpath(os.path.join(os.path.dirname(base_uri), uri))
+
+
+def split_reference(reference):
+    """
+    Split a reference into the uri of its document and the JSON pointer
+    within it.
+    """
+    uri, _, pointer = reference.partition('#')
+    return uri, pointer
+
+
+def resolve_pointer(document, pointer):
+    """
+    Returns the object within `document` that the JSON pointer refers to.
+    """
+    value = document
+    for token in urlparse.unquote(pointer).split('/')[1:]:
+        token = token.replace('~1', '/').replace('~0', '~')
+        if isinstance(value, collections.Mapping) and token in value:
+            value = value[token]
+        elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            value = value[int(token)]
+        else:
+            raise KeyError(pointer)
+    return value
+
+
+class DocumentCache(object):
+    """
+    In memory cache of the documents that references point to, keyed by uri,
+    so that each is loaded once.  URLs are fetched with a shared
+    `requests.Session` so that connections are reused.  A cache may be shared
+    between loads of several schemas, and across threads.
+    """
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self.documents = {}
+        self._session = None
+        self._lock = threading.Lock()
+        self._uri_locks = collections.defaultdict(threading.Lock)
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+
+                self._session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+                self._session.mount('http://', adapter)
+                self._session.mount('https://', adapter)
+            return self._session
+
+    def get(self, uri):
+        """
+        Returns the raw document at `uri`, loading it if it has not been
+        loaded yet.
+        """
+        if uri in self.documents:
+            return self.documents[uri]
+
+        with self._lock:
+            uri_lock = self._uri_locks[uri]
+
+        with uri_lock:
+            if uri not in self.documents:
+                self.documents[uri] = self.load(uri)
+        return self.documents[uri]
+
+    def load(self, uri):
+        # imported here as `flex.core` imports this module.
+        from flex.core import load_source
+
+        if is_url(uri):
+            return load_source(uri, session=self.session)
+        try:
+            with open(uri, 'r') as source_file:
+                return load_source(source_file)
+        except IOError:
+            raise ValueError("Unable to load referenced document `{0}`.".format(uri))
+
+    def get_many(self, uris):
+        """
+        Load the documents at `uris` concurrently.
+        """
+        uris = [uri for uri in uris if uri not in self.documents]
+        if len(uris) > 1 and self.max_workers > 1:
+            from multiprocessing.pool import ThreadPool
+
+            pool = ThreadPool(min(len(uris), self.max_workers))
+            try:
+                pool.map(self.get, uris)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for uri in uris:
+                self.get(uri)
+
+
+def rewrite_schema(schema, rewrite):
+    """
+    Returns a copy of the schema object `schema` with the `$ref` values of it
+    and of its nested schemas replaced by `rewrite(reference, 'definitions')`.
+    Keywords whose values are data, such as `enum`, `default`, `example` and
+    vendor extensions, are copied as they are.
+    """
+    if not isinstance(schema, collections.Mapping):
+        return schema
+    copied = dict(schema)
+    if isinstance(schema.get('$ref'), six.string_types):
+        copied['$ref'] = rewrite(schema['$ref'], 'definitions') or schema['$ref']
+    for key in ('items', 'allOf'):
+        if isinstance(schema.get(key), list):
+            copied[key] = [rewrite_schema(item, rewrite) for item in schema[key]]
+        elif key in schema:
+            copied[key] = rewrite_schema(schema[key], rewrite)
+    if 'additionalProperties' in schema:
+        copied['additionalProperties'] = rewrite_schema(schema['additionalProperties'], rewrite)
+    if isinstance(schema.get('properties'), collections.Mapping):
+        copied['properties'] = dict(
+            (name, rewrite_schema(value, rewrite))
+            for name, value in schema['properties'].items()
+        )
+    return copied
+
+
+def rewrite_parameter(parameter, rewrite):
+    if not isinstance(parameter, collections.Mapping):
+        return parameter
+    copied = dict(parameter)
+    for key in ('schema', 'items'):
+        if key in parameter:
+            copied[key] = rewrite_schema(parameter[key], rewrite)
+    return copied
+
+
+def rewrite_parameter_list(parameters, rewrite):
+    """
+    A `$ref` in a list of parameters is replaced by the name under which
+    `rewrite(reference, 'parameters')` adds the parameter to the
+    `parameters` of the schema, as flex refers to parameters by name.
+    """
+    if not isinstance(parameters, list):
+        return parameters
+    rewritten = []
+    for parameter in parameters:
+        reference = isinstance(parameter, collections.Mapping) and parameter.get('$ref')
+        if isinstance(reference, six.string_types):
+            rewritten.append(rewrite(reference, 'parameters') or parameter)
+        else:
+            rewritten.append(rewrite_parameter(parameter, rewrite))
+    return rewritten
+
+
+def rewrite_response(response, rewrite):
+    if not isinstance(response, collections.Mapping):
+        return response
+    copied = dict(response)
+    if isinstance(response.get('$ref'), six.string_types):
+        copied['$ref'] = rewrite(response['$ref'], 'responses') or response['$ref']
+    if 'schema' in response:
+        copied['schema'] = rewrite_schema(response['schema'], rewrite)
+    return copied
+
+
+def rewrite_mapping(value, rewrite, rewrite_item):
+    if not isinstance(value, collections.Mapping):
+        return value
+    return dict((key, rewrite_item(item, rewrite)) for key, item in value.items())
+
+
+def rewrite_operation(operation, rewrite):
+    if not isinstance(operation, collections.Mapping):
+        return operation
+    copied = dict(operation)
+    if 'parameters' in operation:
+        copied['parameters'] = rewrite_parameter_list(operation['parameters'], rewrite)
+    if 'responses' in operation:
+        copied['responses'] = rewrite_mapping(operation['responses'], rewrite, rewrite_response)
+    return copied
+
+
+def rewrite_path(path, rewrite):
+    if not isinstance(path, collections.Mapping):
+        return path
+    copied = dict(path)
+    if 'parameters' in path:
+        copied['parameters'] = rewrite_parameter_list(path['parameters'], rewrite)
+    for method in REQUEST_METHODS:
+        if method in path:
+            copied[method] = rewrite_operation(path[method], rewrite)
+    return copied
+
+
+# How the objects in each section of a schema are rewritten, which is also
+# how an object that a reference of that kind points to is rewritten.
+SECTION_REWRITERS = {
+    'definitions': rewrite_schema,
+    'parameters': rewrite_parameter,
+    'responses': rewrite_response,
+}
+
+
+def rewrite_references(raw_schema, rewrite):
+    """
+    Returns a copy of `raw_schema` with each `$ref` in the position of a
+    schema, parameter or response replaced by `rewrite(reference, section)`,
+    where `section` is `definitions`, `parameters` or `responses`, unless that
+    returns `None`.  Any other
+    `$ref`, such as one within an `enum` or an `example`, is data and is left
+    as it is.
+    """
+    copied = dict(raw_schema)
+    for section, rewrite_item in SECTION_REWRITERS.items():
+        if section in raw_schema:
+            copied[section] = rewrite_mapping(raw_schema[section], rewrite, rewrite_item)
+    if 'paths' in raw_schema:
+        copied['paths'] = rewrite_mapping(raw_schema['paths'], rewrite, rewrite_path)
+    return copied
+
+
+def find_external_references(value):
+    """
+    Returns whether `value` may contain a `$ref` that points into another
+    document.  Every `$ref` is considered, including those within data such as
+    an `enum`, so that schemas without any are passed over without a copy
+    being made by `rewrite_references`.
+    """
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            reference = value.get('$ref')
+            if isinstance(reference, six.string_types) and '#' in reference:
+                if split_reference(reference)[0]:
+                    return True
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+def get_relative_uri(base_uri, uri):
+    """
+    Returns `uri` relative to the directory of `base_uri` where possible, so
+    that the keys of resolved references do not depend on where the schema
+    happens to be stored.
+    """
+    if is_url(uri):
+        base = urlparse.urljoin(base_uri, '.') if is_url(base_uri) else None
+        if base and uri.startswith(base):
+            return uri[len(base):]
+        return uri
+    elif is_url(base_uri):
+        return uri
+    return os.path.relpath(uri, os.path.dirname(base_uri)).replace(os.sep, '/')
+
+
+def resolve_references(raw_schema, base_uri, documents=None):
+    """
+    Returns `raw_schema` with the objects that its `$ref` values point to in
+    other documents added to its definitions.  Documents are loaded through
+    `documents`, a `DocumentCache`, with the documents discovered at each
+    level of references loaded concurrently.
+    """
+    if not isinstance(raw_schema, collections.Mapping):
+        return raw_schema
+    if not find_external_references(raw_schema):
+        return raw_schema
+    if documents is None:
+        documents = DocumentCache()
+
+    # {key: (uri, pointer, section)} of the references yet to be resolved.
+    pending = {}
+
+    def make_rewrite(document_uri, is_root):
+        def rewrite(reference, section):
+            uri, pointer = split_reference(reference)
+            if '#' not in reference:
+                if is_root:
+                    return None
+                uri, pointer = document_uri, '/{0}/{1}'.format(section, reference)
+            elif not uri:
+                if is_root:
+                    return None
+                uri = document_uri
+            else:
+                uri = join_uri(document_uri, uri)
+            key = '{0}#{1}'.format(get_relative_uri(base_uri, uri), pointer)
+            if section == 'responses':
+                raise ValueError(
+                    "Unable to resolve reference `{0}`, responses may only be "
+                    "referenced within the same document.".format(key)
+                )
+            pending[key] = (uri, pointer, section)
+            return key
+        return rewrite
+
+    resolved_schema = rewrite_references(raw_schema, make_rewrite(base_uri, True))
+    if not pending:
+        return raw_schema
+    for section in ('definitions', 'parameters'):
+        if not isinstance(resolved_schema.get(section) or {}, collections.Mapping):
+            # left for meta-validation to report.
+            return resolved_schema
+    resolved_schema['definitions'] = resolved_schema.get('definitions') or {}
+
+    while pending:
+        references = dict(
+            (key, reference) for key, reference in pending.items()
+            if key not in (resolved_schema.get(reference[2]) or {})
+        )
+        pending.clear()
+        documents.get_many(set(uri for uri, _, _ in references.values()))
+        for key, (uri, pointer, section) in sorted(references.items()):
+            try:
+                target = resolve_pointer(documents.get(uri), pointer)
+            except KeyError:
+                raise ValueError("Unable to resolve reference `{0}`.".format(key))
+            resolved_schema[section] = resolved_schema.get(section) or {}
+            resolved_schema[section][key] = SECTION_REWRITERS[section](
+                target, make_rewrite(uri, False),
+            )
+
+    return resolved_schema
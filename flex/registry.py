@@ -0,0 +1,174 @@
+"""
+Registry of many loaded schemas, for services such as API gateways which pick
+the schema for each request by its host and `basePath` before validating it.
+
+Schemas are indexed by host and then by base path.  The api paths of all
+schemas that share a host and base path are routed with a single
+`PathRouter`, so that dispatching a request costs a few dictionary lookups per
+segment of its path, however many schemas are registered.  A schema without
+a `host` serves requests for any host that no other schema claims the path
+of.
+
+Schemas with identical `definitions` share their compiled schema validators.
+"""
+import collections
+import threading
+
+from flex.context_managers import ErrorCollection
+from flex.error_messages import MESSAGES
+from flex.http import normalize_request
+from flex.paths import (
+    AmbiguousPathError,
+    PathMatchCache,
+    PathRouter,
+)
+from flex.validation.operation import OperationValidatorCache
+from flex.validation.request import validate_request_to_operation
+from flex.validation.schema import (
+    get_schema_key,
+    get_schema_validator_cache,
+    share_schema_validator_cache,
+)
+
+
+def normalize_base_path(base_path):
+    return (base_path or '').rstrip('/')
+
+
+def iter_base_paths(request_path):
+    """
+    Yield the prefixes of `request_path` that a base path may match, from the
+    longest to the empty prefix.
+    """
+    prefix = request_path.rstrip('/')
+    while prefix:
+        yield prefix
+        prefix = prefix[:prefix.rfind('/')]
+    yield ''
+
+
+class SchemaGroup(object):
+    """
+    The schemas registered for one host and base path, and the router for
+    their combined api paths.  The api paths of each schema are added to the
+    existing router as it is registered, so registering many schemas in a
+    group costs the same as building one router for all of them.
+    """
+    def __init__(self):
+        self.paths = {}
+        self.schemas = {}
+        self.path_router = PathRouter({})
+        self.router = PathMatchCache(self.path_router)
+
+    def add(self, schema):
+        duplicates = set(self.paths).intersection(schema['paths'])
+        if duplicates:
+            raise ValueError("Api paths `{0}` are already registered".format(
+                sorted(duplicates),
+            ))
+        self.paths.update(schema['paths'])
+        self.schemas.update((api_path, schema) for api_path in schema['paths'])
+        for api_path, path_definition in schema['paths'].items():
+            self.path_router.add(api_path, (path_definition or {}).get('parameters', []))
+        # matches cached before the new api paths were added may be stale.
+        self.router = PathMatchCache(self.path_router)
+
+
+class SchemaRegistry(object):
+    """
+    Index of loaded schemas by host, base path and api path.  Schemas are
+    added with `add`, after which `match` and `validate_request` find the
+    schema for a request.  A registry may be shared between threads once all
+    of its schemas have been added.
+    """
+    def __init__(self):
+        # {host: {base_path: SchemaGroup}}, with `None` for schemas without a
+        # host.
+        self.hosts = collections.defaultdict(dict)
+        self.operation_validators = {}
+        self.schema_validators = {}
+        self.lock = threading.Lock()
+
+    def add(self, schema):
+        """
+        Register a loaded schema.  Raises a `ValueError` if one of its api
+        paths is already registered for the same host and base path.
+        """
+        host = (schema.get('host') or '').lower() or None
+        base_path = normalize_base_path(schema.get('basePath'))
+
+        with self.lock:
+            group = self.hosts[host].get(base_path) or SchemaGroup()
+            group.add(schema)
+            self.hosts[host][base_path] = group
+
+            definitions_key = get_schema_key(schema.get('definitions', {}))
+            if definitions_key in self.schema_validators:
+                share_schema_validator_cache(schema, self.schema_validators[definitions_key])
+            else:
+                self.schema_validators[definitions_key] = get_schema_validator_cache(schema)
+            self.operation_validators[id(schema)] = OperationValidatorCache(
+                schema['paths'], context=schema,
+            )
+        return schema
+
+    def match(self, request):
+        """
+        Return a three-tuple of the schema, the api path and the raw values of
+        the path parameters for the request.
+
+        Schemas for the host of the request are tried before schemas without a
+        host, and longer base paths before shorter ones.  The first group of
+        schemas with a path for the request decides the match, so raises an
+        `AmbiguousPathError` if that group has more than one, and a
+        `LookupError` if no group has any.
+        """
+        host = request.url_components.netloc.lower()
+        request_path = request.path
+        for groups in (self.hosts.get(host), self.hosts.get(None)):
+            if not groups:
+                continue
+            for base_path in iter_base_paths(request_path):
+                group = groups.get(base_path)
+                if group is None:
+                    continue
+                try:
+                    api_path, path_parameters = group.router.match(
+                        request_path[len(base_path):],
+                    )
+                except AmbiguousPathError:
+                    raise
+                except LookupError:
+                    continue
+                return group.schemas[api_path], api_path, path_parameters
+        raise LookupError('No schemas found for {0}'.format(request.url))
+
+    def validate_request(self, request, inner=False):
+        """
+        Validate the request against the schema that `match` finds for it.
+        Returns a two-tuple of the schema and the operation definition, so
+        that the response can be validated against the same schema.
+        """
+        request = normalize_request(request)
+
+        with ErrorCollection(inner=inner) as errors:
+            try:
+                schema, api_path, request.path_parameters = self.match(request)
+            except AmbiguousPathError as err:
+                errors['path'].append(
+                    MESSAGES['request']['ambiguous_path'].format(sorted(err.api_paths)),
+                )
+                return
+            except LookupError:
+                errors['path'].append(MESSAGES['request']['unknown_path'])
+                return
+
+        operation_definition = validate_request_to_operation(
+            request,
+            api_path=api_path,
+            path_definition=schema['paths'][api_path] or {},
+            context=schema,
+            operation_validators=self.operation_validators[id(schema)],
+            inner=inner,
+        )
+        return schema, operation_definition
@@ -0,0 +1,70 @@
+"""
+Deprecated.  Schemas used to be validated by django rest framework
+serializers, which these modules now emulate on top of the fields of
+`flex.meta`.  Use `flex.core.parse`, or the fields of `flex.meta`, instead.
+"""
+import warnings
+
+from flex.exceptions import SafeNestedValidationError
+from flex.meta.fields import Context
+
+
+warnings.warn(
+    "`flex.serializers` is deprecated, use `flex.core.parse` or `flex.meta`",
+    DeprecationWarning,
+    stacklevel=2,
+)
+
+
+class Serializer(object):
+    """
+    Validates `data` with the `flex.meta` field `field_class`, exposing the
+    result as the `is_valid`, `errors` and `object` of a django rest
+    framework serializer.  `context` is the dictionary of definitions that
+    references are checked against.
+    """
+    field_class = None
+    field_kwargs = {}
+
+    def __init__(self, instance=None, data=None, context=None, many=False):
+        self.data = data
+        self.context = context if context is not None else {}
+        self.field = self.field_class(many=many, **self.field_kwargs)
+        self.error_messages = self.field.error_messages
+        self.object = instance
+        self._errors = None
+
+    @property
+    def errors(self):
+        if self._errors is None:
+            context = Context(self.context)
+            if 'deferred_references' in self.context:
+                context.deferred_references = self.context['deferred_references']
+
+            if self.field.is_many(self.data):
+                try:
+                    self.object = self.field.deserialize(self.data, context)
+                    self._errors = {}
+                except SafeNestedValidationError as err:
+                    self._errors = err.messages
+            else:
+                self.object, self._errors = self.field.from_native(self.data, context)
+        return self._errors
+
+    def is_valid(self):
+        return not self.errors
+
+
+def serializer_for(field_class, **field_kwargs):
+    """
+    Returns a `Serializer` class for the `flex.meta` field `field_class`.
+    """
+    return type(
+        str(field_class.__name__.replace('Field', 'Serializer')),
+        (Serializer,),
+        {
+            'field_class': field_class,
+            'field_kwargs': field_kwargs,
+            'default_error_messages': field_class.error_messages,
+        },
+    )
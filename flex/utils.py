@@ -27,21 +27,80 @@ def is_non_string_iterable(value):
     return not isinstance(value, string_types) and hasattr(value, '__iter__')
 
 
+def exclude_overlapping_types(types):
+    """
+    Strings are sequences and booleans are integers in python, but neither
+    are in json.
+    """
+    types = set(types)
+    if STRING in types:
+        types.discard(ARRAY)
+    if BOOLEAN in types:
+        types.difference_update((INTEGER, NUMBER))
+    return frozenset(types)
+
+
+def get_types_for_class(cls):
+    """
+    Returns the set of `PRIMATIVE_TYPES` that values of the given class are
+    considered to be of.
+    """
+    return exclude_overlapping_types(
+        type_ for type_, classes in PRIMATIVE_TYPES.items() if issubclass(cls, classes)
+    )
+
+
+# Precomputed types for the concrete classes that values are nearly always
+# instances of, so that classifying a value is a single dictionary lookup.
+BUILTIN_CLASSES = (
+    (type(None), bool, float, list, tuple, dict, six.binary_type, six.text_type) +
+    six.integer_types
+)
+TYPES_FOR_CLASS = dict((cls, get_types_for_class(cls)) for cls in BUILTIN_CLASSES)
+
+
+def get_types_for_value(value):
+    """
+    Returns the set of `PRIMATIVE_TYPES` the value is considered to be of.
+    Values of any class not in `TYPES_FOR_CLASS` fall back to `isinstance`
+    checks.
+    """
+    try:
+        return TYPES_FOR_CLASS[type(value)]
+    except KeyError:
+        pass
+    return exclude_overlapping_types(
+        type_ for type_, classes in PRIMATIVE_TYPES.items() if isinstance(value, classes)
+    )
+
+
+def get_known_types(types):
+    """
+    Returns the set of the given types, raising a `ValueError` for any that
+    is not one of the `PRIMATIVE_TYPES`.  Validators check their types with
+    this once, when they are created, rather than for every value.
+    """
+    for type_ in types:
+        if type_ not in PRIMATIVE_TYPES:
+            raise ValueError("Unknown type: {0}".format(type_))
+    return frozenset(types)
+
+
 def is_value_of_type(value, type_):
     if type_ not in PRIMATIVE_TYPES:
         raise ValueError("Unknown type: {0}".format(type_))
 
-    if type_ == ARRAY and is_value_of_type(value, STRING):
-        return False
-
-    if type_ in (INTEGER, NUMBER) and is_value_of_type(value, BOOLEAN):
-        return False
-
-    return isinstance(value, PRIMATIVE_TYPES[type_])
+    return type_ in get_types_for_value(value)
 
 
 def is_value_of_any_type(value, types):
-    return any(is_value_of_type(value, type_) for type_ in types)
+    value_types = get_types_for_value(value)
+    for type_ in types:
+        if type_ not in PRIMATIVE_TYPES:
+            raise ValueError("Unknown type: {0}".format(type_))
+        if type_ in value_types:
+            return True
+    return False
 
 
 def cast_value_to_type(value, type_):
@@ -66,7 +125,24 @@ def cast_value_to_type(value, type_):
     return PRIMATIVE_TYPES[type_][0](value)
 
 
+# The single type reported for values of the builtin classes.
+TYPE_FOR_CLASS = {
+    type(None): NULL,
+    bool: BOOLEAN,
+    float: NUMBER,
+    list: ARRAY,
+    tuple: ARRAY,
+    dict: OBJECT,
+}
+TYPE_FOR_CLASS.update((cls, INTEGER) for cls in six.integer_types)
+TYPE_FOR_CLASS.update((cls, STRING) for cls in (six.binary_type, six.text_type))
+
+
 def get_type_for_value(value):
+    try:
+        return TYPE_FOR_CLASS[type(value)]
+    except KeyError:
+        pass
     if value is None:
         return NULL
     if isinstance(value, PRIMATIVE_TYPES[BOOLEAN]):
@@ -0,0 +1,437 @@
+"""
+Optional code generation backend for schema validation.
+
+Rather than running values through dictionaries of `functools.partial`
+validators with `validate_object`, the schema is turned into python source
+with one function per schema node.  The value's type is looked up once per
+node and only the checks that apply to that type are run, inline.  When a
+check fails, the same validator that `construct_schema_validators` would have
+used is called to produce the error, so both engines report identical errors.
+"""
+import collections
+import itertools
+import threading
+
+import six
+
+from flex.exceptions import (
+    SafeNestedValidationError,
+    ValidationError,
+)
+from flex.constants import (
+    EMPTY,
+    NULL,
+    BOOLEAN,
+    INTEGER,
+    NUMBER,
+    STRING,
+    ARRAY,
+    OBJECT,
+)
+from flex.formats import registry
+from flex.utils import (
+    is_non_string_iterable,
+    TYPE_FOR_CLASS,
+)
+from flex.validation.schema import (
+    get_schema_key,
+    validator_mapping,
+)
+
+
+# Maps concrete python types to the json type they validate as.  Values of any
+# other type are validated by calling the regular validators.
+KINDS = TYPE_FOR_CLASS
+
+# The kinds which satisfy a declared `type`.
+ACCEPTED_KINDS = {
+    '': (NULL,),
+    None: (NULL,),
+    NULL: (NULL,),
+    BOOLEAN: (BOOLEAN,),
+    INTEGER: (INTEGER,),
+    NUMBER: (INTEGER, NUMBER),
+    STRING: (STRING,),
+    ARRAY: (ARRAY,),
+    OBJECT: (OBJECT,),
+}
+
+NUMBER_KINDS = (INTEGER, NUMBER)
+
+
+def get_accepted_kinds(types):
+    if not is_non_string_iterable(types):
+        types = (types,)
+    return set(itertools.chain.from_iterable(
+        ACCEPTED_KINDS.get(type_, ()) for type_ in types
+    ))
+
+
+# Order in which the kind branches are emitted.
+KIND_ORDER = (STRING, INTEGER, NUMBER, OBJECT, ARRAY, BOOLEAN, NULL)
+
+
+def add_errors(errors, key, messages):
+    if errors is None:
+        errors = {}
+    errors.setdefault(key, []).extend(messages)
+    return errors
+
+
+def record_error(errors, key, validator, value):
+    try:
+        validator(value)
+    except ValidationError as err:
+        errors = add_errors(errors, key, list(err.messages))
+    return errors
+
+
+class KeywordCheck(object):
+    """
+    A single keyword validator.  `conditions` maps each kind to the python
+    expression that signals a possible failure, or `True` if the validator
+    must always be called for that kind.  Kinds that are not present are
+    skipped entirely.
+    """
+    def __init__(self, key, validator, conditions, empty=False):
+        self.key = key
+        self.validator = validator
+        self.conditions = conditions
+        self.empty = empty
+
+
+class PropertyCheck(object):
+    def __init__(self, key, function_name):
+        self.key = key
+        self.function_name = function_name
+
+
+class ItemsCheck(object):
+    def __init__(self, function_names, is_tuple):
+        self.key = 'items'
+        self.function_names = function_names
+        self.is_tuple = is_tuple
+
+
+class ReferenceCheck(object):
+    def __init__(self, function_name):
+        self.key = '$ref'
+        self.function_name = function_name
+
+
+class SchemaCompiler(object):
+    """
+    Compiles schema objects into validator functions.  Definitions are shared
+    by everything compiled with the same compiler, so a compiler should be
+    reused for all of the schemas of a given context.
+
+    Schemas are keyed by `get_schema_key`, so identical sub-schemas, wherever
+    they appear, are compiled to a single function.
+    """
+    def __init__(self, context):
+        self.context = context
+        self.namespace = {
+            'EMPTY': EMPTY,
+            'KINDS': KINDS,
+            'ValidationError': ValidationError,
+            'SafeNestedValidationError': SafeNestedValidationError,
+            'add_errors': add_errors,
+            'record_error': record_error,
+        }
+        self.source = []
+        self.counter = itertools.count()
+        self.nodes = {}
+        self.definitions = {}
+        self.raw_checks = {}
+        self.hits = 0
+        self.pending = collections.deque()
+        self.schema_keys = None
+        self.lock = threading.Lock()
+
+    def constant(self, value):
+        name = 'c{0}'.format(next(self.counter))
+        self.namespace[name] = value
+        return name
+
+    def compile(self, schema):
+        """
+        Return a validator function for the schema.  The returned function
+        raises the same errors as `validate_object` does when called with
+        `inner=True` and the validators from `construct_schema_validators`.
+
+        Compilation is serialized so a compiler may be shared between threads.
+        The returned functions do not hold any mutable state.
+        """
+        with self.lock:
+            # the keys of the sub-schemas are only reused within a compilation,
+            # as the schemas may be modified between compilations.
+            self.schema_keys = {}
+            try:
+                function_name = self.get_node(schema)
+                lines = []
+                while self.pending:
+                    lines.extend(self.generate_node(*self.pending.popleft()))
+                    lines.append('')
+            finally:
+                self.schema_keys = None
+            if lines:
+                source = '\n'.join(lines)
+                self.source.append(source)
+                six.exec_(compile(source, '<flex-schema-validator>', 'exec'), self.namespace)
+            return self.namespace[function_name]
+
+    @property
+    def stats(self):
+        """
+        The number of schemas that were compiled, how many distinct functions
+        they were compiled to, and how many shared an existing function.
+        """
+        return {
+            'schemas': self.hits + len(self.nodes),
+            'distinct': len(self.nodes),
+            'shared': self.hits,
+        }
+
+    def get_node(self, schema):
+        key = get_schema_key(schema, self.schema_keys)
+        if key in self.nodes:
+            self.hits += 1
+        else:
+            self.nodes[key] = 'validate_{0}'.format(next(self.counter))
+            self.pending.append((self.nodes[key], schema))
+        return self.nodes[key]
+
+    def get_definition(self, reference):
+        if reference not in self.definitions:
+            assert 'definitions' in self.context
+            assert reference in self.context['definitions']
+            self.definitions[reference] = self.get_node(self.context['definitions'][reference])
+        return self.definitions[reference]
+
+    def get_raw_checks(self, schema):
+        """
+        Mirrors the dictionary of validators that `construct_schema_validators`
+        returns for a schema, prior to any `$ref` being merged in.
+        """
+        key = get_schema_key(schema, self.schema_keys)
+        if key in self.raw_checks:
+            return self.raw_checks[key]
+
+        checks = collections.OrderedDict()
+        if '$ref' in schema:
+            checks['$ref'] = ReferenceCheck(self.get_definition(schema['$ref']))
+        for property_, property_schema in schema.get('properties', {}).items():
+            checks[property_] = PropertyCheck(property_, self.get_node(property_schema))
+        for key_ in schema:
+            if key_ == 'items':
+                checks[key_] = self.get_items_check(schema['items'])
+            elif key_ in validator_mapping:
+                checks[key_] = self.get_keyword_check(key_, schema)
+
+        self.raw_checks[key] = checks
+        return checks
+
+    def get_checks(self, schema):
+        """
+        The checks for a schema once any `$ref` has been merged in, the same
+        way `validate_object` merges the validators of a reference.
+        """
+        checks = self.get_raw_checks(schema)
+        if '$ref' not in checks:
+            return list(checks.values())
+        checks = collections.OrderedDict(checks)
+        reference = schema['$ref']
+        checks.pop('$ref')
+        definition = self.context['definitions'][reference]
+        for key, check in self.get_raw_checks(definition).items():
+            checks.setdefault(key, check)
+        return list(checks.values())
+
+    def get_items_check(self, items):
+        if isinstance(items, six.string_types):
+            return ItemsCheck([self.get_node({'$ref': items})], is_tuple=False)
+        elif isinstance(items, collections.Mapping):
+            return ItemsCheck([self.get_node(items)], is_tuple=False)
+        elif is_non_string_iterable(items):
+            return ItemsCheck(
+                [self.get_node(item) if isinstance(item, collections.Mapping)
+                 else self.get_node({'$ref': item}) for item in items],
+                is_tuple=True,
+            )
+        assert False, "Should not be possible"
+
+    def get_keyword_check(self, key, schema):
+        validator = self.constant(validator_mapping[key](context=self.context, **schema))
+        conditions = {}
+        empty = False
+
+        if key == 'type':
+            accepted = get_accepted_kinds(schema['type'])
+            conditions = dict((kind, True) for kind in KIND_ORDER if kind not in accepted)
+        elif key == 'format':
+            if schema['format'] in registry:
+                # Format validators only apply to values of the types the
+                # format was registered for.
+                accepted = get_accepted_kinds(registry.types[schema['format']])
+                conditions = dict((kind, True) for kind in accepted)
+        elif key == 'required':
+            empty = bool(schema['required'])
+        elif key == 'multipleOf':
+            conditions = dict((kind, True) for kind in NUMBER_KINDS)
+            divisor = schema['multipleOf']
+            if isinstance(divisor, six.integer_types) and not isinstance(divisor, bool) and divisor:
+                # Integer division is exact, so it is only the `number` kind
+                # which needs the decimal arithmetic of the validator.
+                conditions[INTEGER] = 'value % {0}'.format(self.constant(divisor))
+        elif key in ('minimum', 'maximum'):
+            if key == 'minimum':
+                operator_ = '>' if schema.get('exclusiveMinimum') else '>='
+            else:
+                operator_ = '<' if schema.get('exclusiveMaximum') else '<='
+            condition = 'not value {0} {1}'.format(operator_, self.constant(schema[key]))
+            conditions = dict((kind, condition) for kind in NUMBER_KINDS)
+        elif key in ('minLength', 'maxLength'):
+            operator_ = '<' if key == 'minLength' else '>'
+            conditions = {
+                STRING: 'len(value) {0} {1}'.format(operator_, self.constant(schema[key])),
+            }
+        elif key in ('minItems', 'maxItems'):
+            operator_ = '<' if key == 'minItems' else '>'
+            conditions = {
+                ARRAY: 'len(value) {0} {1}'.format(operator_, self.constant(schema[key])),
+            }
+        elif key in ('minProperties', 'maxProperties'):
+            operator_ = '<' if key == 'minProperties' else '>'
+            conditions = {
+                OBJECT: 'len(value) {0} {1}'.format(operator_, self.constant(schema[key])),
+            }
+        elif key == 'uniqueItems':
+            if schema['uniqueItems']:
+                conditions = {ARRAY: True}
+        elif key == 'pattern':
+            regex = self.constant(validator_mapping[key](**schema).keywords['regex'])
+            conditions = {STRING: 'not {0}.match(value)'.format(regex)}
+        elif key == 'enum':
+            options = set()
+            for option in schema['enum']:
+                try:
+                    options.add((type(option), option))
+                except TypeError:
+                    continue
+            options = self.constant(frozenset(options))
+            condition = '(type(value), value) not in {0}'.format(options)
+            conditions = dict(
+                (kind, condition) for kind in (NULL, BOOLEAN, INTEGER, NUMBER, STRING)
+            )
+            conditions.update({ARRAY: True, OBJECT: True})
+        else:
+            assert False, "Unknown keyword {0}".format(key)
+
+        return KeywordCheck(key, validator, conditions, empty=empty)
+
+    def generate_node(self, function_name, schema):
+        checks = self.get_checks(schema)
+        keyword_checks = [c for c in checks if isinstance(c, KeywordCheck)]
+        nested_checks = [c for c in checks if isinstance(c, (PropertyCheck, ItemsCheck))]
+        reference_checks = [c for c in checks if isinstance(c, ReferenceCheck)]
+
+        lines = [
+            'def {0}(value):'.format(function_name),
+            '    errors = None',
+            '    if value is EMPTY:',
+        ]
+        empty_lines = [
+            '        errors = record_error(errors, {0!r}, {1}, value)'.format(
+                str(check.key), check.validator,
+            )
+            for check in keyword_checks if check.empty
+        ]
+        lines.extend(empty_lines or ['        pass'])
+        lines.append('    else:')
+
+        if keyword_checks:
+            lines.append('        kind = KINDS.get(type(value))')
+            branch = 'if'
+            for kind in KIND_ORDER:
+                kind_lines = []
+                for check in keyword_checks:
+                    condition = check.conditions.get(kind)
+                    if condition is None:
+                        continue
+                    call = 'errors = record_error(errors, {0!r}, {1}, value)'.format(
+                        str(check.key), check.validator,
+                    )
+                    if condition is True:
+                        kind_lines.append('            ' + call)
+                    else:
+                        kind_lines.append('            if {0}:'.format(condition))
+                        kind_lines.append('                ' + call)
+                if kind_lines:
+                    lines.append('        {0} kind == {1!r}:'.format(branch, str(kind)))
+                    lines.extend(kind_lines)
+                    branch = 'elif'
+            # Anything that is not one of the known concrete types is handled
+            # by the regular validators.
+            lines.append('        {0} kind is None:'.format(branch))
+            for check in keyword_checks:
+                lines.append('            errors = record_error(errors, {0!r}, {1}, value)'.format(
+                    str(check.key), check.validator,
+                ))
+
+        for check in nested_checks:
+            if isinstance(check, PropertyCheck):
+                lines.extend([
+                    '        try:',
+                    '            {0}(value.get({1}, EMPTY))'.format(
+                        check.function_name, self.constant(check.key),
+                    ),
+                    '        except ValidationError as err:',
+                    '            errors = add_errors(errors, {0}, list(err.messages))'.format(
+                        self.constant(check.key),
+                    ),
+                ])
+            else:
+                lines.append('        item_errors = []')
+                if check.is_tuple:
+                    lines.append('        for item, item_validator in zip(value, ({0},)):'.format(
+                        ', '.join(check.function_names),
+                    ))
+                else:
+                    lines.append('        item_validator = {0}'.format(check.function_names[0]))
+                    lines.append('        for item in value:')
+                lines.extend([
+                    '            try:',
+                    '                item_validator(item)',
+                    '            except ValidationError as err:',
+                    '                item_errors.extend(err.messages)',
+                    '        if item_errors:',
+                    "            errors = add_errors(errors, 'items', item_errors)",
+                ])
+
+        if not keyword_checks and not nested_checks:
+            lines.append('        pass')
+
+        for check in reference_checks:
+            lines.extend([
+                '    try:',
+                '        {0}(value)'.format(check.function_name),
+                '    except ValidationError as err:',
+                "        errors = add_errors(errors, '$ref', list(err.messages))",
+            ])
+
+        lines.extend([
+            '    if errors:',
+            '        raise SafeNestedValidationError(errors)',
+        ])
+        return lines
+
+
+def compile_schema_validator(schema, context, compiler=None):
+    """
+    Return a compiled validator for the schema.  A `SchemaCompiler` may be
+    passed in to share compiled definitions between schemas of the same
+    context.
+    """
+    if compiler is None:
+        compiler = SchemaCompiler(context)
+    return compiler.compile(schema)
@@ -1,29 +1,24 @@
 import re
-import decimal
 import operator
 import functools
 import collections
-import itertools
 
 import six
 
-from django.core.exceptions import ValidationError
-from django.core.validators import (
-    MinLengthValidator,
-    MaxLengthValidator,
-)
-
+from flex.exceptions import ValidationError
 from flex.context_managers import ErrorCollection
 from flex.formats import registry
 from flex.utils import (
-    is_value_of_any_type,
     is_non_string_iterable,
+    get_known_types,
     get_type_for_value,
+    get_types_for_value,
     chain_reduce_partial,
     cast_value_to_type,
 )
 from flex.constants import (
     EMPTY,
+    INTEGER,
     NUMBER,
     STRING,
     ARRAY,
@@ -55,7 +50,7 @@ def validate_type(value, types):
     """
     Validate that the value is one of the provided primative types.
     """
-    if not is_value_of_any_type(value, types):
+    if get_types_for_value(value).isdisjoint(types):
         raise ValidationError(MESSAGES['type']['invalid'].format(
             repr(value), get_type_for_value(value), types,
         ))
@@ -70,6 +65,7 @@ def generate_type_validator(type_, **kwargs):
         types = type_
     else:
         types = (type_,)
+    get_known_types(types)
     return functools.partial(validate_type, types=types)
 
 
@@ -111,6 +107,13 @@ def validate_multiple_of(value, divisor):
     Given a value and a divisor, validate that the value is divisible by the
     divisor.
     """
+    import decimal
+
+    # integers are divided exactly, so only the remainder of other values, or
+    # a failed integer division, is checked with decimals.
+    if INTEGER in get_types_for_value(value) and INTEGER in get_types_for_value(divisor):
+        if divisor and not value % divisor:
+            return
     if not decimal.Decimal(str(value)) % decimal.Decimal(str(divisor)) == 0:
         raise ValidationError(
             MESSAGES['multiple_of']['invalid'].format(divisor, value),
@@ -177,18 +180,47 @@ def generate_maximum_validator(maximum, exclusiveMaximum=False, **kwargs):
     return functools.partial(validate_maximum, maximum=maximum, is_exclusive=exclusiveMaximum)
 
 
+def get_length_message(messages, limit, length):
+    key = 'invalid_singular' if limit == 1 else 'invalid'
+    return messages[key].format(limit, length)
+
+
+@skip_if_empty
+@skip_if_not_of_type(STRING)
+def validate_min_length(value, minimum):
+    """
+    Validator for STRING types to enforce a minimum length.
+    """
+    if len(value) < minimum:
+        raise ValidationError(
+            get_length_message(MESSAGES['min_length'], minimum, len(value)),
+        )
+
+
 def generate_min_length_validator(minLength, **kwargs):
     """
     Generates a validator for enforcing the minLength of a string.
     """
-    return skip_if_empty(skip_if_not_of_type(STRING)(MinLengthValidator(minLength).__call__))
+    return functools.partial(validate_min_length, minimum=minLength)
+
+
+@skip_if_empty
+@skip_if_not_of_type(STRING)
+def validate_max_length(value, maximum):
+    """
+    Validator for STRING types to enforce a maximum length.
+    """
+    if len(value) > maximum:
+        raise ValidationError(
+            get_length_message(MESSAGES['max_length'], maximum, len(value)),
+        )
 
 
 def generate_max_length_validator(maxLength, **kwargs):
     """
     Generates a validator for enforcing the maxLength of a string.
     """
-    return skip_if_empty(skip_if_not_of_type(STRING)(MaxLengthValidator(maxLength).__call__))
+    return functools.partial(validate_max_length, maximum=maxLength)
 
 
 @skip_if_empty
@@ -304,23 +336,97 @@ def generate_enum_validator(enum, **kwargs):
     return functools.partial(validate_enum, options=enum)
 
 
+def merge_reference_validators(validators):
+    """
+    Returns the validators with those of any `$ref` merged in.  Validators
+    declared alongside the `$ref` take precedence.  The validators passed in
+    are left untouched so that they can be safely shared between threads.
+    """
+    if '$ref' not in validators:
+        return validators
+    merged = dict(validators)
+    ref_ = merged.pop('$ref')
+    for k, v in ref_.validators.items():
+        merged.setdefault(k, v)
+    return merged
+
+
+class SchemaValidators(dict):
+    """
+    The dictionary of validators for a schema.  For each set of types that a
+    value is classified as, it also keeps the validators that apply to values
+    of those types, with those of any `$ref` merged in.  `validate_object`
+    can then classify each value once, rather than every validator checking
+    the type of the value for itself.  It must not be modified once it has
+    been used.
+    """
+    def __init__(self, *args, **kwargs):
+        super(SchemaValidators, self).__init__(*args, **kwargs)
+        self.dispatch = {}
+
+
+def get_applicable_types(validator):
+    """
+    The types of values that the validator applies to, as recorded by
+    `skip_if_not_of_type` and by the format registry, or `None` if it applies
+    to values of any type.
+    """
+    if isinstance(validator, functools.partial):
+        validator = validator.func
+    return getattr(validator, 'applicable_types', None)
+
+
+def get_validators_for_value(validators, value):
+    """
+    Returns the `(key, validator)` pairs of the validators, with those of any
+    `$ref` merged in, that apply to the value.  For `SchemaValidators` the
+    pairs are looked up by the types of the value.
+    """
+    dispatch = getattr(validators, 'dispatch', None)
+    if dispatch is None:
+        return merge_reference_validators(validators).items()
+
+    # every validator applies to an empty value.
+    value_types = None if value is EMPTY else get_types_for_value(value)
+    try:
+        return dispatch[value_types]
+    except KeyError:
+        pass
+    applicable = []
+    for key, validator in merge_reference_validators(validators).items():
+        types = get_applicable_types(validator)
+        if value_types is None or types is None or not types.isdisjoint(value_types):
+            applicable.append((key, validator))
+    dispatch[value_types] = applicable
+    return applicable
+
+
 def validate_object(obj, validators, inner=False):
     """
     Takes a mapping and applies a mapping of validator functions to it
     collecting and reraising any validation errors that occur.
     """
     with ErrorCollection(inner=inner) as errors:
-        if '$ref' in validators:
-            ref_ = validators.pop('$ref')
-            for k, v in ref_.validators.items():
-                validators.setdefault(k, v)
-        for key, validator in validators.items():
+        for key, validator in get_validators_for_value(validators, obj):
             try:
                 validator(obj)
             except ValidationError as err:
                 errors[key].extend(list(err.messages))
 
 
+def process_items(values, processors, tail_processor=None):
+    """
+    Applies each processor to the value at the same position, and
+    `tail_processor` to any values beyond the end of `processors`.  Values
+    without a processor are returned unchanged.
+    """
+    values = list(values)
+    processed = [processor(value) for processor, value in zip(processors, values)]
+    for value in values[len(processors):]:
+        processed.append(value if tail_processor is None else tail_processor(value))
+    return processed
+
+
 @suffix_reserved_words
 def generate_value_processor(type_, collectionFormat=None, items=None, **kwargs):
     """
@@ -345,26 +451,22 @@ def generate_value_processor(type_, collectionFormat=None, items=None, **kwargs)
             processors.append(functools.partial(map, operator.methodcaller('strip')))
             if items is not None:
                 if isinstance(items, collections.Mapping):
-                    items_processors = itertools.repeat(
-                        generate_value_processor(**items)
-                    )
+                    items_processors = ()
+                    tail_processor = generate_value_processor(**items)
                 elif isinstance(items, collections.Sequence):
-                    items_processors = itertools.chain(
-                        (generate_value_processor(**item) for item in items),
-                        itertools.repeat(lambda v: v),
+                    items_processors = tuple(
+                        generate_value_processor(**item) for item in items
                     )
+                    tail_processor = None
                 elif isinstance(items, six.string_types):
                     raise NotImplementedError("Not implemented")
                 else:
                     assert False, "Should not be possible"
-                # 1. zip the processor and the array items together
-                # 2. apply the processor to each array item.
-                # 3. cast the starmap generator to a list.
                 processors.append(
-                    chain_reduce_partial(
-                        functools.partial(zip, items_processors),
-                        functools.partial(itertools.starmap, lambda fn, v: fn(v)),
-                        list,
+                    functools.partial(
+                        process_items,
+                        processors=items_processors,
+                        tail_processor=tail_processor,
                     )
                 )
         else:
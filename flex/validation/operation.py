@@ -1,8 +1,7 @@
 import functools
 import operator
 
-from django.core.exceptions import ValidationError
-
+from flex.exceptions import ValidationError
 from flex.utils import chain_reduce_partial
 from flex.context_managers import ErrorCollection
 from flex.http import (
@@ -15,16 +14,24 @@ from flex.constants import (
     HEADER,
 )
 from flex.parameters import (
+    dereference_parameter_list,
     filter_parameters,
     merge_parameter_lists,
 )
+from flex.paths import (
+    path_to_regex,
+)
 from flex.validation.parameter import (
-    validate_path_parameters,
-    validate_query_parameters,
+    construct_multi_parameter_validators,
+    construct_parameter_value_processors,
+    normalize_query_data,
+    type_cast_parameter_values,
+    validate_parameter_values,
 )
 from flex.validation.header import (
     construct_header_validators,
 )
+from flex.validation.schema import get_schema_validator_cache
 from flex.validation.common import (
     validate_object,
     generate_value_processor,
@@ -71,29 +78,45 @@ def validate_request_parameters(request, validators):
                 errors[key].extend(list(err.messages))
 
 
+def get_raw_path_parameter_values(request, path_regex):
+    """
+    The raw values of the path parameters, as captured when the request path
+    was matched to its api path.  Requests that were not matched, such as
+    those validated against an operation directly, fall back to matching
+    `path_regex` against the request path.
+    """
+    if request.path_parameters is not None:
+        return request.path_parameters
+    return path_regex.match(request.path).groupdict()
+
+
 def generate_path_parameters_validator(api_path, path_parameters, context):
+    path_regex = path_to_regex(api_path, path_parameters)
+    path_parameter_processor = functools.partial(
+        type_cast_parameter_values,
+        processors=construct_parameter_value_processors(path_parameters, context),
+    )
     path_parameter_validator = functools.partial(
-        validate_path_parameters,
-        api_path=api_path,
-        path_parameters=path_parameters,
-        context=context,
+        validate_parameter_values,
+        validators=construct_multi_parameter_validators(path_parameters, context),
         inner=True,
     )
     return chain_reduce_partial(
-        operator.attrgetter('path'),
+        functools.partial(get_raw_path_parameter_values, path_regex=path_regex),
+        path_parameter_processor,
         path_parameter_validator,
     )
 
 
 def generate_query_parameters_validator(query_parameters, context):
     query_parameter_validator = functools.partial(
-        validate_query_parameters,
-        query_parameters=query_parameters,
-        context=context,
+        validate_parameter_values,
+        validators=construct_multi_parameter_validators(query_parameters, context),
         inner=True,
     )
     return chain_reduce_partial(
         operator.attrgetter('query_data'),
+        normalize_query_data,
         query_parameter_validator,
     )
 
@@ -132,8 +155,13 @@ def generate_parameters_validator(api_path, path_definition, parameters, context
     - TODO: request.formData against any form data.
     """
     validators = {}
-    path_level_parameters = path_definition.get('parameters', [])
-    operation_level_parameters = parameters
+    parameter_definitions = context.get('parameters', {})
+    path_level_parameters = dereference_parameter_list(
+        path_definition.get('parameters', []), parameter_definitions,
+    )
+    operation_level_parameters = dereference_parameter_list(
+        parameters, parameter_definitions,
+    )
 
     all_parameters = merge_parameter_lists(
         path_level_parameters,
@@ -205,3 +233,28 @@ def construct_operation_validators(api_path, path_definition, operation_definiti
         )
 
     return validators
+
+
+class OperationValidatorCache(dict):
+    """
+    Mapping of `(api_path, method)` to the validators for that operation as
+    returned by `construct_operation_validators`.  The validators for an
+    operation are constructed the first time they are requested and then
+    reused for all subsequent requests.
+    """
+    def __init__(self, paths, context):
+        super(OperationValidatorCache, self).__init__()
+        self.paths = paths
+        self.context = context
+        self.schema_validators = get_schema_validator_cache(context)
+
+    def __missing__(self, key):
+        api_path, method = key
+        path_definition = self.paths[api_path] or {}
+        validators = construct_operation_validators(
+            api_path=api_path,
+            path_definition=path_definition,
+            operation_definition=path_definition[method],
+            context=self.context,
+        )
+        return self.setdefault(key, validators)
@@ -1,7 +1,6 @@
 import functools
 
-from django.core.exceptions import ValidationError
-
+from flex.exceptions import ValidationError
 from flex.utils import is_non_string_iterable
 from flex.context_managers import ErrorCollection
 from flex.validation.common import (
@@ -25,24 +24,35 @@ from flex.validation.schema import (
     construct_schema_validators,
     generate_items_validator,
 )
-from flex.parameters import find_parameter
 from flex.paths import path_to_regex
 from flex.constants import EMPTY
 
 
-def type_cast_parameters(parameter_values, parameter_definitions, context):
+def construct_parameter_value_processors(parameter_definitions, context):
+    """
+    Constructs a dictionary of value processors, keyed by parameter name, for
+    type casting the raw string values of the provided parameters.
+    """
+    return {
+        parameter['name']: generate_value_processor(context=context, **parameter)
+        for parameter in parameter_definitions
+    }
+
+
+def type_cast_parameter_values(parameter_values, processors):
     typed_parameters = {}
-    for key in parameter_values.keys():
-        try:
-            parameter_definition = find_parameter(parameter_definitions, name=key)
-        except KeyError:
+    for key, value in parameter_values.items():
+        if key not in processors:
             continue
-        value = parameter_values[key]
-        value_processor = generate_value_processor(context=context, **parameter_definition)
-        typed_parameters[key] = value_processor(value)
+        typed_parameters[key] = processors[key](value)
     return typed_parameters
 
 
+def type_cast_parameters(parameter_values, parameter_definitions, context):
+    processors = construct_parameter_value_processors(parameter_definitions, context)
+    return type_cast_parameter_values(parameter_values, processors)
+
+
 def get_path_parameter_values(request_path, api_path, path_parameters, context):
     raw_values = path_to_regex(
         api_path,
@@ -61,19 +71,30 @@ def validate_path_parameters(request_path, api_path, path_parameters, context, i
     validate_parameters(parameter_values, path_parameters, context=context, inner=inner)
 
 
-def validate_query_parameters(raw_query_data, query_parameters, context, inner=False):
+def normalize_query_data(raw_query_data):
+    """
+    Unwrap the single item lists that `parse_qs` produces for query parameters
+    that only appear once.
+    """
     query_data = {}
     for key, value in raw_query_data.items():
         if is_non_string_iterable(value) and len(value) == 1:
             query_data[key] = value[0]
         else:
             query_data[key] = value
-    validate_parameters(query_data, query_parameters, context, inner=inner)
+    return query_data
 
 
-def validate_parameters(parameter_values, parameters, context, inner=False):
-    validators = construct_multi_parameter_validators(parameters, context=context)
+def validate_query_parameters(raw_query_data, query_parameters, context, inner=False):
+    query_data = normalize_query_data(raw_query_data)
+    validate_parameters(query_data, query_parameters, context, inner=inner)
+
 
+def validate_parameter_values(parameter_values, validators, inner=False):
+    """
+    Validate the parameter values against a dictionary of validators as
+    returned by `construct_multi_parameter_validators`.
+    """
     with ErrorCollection(inner=inner) as errors:
         # we should have a validator for every parameter value
         assert not set(parameter_values.keys()).difference(validators.keys())
@@ -85,6 +106,11 @@ def validate_parameters(parameter_values, parameters, context, inner=False):
                 errors[key].extend(list(err.messages))
 
 
+def validate_parameters(parameter_values, parameters, context, inner=False):
+    validators = construct_multi_parameter_validators(parameters, context=context)
+    validate_parameter_values(parameter_values, validators, inner=inner)
+
+
 def construct_parameter_validators(parameter, context):
     """
     Constructs a dictionary of validator functions for the provided parameter
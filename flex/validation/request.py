@@ -1,13 +1,16 @@
 import functools
 
-from django.core.exceptions import ValidationError
-
+from flex.exceptions import ValidationError
 from flex.utils import chain_reduce_partial
 from flex.context_managers import ErrorCollection
 from flex.paths import (
-    match_request_path_to_api_path,
+    PathMatchCache,
+    PathRouter,
+    get_operation_index,
+    match_request_path,
 )
 from flex.validation.operation import (
+    OperationValidatorCache,
     construct_operation_validators,
     validate_operation,
 )
@@ -16,20 +19,24 @@ from flex.constants import REQUEST_METHODS
 from flex.http import normalize_request
 
 
-def validate_request_to_path(request, paths, base_path, context):
+def validate_request_to_path(request, paths, base_path, context, router=None):
     """
     Given a request, check whether the path of the request matches any if the
     api paths.  Note that this does not do deep validation on the path
     parameters themselves, but only matches whether the request path *looks*
     like an api path.
 
-    If so, return the api path and the path definitions.
+    If so, return the api path and the path definitions.  The raw values of
+    the path parameters are stored as `request.path_parameters`, so that they
+    are validated without matching the request path again.
     """
+    request.path_parameters = None
     try:
-        api_path = match_request_path_to_api_path(
+        api_path, request.path_parameters = match_request_path(
             path_definitions=paths,
             request_path=request.path,
             base_path=base_path,
+            router=router,
         )
     except LookupError:
         raise ValidationError(MESSAGES['request']['unknown_path'])
@@ -38,14 +45,14 @@ def validate_request_to_path(request, paths, base_path, context):
     return api_path, path_definition
 
 
-def validate_request_method_to_operation(request, path_definition):
+def validate_request_method_to_operation(request, path_definition, method=None):
     """
     Given a request, validate that the request method is valid for the request
-    path.
+    path.  A `method` may be given in place of the method of the request.
 
     If so, return the operation related to this request method.
     """
-    method = request.method
+    method = method or request.method
     try:
         operation = path_definition[method]
     except KeyError:
@@ -58,28 +65,21 @@ def validate_request_method_to_operation(request, path_definition):
     return operation
 
 
-def validate_request(request, paths, base_path, context, inner=False):
+def validate_request_to_operation(request, api_path, path_definition, context,
+                                  method=None, operation_validators=None, inner=False):
     """
-    Request validation does the following steps.
+    Validate a request whose path has been matched to `api_path`.
 
-       1. validate that the path matches one of the defined paths in the schema.
        2. validate that the request method conforms to a supported methods for the given path.
        3. validate that the request parameters conform to the parameter
           definitions for the operation definition.
+
+    The operation is looked up by `method`, which defaults to the method of
+    the request.
     """
-    with ErrorCollection(inner=inner) as errors:
-        # 1
-        try:
-            api_path, path_definition = validate_request_to_path(
-                request=request,
-                paths=paths,
-                base_path=base_path,
-                context=context,
-            )
-        except ValidationError as err:
-            errors['path'].extend(list(err.messages))
-            return  # this causes an exception to be raised since errors is no longer falsy.
+    method = method or request.method
 
+    with ErrorCollection(inner=inner) as errors:
         if not path_definition:
             # TODO: is it valid to not have a definition for a path?
             return
@@ -89,6 +89,7 @@ def validate_request(request, paths, base_path, context, inner=False):
             operation_definition = validate_request_method_to_operation(
                 request=request,
                 path_definition=path_definition,
+                method=method,
             )
         except ValidationError as err:
             errors['method'].append(err.message)
@@ -100,29 +101,133 @@ def validate_request(request, paths, base_path, context, inner=False):
             return
 
         # 3
-        operation_validators = construct_operation_validators(
-            api_path=api_path,
-            path_definition=path_definition,
-            operation_definition=operation_definition,
-            context=context,
-        )
+        if operation_validators is None:
+            validators = construct_operation_validators(
+                api_path=api_path,
+                path_definition=path_definition,
+                operation_definition=operation_definition,
+                context=context,
+            )
+        else:
+            validators = operation_validators[api_path, method]
         try:
-            validate_operation(request, operation_validators, inner=True)
+            validate_operation(request, validators, inner=True)
         except ValidationError as err:
             errors['method'].append(err.messages)
 
     return operation_definition
 
 
-def generate_request_validator(schema, **kwargs):
+def validate_request(request, paths, base_path, context, inner=False, router=None,
+                     operation_validators=None):
+    """
+    Request validation does the following steps.
+
+       1. validate that the path matches one of the defined paths in the schema.
+       2. validate that the request method conforms to a supported methods for the given path.
+       3. validate that the request parameters conform to the parameter
+          definitions for the operation definition.
+
+    If an `OperationValidatorCache` is provided as `operation_validators` the
+    validators for each operation are only constructed once.
+    """
+    with ErrorCollection(inner=inner) as errors:
+        # 1
+        try:
+            api_path, path_definition = validate_request_to_path(
+                request=request,
+                paths=paths,
+                base_path=base_path,
+                context=context,
+                router=router,
+            )
+        except ValidationError as err:
+            errors['path'].extend(list(err.messages))
+            return  # this causes an exception to be raised since errors is no longer falsy.
+
+    return validate_request_to_operation(
+        request,
+        api_path=api_path,
+        path_definition=path_definition,
+        context=context,
+        operation_validators=operation_validators,
+        inner=inner,
+    )
+
+
+def validate_resolved_request(request, paths, context, operation_index=None,
+                              operation_id=None, api_path=None, method=None,
+                              path_parameters=None, operation_validators=None,
+                              inner=False):
+    """
+    Validate a request whose route has already been resolved, for example by
+    the router of a web framework, without parsing or matching its path.
+
+    The operation is given either as an `operation_id`, which is looked up in
+    `operation_index` as returned by `get_operation_index`, or as an
+    `api_path` and `method`.  `path_parameters` are the values of the path
+    parameters that the route extracted from the request path.
+    """
+    request = normalize_request(request)
+
+    with ErrorCollection(inner=inner) as errors:
+        if operation_id is not None:
+            try:
+                api_path, method = operation_index[operation_id]
+            except (KeyError, TypeError):
+                errors['operation'].append(
+                    MESSAGES['request']['unknown_operation'].format(operation_id),
+                )
+                return
+        if api_path not in paths:
+            errors['path'].append(MESSAGES['request']['unknown_path'])
+            return
+
+    request.path_parameters = dict(path_parameters or {})
+    return validate_request_to_operation(
+        request,
+        api_path=api_path,
+        path_definition=paths[api_path] or {},
+        context=context,
+        method=method and method.lower(),
+        operation_validators=operation_validators,
+        inner=inner,
+    )
+
+
+def generate_request_validator(schema, router=PathRouter, **kwargs):
+    """
+    Returns a function which validates requests against `schema`.  `router`
+    is the class used to index the api paths of the schema, either
+    `PathRouter` or `RegexPathRouter`.
+    """
     request_validator = functools.partial(
         validate_request,
         paths=schema['paths'],
         base_path=schema.get('basePath', ''),
         context=schema,
+        router=PathMatchCache(router(schema['paths'])),
+        operation_validators=OperationValidatorCache(schema['paths'], context=schema),
         **kwargs
     )
     return chain_reduce_partial(
         normalize_request,
         request_validator,
     )
+
+
+def generate_resolved_request_validator(schema, **kwargs):
+    """
+    Returns a function which validates requests that were already routed, as
+    `validator(request, operation_id=...)` or
+    `validator(request, api_path=..., method=..., path_parameters=...)`.  See
+    `validate_resolved_request`.
+    """
+    return functools.partial(
+        validate_resolved_request,
+        paths=schema['paths'],
+        context=schema,
+        operation_index=get_operation_index(schema['paths']),
+        operation_validators=OperationValidatorCache(schema['paths'], context=schema),
+        **kwargs
+    )
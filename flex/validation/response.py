@@ -1,15 +1,19 @@
 import functools
 import operator
 
-from django.core.exceptions import ValidationError
-
+from flex.exceptions import ValidationError
 from flex.utils import chain_reduce_partial
 from flex.context_managers import ErrorCollection
 from flex.validation.common import validate_object
-from flex.validation.schema import construct_schema_validators
+from flex.validation.schema import (
+    construct_schema_validators,
+    get_schema_validator_cache,
+)
+from flex.validation.codegen import SchemaCompiler
 from flex.error_messages import MESSAGES
 from flex.constants import (
     EMPTY,
+    REQUEST_METHODS,
 )
 from flex.validation.header import (
     construct_header_validators,
@@ -37,7 +41,16 @@ def validate_status_code_to_response_definition(response, operation_definition):
     return response_definition
 
 
-def generate_response_body_validator(schema, context, **kwargs):
+def generate_response_body_validator(schema, context, compiler=None, **kwargs):
+    """
+    If a `SchemaCompiler` is provided the body schema is compiled to python
+    source rather than validated with `validate_object`.
+    """
+    if compiler is not None:
+        return chain_reduce_partial(
+            operator.attrgetter('data'),
+            compiler.compile(schema),
+        )
     validators = construct_schema_validators(schema, context=context)
     return chain_reduce_partial(
         operator.attrgetter('data'),
@@ -77,11 +90,13 @@ validator_mapping = {
 }
 
 
-def generate_response_validator(response_definition, context):
+def generate_response_validator(response_definition, context, compiler=None):
     validators = {}
     for key in validator_mapping:
         if key in response_definition:
-            validators[key] = validator_mapping[key](context=context, **response_definition)
+            validators[key] = validator_mapping[key](
+                context=context, compiler=compiler, **response_definition
+            )
 
     return functools.partial(
         validate_object,
@@ -107,7 +122,69 @@ def generate_response_content_type_validator(produces, **kwargs):
     )
 
 
-def validate_response(response, operation_definition, context, inner=False):
+def generate_operation_content_type_validator(operation_definition, context):
+    return generate_response_content_type_validator(
+        # TODO: this is a messy way to default to the global produces.
+        produces=operation_definition.get('produces', context.get('produces', [])),
+    )
+
+
+class ResponseValidatorCache(object):
+    """
+    Memoizes the compiled response validators for the operations of a schema,
+    keyed by operation and status code, as well as the content type validator
+    for each operation's `produces`.  Validators are constructed the first time
+    they are needed.
+
+    Operation definitions are dictionaries so they are looked up by identity.
+    Only operations that belong to `context` are cached, anything else falls
+    back to constructing the validators on every call.
+
+    With `compiled=True` the response body schemas are compiled to python
+    source by a `SchemaCompiler` shared across the whole cache.
+    """
+    def __init__(self, context, compiled=False):
+        self.context = context
+        self.compiler = SchemaCompiler(context) if compiled else None
+        self.schema_validators = get_schema_validator_cache(context)
+        self.operations = {}
+        for path_definition in context.get('paths', {}).values():
+            for method, operation_definition in (path_definition or {}).items():
+                if method in REQUEST_METHODS and operation_definition is not None:
+                    self.operations[id(operation_definition)] = operation_definition
+        self.response_validators = {}
+        self.content_type_validators = {}
+
+    def is_cacheable(self, operation_definition):
+        return self.operations.get(id(operation_definition)) is operation_definition
+
+    def get_response_validator(self, operation_definition, status_code):
+        key = (id(operation_definition), status_code)
+        if key not in self.response_validators:
+            validator = generate_response_validator(
+                operation_definition['responses'][status_code],
+                context=self.context,
+                compiler=self.compiler,
+            )
+            if not self.is_cacheable(operation_definition):
+                return validator
+            self.response_validators.setdefault(key, validator)
+        return self.response_validators[key]
+
+    def get_content_type_validator(self, operation_definition):
+        key = id(operation_definition)
+        if key not in self.content_type_validators:
+            validator = generate_operation_content_type_validator(
+                operation_definition, context=self.context,
+            )
+            if not self.is_cacheable(operation_definition):
+                return validator
+            self.content_type_validators.setdefault(key, validator)
+        return self.content_type_validators[key]
+
+
+def validate_response(response, operation_definition, context, response_validators=None,
+                      inner=False):
     """
     Response validation involves the following steps.
        4. validate that the response status_code is in the allowed responses for
@@ -115,6 +192,9 @@ def validate_response(response, operation_definition, context, inner=False):
        5. validate that the response content validates against any provided
           schemas for the responses.
        6. headers, content-types, etc..., ???
+
+    If a `ResponseValidatorCache` is provided as `response_validators` the
+    validators for each response are only constructed once.
     """
     with ErrorCollection(inner=inner) as errors:
         # 4
@@ -127,20 +207,29 @@ def validate_response(response, operation_definition, context, inner=False):
             errors['status_code'].append(err.message)
         else:
             # 5
-            response_validator = generate_response_validator(
-                response_definition,
-                context=context,
-            )
+            if response_validators is None:
+                response_validator = generate_response_validator(
+                    response_definition,
+                    context=context,
+                )
+            else:
+                response_validator = response_validators.get_response_validator(
+                    operation_definition, response.status_code,
+                )
             try:
                 response_validator(response)
             except ValidationError as err:
                 errors['body'].extend(err.messages)
 
         # TODO: this should be merged with `response_body_validator`.
-        response_content_type_validator = generate_response_content_type_validator(
-            # TODO: this is a messy way to default to the global produces.
-            produces=operation_definition.get('produces', context.get('produces', [])),
-        )
+        if response_validators is None:
+            response_content_type_validator = generate_operation_content_type_validator(
+                operation_definition, context=context,
+            )
+        else:
+            response_content_type_validator = response_validators.get_content_type_validator(
+                operation_definition,
+            )
         try:
             response_content_type_validator(response)
         except ValidationError as err:
@@ -148,3 +237,18 @@ def validate_response(response, operation_definition, context, inner=False):
 
         # 6
         # TODO
+
+
+def generate_operation_response_validator(schema, **kwargs):
+    """
+    Returns a function which validates the responses to the operations of
+    `schema`, as `validator(response, operation_definition=...)`.  The
+    validators for each operation and status code are constructed once, by a
+    `ResponseValidatorCache`.
+    """
+    return functools.partial(
+        validate_response,
+        context=schema,
+        response_validators=ResponseValidatorCache(schema),
+        **kwargs
+    )
@@ -1,12 +1,15 @@
 import itertools
 import collections
 import functools
+import threading
+import weakref
 
 import six
 
-from django.core.exceptions import ValidationError
-
-from flex.exceptions import SafeNestedValidationError
+from flex.exceptions import (
+    SafeNestedValidationError,
+    ValidationError,
+)
 from flex.constants import (
     OBJECT,
     EMPTY,
@@ -28,6 +31,7 @@ from flex.validation.common import (
     generate_pattern_validator,
     generate_enum_validator,
     validate_object,
+    SchemaValidators,
 )
 
 
@@ -61,56 +65,67 @@ def generate_max_properties_validator(maxProperties, **kwargs):
     return functools.partial(validate_max_properties, maximum=maxProperties)
 
 
-def construct_items_validators(items, context):
+def construct_items_validators(items, context, schema_keys=None):
     if isinstance(items, collections.Mapping):
         items_validators = construct_schema_validators(
             items,
             context,
+            schema_keys=schema_keys,
         )
     elif isinstance(items, six.string_types):
         items_validators = {
-            '$ref': LazyReferenceValidator(items, context),
+            '$ref': get_reference_validator(items, context),
         }
     else:
         assert 'Should not be possible'
     return items_validators
 
 
-def validate_items(objs, validators):
+def validate_item(obj, validators, errors):
+    try:
+        validate_object(obj, validators, inner=True)
+    except ValidationError as e:
+        errors.extend(list(e.messages))
+
+
+@skip_if_empty
+def validate_items(objs, validators, tail_validators=None):
+    """
+    Validates each item against the validator dictionary at the same position
+    in `validators`.  Any items beyond the end of `validators` are validated
+    against `tail_validators`, or always validate if it is `None`.
+    """
     errors = []
     for obj, validator in zip(objs, validators):
-        try:
-            validate_object(obj, validator, inner=True)
-        except ValidationError as e:
-            errors.extend(list(e.messages))
+        validate_item(obj, validator, errors)
+    if tail_validators is not None:
+        for obj in itertools.islice(objs, len(validators), None):
+            validate_item(obj, tail_validators, errors)
 
     if errors:
         raise SafeNestedValidationError(errors)
 
 
-def generate_items_validator(items, context, **kwargs):
+def generate_items_validator(items, context, schema_keys=None, **kwargs):
     if isinstance(items, collections.Mapping) or isinstance(items, six.string_types):
-        # If items is a reference or a schema, we pass it through as an
-        # ever repeating list of the same validation dictionary, thus
-        # validating all of the objects against the same schema.
-        items_validators = itertools.repeat(construct_items_validators(
-            items,
-            context,
-        ))
+        # If items is a reference or a schema, all of the objects are
+        # validated against the same validation dictionary.
+        items_validators = ()
+        tail_validators = construct_items_validators(items, context, schema_keys)
     elif isinstance(items, collections.Sequence):
-        # We generate a list of validator dictionaries and then chain it
-        # with an empty schema that repeats forever.  This ensures that if
-        # the array of objects to be validated is longer than the array of
-        # validators, then the extra elements will always validate since
-        # they will be validated against an empty schema.
-        items_validators = itertools.chain(
-            map(functools.partial(construct_items_validators, context=context), items),
-            itertools.repeat({}),
+        # We generate a tuple of validator dictionaries, one for each
+        # position.  If the array of objects to be validated is longer than
+        # the tuple of validators, the extra elements always validate.
+        items_validators = tuple(
+            construct_items_validators(item, context, schema_keys) for item in items
         )
+        tail_validators = None
     else:
         assert "Should not be possible"
     return functools.partial(
-        validate_items, validators=items_validators,
+        validate_items,
+        validators=items_validators,
+        tail_validators=tail_validators,
     )
 
 
@@ -146,7 +161,8 @@ class LazyReferenceValidator(object):
     infinite recursion error when a schema references itself, or there is a
     reference loop between more than one schema.
 
-    The validator is only constructed if validator is needed.
+    The validator is only constructed if validator is needed, and is then
+    reused for all subsequent validation.
     """
     def __init__(self, reference, context):
         # TODO: something better than this assertion
@@ -154,25 +170,176 @@ class LazyReferenceValidator(object):
         assert reference in context['definitions']
         self.reference = reference
         self.context = context
+        # Keeps the shared validators of the context alive for as long as
+        # anything refers to one of its definitions.
+        self.schema_validators = get_schema_validator_cache(context)
+        self._validators = None
+        self._lock = threading.Lock()
 
     def __call__(self, value):
         return validate_object(value, self.validators, inner=True)
 
     @property
     def validators(self):
-        return construct_schema_validators(
-            self.context['definitions'][self.reference],
-            self.context,
-        )
+        if self._validators is None:
+            with self._lock:
+                if self._validators is None:
+                    self._validators = construct_schema_validators(
+                        self.context['definitions'][self.reference],
+                        self.context,
+                    )
+        return self._validators
 
     def items(self):
         return self.validators.items()
 
 
-def construct_schema_validators(schema, context):
+# Registry of the reference validators that are currently in use, keyed by
+# `(id(context), reference)`.  Each `LazyReferenceValidator` holds a reference
+# to its context, so a context's id cannot be reused while an entry for it
+# exists.
+REFERENCE_VALIDATORS = weakref.WeakValueDictionary()
+REFERENCE_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_reference_validator(reference, context):
+    """
+    Return the `LazyReferenceValidator` for the given reference.  The same
+    validator is shared by every reference to a definition within a context so
+    that each definition is only compiled once.
+    """
+    key = (id(context), reference)
+    with REFERENCE_VALIDATORS_LOCK:
+        validator = REFERENCE_VALIDATORS.get(key)
+        if validator is None:
+            validator = LazyReferenceValidator(reference, context)
+            REFERENCE_VALIDATORS[key] = validator
+    return validator
+
+
+def get_schema_key(value, schema_keys=None):
+    """
+    Returns a hashable canonical form of a schema, which is equal for two
+    schemas only if they validate in exactly the same way.  The type of each
+    value is part of its key since, for example, an `enum` of `[1]` does not
+    accept `True`.
+
+    `schema_keys` is a dictionary in which the key of each container within
+    `value` is stored by its id, so that walking a schema and each of its
+    sub-schemas in turn computes the key of every container only once.  The
+    containers are stored along with their keys so that their ids cannot be
+    reused while the dictionary is in use.
+    """
+    if schema_keys is not None and id(value) in schema_keys:
+        return schema_keys[id(value)][1]
+
+    if isinstance(value, collections.Mapping):
+        items = []
+        for key, item in value.items():
+            items.append((key, get_schema_key(item, schema_keys)))
+        schema_key = (dict, frozenset(items))
+    elif isinstance(value, (list, tuple)):
+        items = []
+        for item in value:
+            items.append(get_schema_key(item, schema_keys))
+        schema_key = (type(value), tuple(items))
+    else:
+        return (type(value), value)
+
+    if schema_keys is not None:
+        schema_keys[id(value)] = (value, schema_key)
+    return schema_key
+
+
+class SchemaValidatorCache(object):
+    """
+    The validators constructed for the schemas of a context, keyed by
+    `get_schema_key`, so that every copy of an identical sub-schema shares a
+    single dictionary of validators.
+
+    `hits` counts the schemas whose validators were shared and `misses` those
+    that had to be constructed.
+
+    Schema validators only depend on the `definitions` of their context, so a
+    cache may be shared by contexts with identical definitions, see
+    `share_schema_validator_cache`.
+    """
+    def __init__(self, context):
+        self.context = context
+        self.contexts = [context]
+        self.validators = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            validators = self.validators.get(key)
+            if validators is not None:
+                self.hits += 1
+            return validators
+
+    def add(self, key, validators):
+        with self.lock:
+            self.misses += 1
+            return self.validators.setdefault(key, validators)
+
+    @property
+    def stats(self):
+        return {
+            'schemas': self.hits + self.misses,
+            'distinct': len(self.validators),
+            'shared': self.hits,
+        }
+
+
+# Registry of the validator caches that are currently in use, keyed by
+# `id(context)`.  Like the reference validators, each cache holds its contexts
+# so that their ids cannot be reused while the cache exists.  Caches are kept
+# alive by the reference validators and the request and response validator
+# caches of their context.
+SCHEMA_VALIDATOR_CACHES = weakref.WeakValueDictionary()
+SCHEMA_VALIDATOR_CACHES_LOCK = threading.Lock()
+
+
+def get_schema_validator_cache(context):
+    """
+    Return the `SchemaValidatorCache` for the context.
+    """
+    key = id(context)
+    with SCHEMA_VALIDATOR_CACHES_LOCK:
+        cache = SCHEMA_VALIDATOR_CACHES.get(key)
+        if cache is None:
+            cache = SchemaValidatorCache(context)
+            SCHEMA_VALIDATOR_CACHES[key] = cache
+    return cache
+
+
+def share_schema_validator_cache(context, cache):
+    """
+    Use `cache` for the schemas of `context`, which must have the same
+    definitions as the contexts already using it.  Returns the cache that is
+    used for the context, which is the existing one if the context already
+    has a cache.
+    """
+    key = id(context)
+    with SCHEMA_VALIDATOR_CACHES_LOCK:
+        existing = SCHEMA_VALIDATOR_CACHES.get(key)
+        if existing is not None:
+            return existing
+        with cache.lock:
+            cache.contexts.append(context)
+        SCHEMA_VALIDATOR_CACHES[key] = cache
+    return cache
+
+
+def construct_schema_validators(schema, context, schema_keys=None):
     """
     Given a schema object, construct a dictionary of validators needed to
-    validate a response matching the given schema.
+    validate a response matching the given schema.  Identical schemas within a
+    context share one dictionary of validators, which must not be modified.
+    `schema_keys` is passed on to `get_schema_key` by the recursive calls for
+    the sub-schemas.
 
     Special Cases:
         - $ref:
@@ -185,9 +352,17 @@ def construct_schema_validators(schema, context):
             need recurse back into this function to generate a dictionary of
             validators for the property.
     """
-    validators = {}
+    if schema_keys is None:
+        schema_keys = {}
+    cache = get_schema_validator_cache(context)
+    schema_key = get_schema_key(schema, schema_keys)
+    validators = cache.get(schema_key)
+    if validators is not None:
+        return validators
+
+    validators = SchemaValidators()
     if '$ref' in schema:
-        validators['$ref'] = LazyReferenceValidator(
+        validators['$ref'] = get_reference_validator(
             schema['$ref'],
             context,
         )
@@ -200,6 +375,7 @@ def construct_schema_validators(schema, context):
             property_validators = construct_schema_validators(
                 property_schema,
                 context,
+                schema_keys=schema_keys,
             )
             validators[property_] = functools.partial(
                 validate_properties,
@@ -209,5 +385,7 @@ def construct_schema_validators(schema, context):
     assert 'context' not in schema
     for key in schema:
         if key in validator_mapping:
-            validators[key] = validator_mapping[key](context=context, **schema)
-    return validators
+            validators[key] = validator_mapping[key](
+                context=context, schema_keys=schema_keys, **schema
+            )
+    return cache.add(schema_key, validators)
@@ -0,0 +1,172 @@
+from __future__ import unicode_literals
+
+import json
+
+import pytest
+
+from flex.compact import compact_schema
+from flex.core import (
+    load,
+    validate_api_call,
+)
+from flex.constants import (
+    ARRAY,
+    INTEGER,
+    OBJECT,
+    STRING,
+)
+
+from tests.factories import (
+    RequestFactory,
+    ResponseFactory,
+)
+
+
+def get_schema():
+    return load({
+        'swagger': '2.0',
+        'info': {
+            'title': 'Test API',
+            'version': '0.0.1',
+            'description': 'An API',
+            'termsOfService': 'None',
+        },
+        'produces': ['application/json'],
+        'tags': [{'name': 'pets', 'description': 'Pets'}],
+        'definitions': {
+            'Pet': {
+                'type': OBJECT,
+                'properties': {
+                    'name': {'type': STRING, 'minLength': 1},
+                    'description': {'type': STRING},
+                    'kind': {'type': STRING, 'enum': ['cat', 'dog'], 'default': 'dog'},
+                    'size': {'type': ARRAY, 'enum': [[1, 2]]},
+                },
+            },
+        },
+        'paths': {
+            '/pets/{id}': {
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'type': INTEGER, 'required': True,
+                     'description': 'The id'},
+                ],
+                'get': {
+                    'summary': 'Get a pet',
+                    'description': 'Gets a pet',
+                    'tags': ['pets'],
+                    'responses': {
+                        200: {
+                            'description': 'Success',
+                            'schema': {'$ref': 'Pet'},
+                            'headers': {'X-Rate': {'type': INTEGER, 'description': 'Rate'}},
+                        },
+                    },
+                },
+            },
+        },
+    })
+
+
+def test_documentation_is_dropped():
+    schema = compact_schema(get_schema())
+
+    assert schema['info'] == {'title': 'Test API', 'version': '0.0.1'}
+    assert schema['tags'] == [{'name': 'pets'}]
+    parameter = schema['paths']['/pets/{id}']['parameters'][0]
+    assert 'description' not in parameter
+    operation = schema['paths']['/pets/{id}']['get']
+    assert 'summary' not in operation
+    assert 'description' not in operation
+    assert operation['responses'][200] == {
+        'schema': {'$ref': 'Pet'},
+        'headers': {'X-Rate': {'type': INTEGER, 'collectionFormat': 'csv'}},
+    }
+
+
+def test_names_and_data_are_kept():
+    schema = compact_schema(get_schema())
+
+    properties = schema['definitions']['Pet']['properties']
+    assert properties['description'] == {'type': STRING}
+    assert properties['kind']['enum'] == ['cat', 'dog']
+    assert properties['size']['enum'] == [[1, 2]]
+    assert properties['kind']['default'] == 'dog'
+
+
+def test_structural_lists_are_kept():
+    schema = compact_schema(get_schema())
+
+    assert schema['produces'] == ['application/json']
+    assert isinstance(schema['paths']['/pets/{id}']['parameters'], list)
+    assert schema['paths']['/pets/{id}']['get']['tags'] == ['pets']
+
+
+def test_strings_are_interned():
+    strings = {}
+    first = compact_schema(get_schema(), strings=strings)
+    second = compact_schema(get_schema(), strings=strings)
+
+    properties = first['definitions']['Pet']['properties']
+    assert properties['name']['type'] is properties['kind']['type']
+    assert first['produces'][0] is second['produces'][0]
+
+
+def test_original_schema_is_not_modified():
+    schema = get_schema()
+
+    compact_schema(schema)
+
+    assert schema['paths']['/pets/{id}']['get']['description'] == 'Gets a pet'
+
+
+def test_load_compact():
+    schema = load(json.dumps({
+        'swagger': '2.0',
+        'info': {'title': 'Test API', 'description': 'An API'},
+        'paths': {},
+    }), compact=True)
+
+    assert schema['info'] == {'title': 'Test API'}
+
+
+@pytest.mark.parametrize(
+    'content,valid',
+    (
+        ({'name': 'Fido', 'kind': 'dog', 'size': [1, 2]}, True),
+        ({'name': 'Fido', 'kind': 'fish'}, False),
+        ({'name': 'Fido', 'kind': 'dog', 'size': [3]}, False),
+        ({'name': ''}, False),
+    ),
+)
+def test_validation_with_compact_schema(content, valid):
+    schema = compact_schema(get_schema())
+    request = RequestFactory(url='http://www.example.com/pets/1')
+    response = ResponseFactory(request=request, content=json.dumps(content))
+
+    if valid:
+        validate_api_call(schema, request=request, response=response)
+    else:
+        with pytest.raises(ValueError):
+            validate_api_call(schema, request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    'content,quoted',
+    (
+        ({'name': 'Fido', 'age': 'old'}, 'null'),
+        ({'name': 'Fido', 'kind': 'fish'}, 'dog'),
+    ),
+)
+def test_compact_schema_errors_match_full_schema(content, quoted):
+    raw_schema = get_schema()
+    raw_schema['definitions']['Pet']['properties']['age'] = {'type': [INTEGER, 'null']}
+    request = RequestFactory(url='http://www.example.com/pets/1')
+    response = ResponseFactory(request=request, content=json.dumps(content))
+
+    with pytest.raises(ValueError) as full_err:
+        validate_api_call(raw_schema, request=request, response=response)
+    with pytest.raises(ValueError) as compact_err:
+        validate_api_call(compact_schema(raw_schema), request=request, response=response)
+
+    assert str(compact_err.value) == str(full_err.value)
+    assert quoted in str(full_err.value)
@@ -37,6 +37,19 @@ def test_type_enforcement_detects_invalid_types(v):
     fn(v)
 
 
+def test_type_enforcement_passes_empty_values():
+    @skip_if_not_of_type(NUMBER)
+    def fn(value):
+        return True
+
+    assert fn(EMPTY) is True
+
+
+def test_type_enforcement_rejects_unknown_types():
+    with pytest.raises(ValueError):
+        skip_if_not_of_type(NUMBER, 'not-a-type')
+
+
 #
 # rewrite_reserved_words tests
 #
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from flex.exceptions import ValidationError
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_single_message():
+    err = ValidationError('Invalid value')
+
+    assert err.message == 'Invalid value'
+    assert err.messages == ['Invalid value']
+
+
+def test_message_with_params():
+    err = ValidationError('%(value)s is invalid', params={'value': 3})
+
+    assert err.messages == ['3 is invalid']
+
+
+def test_list_of_messages():
+    err = ValidationError(['first', ValidationError('second')])
+
+    assert err.messages == ['first', 'second']
+
+
+def test_dictionary_of_messages():
+    err = ValidationError({'name': ['required'], 'type': 'unknown'})
+
+    assert err.message_dict == {'name': ['required'], 'type': ['unknown']}
+    assert sorted(err.messages) == ['required', 'unknown']
+
+
+def test_stand_in_without_django():
+    """
+    The tests above use django's `ValidationError` when it is installed, so
+    the stand-in is checked again with django hidden.
+    """
+    script = textwrap.dedent("""
+        import sys
+        sys.modules['django'] = None
+
+        from flex.exceptions import ValidationError
+
+        err = ValidationError('Invalid value')
+        assert err.message == 'Invalid value', err.message
+        assert err.messages == ['Invalid value']
+
+        err = ValidationError('%(value)s is invalid', params={'value': 3})
+        assert err.messages == ['3 is invalid']
+
+        err = ValidationError(['first', ValidationError('second')])
+        assert err.messages == ['first', 'second']
+
+        err = ValidationError({'name': ['required'], 'type': 'unknown'})
+        assert err.message_dict == {'name': ['required'], 'type': ['unknown']}
+    """)
+    subprocess.check_call([sys.executable, '-c', script], cwd=ROOT)
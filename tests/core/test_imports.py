@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LAZY_MODULES = (
+    'requests',
+    'yaml',
+    'rfc3987',
+    'iso8601',
+    'validate_email',
+    'tempfile',
+)
+
+
+def run_python(script):
+    subprocess.check_call([sys.executable, '-c', textwrap.dedent(script)], cwd=ROOT)
+
+
+def test_import_does_not_import_optional_dependencies():
+    run_python("""
+        import sys
+        import flex
+
+        loaded = [name for name in {0!r} if name in sys.modules]
+        assert not loaded, loaded
+    """.format(LAZY_MODULES))
+
+
+@pytest.mark.parametrize(
+    'statement,module',
+    (
+        ("flex.load('swagger: \"2.0\"')", 'yaml'),
+        ("registry['uri']('http://www.example.com')", 'rfc3987'),
+        ("registry['date-time']('2011-10-18T10:29:47+03:00')", 'iso8601'),
+    ),
+)
+def test_dependencies_are_imported_on_first_use(statement, module):
+    run_python("""
+        import sys
+        import flex
+        from flex.formats import registry
+
+        try:
+            {0}
+        except ValueError:
+            pass
+        assert {1!r} in sys.modules
+    """.format(statement, module))
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+import flex
+from flex import core
+from flex.cache import get_cache_key
+
+
+def get_raw_schema(**kwargs):
+    return dict(
+        swagger='2.0',
+        info={'title': 'Test API', 'version': '0.0.1'},
+        paths={
+            '/get/{id}': {
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'type': 'integer', 'required': True},
+                ],
+                'get': {
+                    'responses': {200: {'description': 'Success'}},
+                },
+            },
+        },
+        **kwargs
+    )
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse = core.parse
+
+    def counting_parse(raw_schema, **kwargs):
+        calls.append(raw_schema)
+        return parse(raw_schema, **kwargs)
+
+    monkeypatch.setattr(core, 'parse', counting_parse)
+    return calls
+
+
+def test_cached_schema_skips_validation(tmpdir, parse_calls):
+    cache_dir = str(tmpdir)
+    raw_schema = get_raw_schema()
+
+    schema = core.load(raw_schema, cache_dir=cache_dir)
+    cached_schema = core.load(raw_schema, cache_dir=cache_dir)
+
+    assert len(parse_calls) == 1
+    assert cached_schema == schema
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_changed_source_is_validated_again(tmpdir, parse_calls):
+    cache_dir = str(tmpdir)
+
+    core.load(get_raw_schema(), cache_dir=cache_dir)
+    schema = core.load(get_raw_schema(basePath='/v2'), cache_dir=cache_dir)
+
+    assert len(parse_calls) == 2
+    assert schema['basePath'] == '/v2'
+
+
+def test_invalid_schema_is_not_cached(tmpdir):
+    cache_dir = str(tmpdir)
+    raw_schema = get_raw_schema(basePath='not-a-path')
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            core.load(raw_schema, cache_dir=cache_dir)
+
+    assert not os.listdir(cache_dir)
+
+
+def test_cache_key_includes_flex_version(monkeypatch):
+    raw_schema = get_raw_schema()
+    key = get_cache_key(raw_schema)
+
+    assert get_cache_key(get_raw_schema()) == key
+
+    monkeypatch.setattr(flex, 'VERSION', '0.0.0')
+    assert get_cache_key(raw_schema) != key
+
+
+@pytest.mark.parametrize(
+    'left,right',
+    (
+        ({'x': {}}, {'x': []}),
+        ({'x': {'a': 1}}, {'x': [['a', 1]]}),
+        ({'x': ['a']}, {'x': ('a',)}),
+        ({'x': [1]}, {'x': ['1']}),
+    ),
+)
+def test_different_schemas_have_different_keys(left, right):
+    assert get_cache_key(left) != get_cache_key(right)
+
+
+def test_corrupt_cache_entry_is_replaced(tmpdir, parse_calls):
+    cache_dir = str(tmpdir)
+    raw_schema = get_raw_schema()
+    cache_path = os.path.join(cache_dir, '{0}.pickle'.format(get_cache_key(raw_schema)))
+
+    with open(cache_path, 'wb') as cache_file:
+        cache_file.write(b'not a pickle')
+
+    schema = core.load(raw_schema, cache_dir=cache_dir)
+    assert core.load(raw_schema, cache_dir=cache_dir) == schema
+    assert len(parse_calls) == 1
+
+
+def test_unwritable_cache_dir_is_ignored(tmpdir):
+    not_a_directory = tmpdir.join('file')
+    not_a_directory.write('')
+
+    schema = core.load(get_raw_schema(), cache_dir=str(not_a_directory))
+
+    assert '/get/{id}' in schema['paths']
@@ -0,0 +1,362 @@
+import collections
+import functools
+import json
+import os
+import threading
+
+import pytest
+from six.moves import BaseHTTPServer
+from six.moves import SimpleHTTPServer
+from six.moves import socketserver as SocketServer
+
+from flex.core import (
+    load,
+    validate,
+)
+from flex.exceptions import ValidationError
+from flex.references import (
+    DocumentCache,
+    resolve_pointer,
+    resolve_references,
+)
+from flex.validation.request import validate_request
+
+from tests.factories import RequestFactory
+
+
+def get_raw_schema(schema, **kwargs):
+    kwargs.setdefault('swagger', '2.0')
+    kwargs.setdefault('info', {'title': 'Test API', 'version': '0.0.1'})
+    kwargs.setdefault('paths', {
+        '/pets': {
+            'get': {
+                'responses': {'200': {'description': 'Success', 'schema': schema}},
+            },
+        },
+    })
+    return kwargs
+
+
+def write_json(path, value):
+    with open(str(path), 'w') as json_file:
+        json.dump(value, json_file)
+    return str(path)
+
+
+@pytest.fixture
+def spec_dir(tmpdir):
+    """
+    A root schema referencing definitions in `pets.json`, which references
+    `common/tags.json`, which references `pets.json` in turn.
+    """
+    tmpdir.mkdir('common')
+    write_json(tmpdir.join('common', 'tags.json'), {
+        'definitions': {
+            'Tag': {
+                'type': 'object',
+                'properties': {
+                    'name': {'type': 'string'},
+                    'pets': {'type': 'array', 'items': {'$ref': '../pets.json#/definitions/Pet'}},
+                },
+            },
+        },
+    })
+    write_json(tmpdir.join('pets.json'), {
+        'definitions': {
+            'Pet': {
+                'type': 'object',
+                'required': ['name'],
+                'properties': {
+                    'name': {'$ref': 'Name'},
+                    'tag': {'$ref': 'common/tags.json#/definitions/Tag'},
+                },
+            },
+            'Name': {'type': 'string', 'minLength': 1},
+        },
+    })
+    write_json(
+        tmpdir.join('swagger.json'),
+        get_raw_schema({'$ref': 'pets.json#/definitions/Pet'}),
+    )
+    return tmpdir
+
+
+def test_references_to_other_files_are_added_to_definitions(spec_dir):
+    schema = load(str(spec_dir.join('swagger.json')))
+
+    assert set(schema['definitions']) == set([
+        'pets.json#/definitions/Pet',
+        'pets.json#/definitions/Name',
+        'common/tags.json#/definitions/Tag',
+    ])
+    response_schema = schema['paths']['/pets']['get']['responses']['200']['schema']
+    assert response_schema == {'$ref': 'pets.json#/definitions/Pet'}
+
+    pet = schema['definitions']['pets.json#/definitions/Pet']
+    assert pet['properties']['name'] == {'$ref': 'pets.json#/definitions/Name'}
+    tag = schema['definitions']['common/tags.json#/definitions/Tag']
+    assert tag['properties']['pets']['items'] == {'$ref': 'pets.json#/definitions/Pet'}
+
+
+def test_keys_do_not_depend_on_where_the_schema_is_stored(spec_dir, tmpdir_factory):
+    other_dir = tmpdir_factory.mktemp('other')
+    spec_dir.copy(other_dir)
+
+    schema = load(str(spec_dir.join('swagger.json')))
+    other_schema = load(str(other_dir.join('swagger.json')))
+
+    assert schema['definitions'] == other_schema['definitions']
+    assert str(spec_dir) not in json.dumps(schema)
+
+
+def test_resolved_references_are_validated(spec_dir):
+    schema = load(str(spec_dir.join('swagger.json')))
+    response_schema = schema['paths']['/pets']['get']['responses']['200']['schema']
+
+    validate(
+        response_schema, {'name': 'Fido', 'tag': {'pets': [{'name': 'Rex'}]}}, context=schema,
+    )
+
+    with pytest.raises(ValueError) as err:
+        validate(
+            response_schema, {'name': 'Fido', 'tag': {'pets': [{'name': ''}]}}, context=schema,
+        )
+
+    assert 'minLength' in str(err.value)
+
+
+def test_references_are_relative_to_the_working_directory(spec_dir, monkeypatch):
+    monkeypatch.chdir(str(spec_dir))
+
+    schema = load(get_raw_schema({'$ref': 'pets.json#/definitions/Name'}))
+
+    assert 'pets.json#/definitions/Name' in schema['definitions']
+
+
+def test_each_document_is_loaded_once(spec_dir, monkeypatch):
+    documents = DocumentCache()
+    loaded = collections.Counter()
+    load_document = documents.load
+
+    def counting_load(uri):
+        loaded[uri] += 1
+        return load_document(uri)
+
+    monkeypatch.setattr(documents, 'load', counting_load)
+
+    load(str(spec_dir.join('swagger.json')), documents=documents)
+    load(str(spec_dir.join('swagger.json')), documents=documents)
+
+    assert loaded == {
+        str(spec_dir.join('pets.json')): 1,
+        str(spec_dir.join('common', 'tags.json')): 1,
+    }
+
+
+def test_schema_without_external_references_is_unchanged():
+    raw_schema = get_raw_schema({'$ref': 'Pet'}, definitions={'Pet': {'type': 'object'}})
+
+    assert resolve_references(raw_schema, os.getcwd()) is raw_schema
+
+
+def test_original_schema_is_not_modified(spec_dir):
+    raw_schema = get_raw_schema({'$ref': 'pets.json#/definitions/Name'})
+
+    resolve_references(raw_schema, str(spec_dir.join('swagger.json')))
+
+    assert 'definitions' not in raw_schema
+
+
+def test_missing_document(tmpdir):
+    with pytest.raises(ValueError) as err:
+        load(get_raw_schema({'$ref': str(tmpdir.join('missing.json#/definitions/Pet'))}))
+
+    assert 'missing.json' in str(err.value)
+
+
+def test_missing_definition(spec_dir):
+    with pytest.raises(ValueError) as err:
+        load(get_raw_schema({'$ref': str(spec_dir.join('pets.json#/definitions/Cat'))}))
+
+    assert 'Unable to resolve reference' in str(err.value)
+
+
+def test_references_in_data_are_not_resolved(spec_dir):
+    literal = {'$ref': 'pets.json#/definitions/Pet'}
+    raw_schema = get_raw_schema({
+        '$ref': 'pets.json#/definitions/Name',
+        'enum': [literal],
+        'default': literal,
+        'example': literal,
+        'x-link': literal,
+    })
+
+    schema = resolve_references(raw_schema, str(spec_dir.join('swagger.json')))
+
+    response_schema = schema['paths']['/pets']['get']['responses']['200']['schema']
+    assert response_schema['$ref'] == 'pets.json#/definitions/Name'
+    for key in ('default', 'example', 'x-link'):
+        assert response_schema[key] == literal
+    assert response_schema['enum'] == [literal]
+    assert set(schema['definitions']) == set(['pets.json#/definitions/Name'])
+
+
+def test_schema_with_references_only_in_data_is_unchanged(spec_dir):
+    raw_schema = get_raw_schema({
+        'type': 'object',
+        'example': {'$ref': 'pets.json#/definitions/Pet'},
+    })
+
+    assert resolve_references(raw_schema, str(spec_dir.join('swagger.json'))) is raw_schema
+
+
+def test_properties_named_like_data_keywords_are_resolved(spec_dir):
+    raw_schema = get_raw_schema({
+        'type': 'object',
+        'properties': {'default': {'$ref': 'pets.json#/definitions/Name'}},
+    })
+
+    schema = resolve_references(raw_schema, str(spec_dir.join('swagger.json')))
+
+    assert 'pets.json#/definitions/Name' in schema['definitions']
+
+
+def test_references_to_parameters_in_other_files(spec_dir):
+    write_json(spec_dir.join('parameters.json'), {
+        'parameters': {
+            'limit': {
+                'name': 'limit',
+                'in': 'query',
+                'type': 'integer',
+                'maximum': 100,
+            },
+        },
+    })
+    raw_schema = get_raw_schema(None, paths={
+        '/pets': {
+            'get': {
+                'parameters': [{'$ref': 'parameters.json#/parameters/limit'}],
+                'responses': {'200': {'description': 'Success'}},
+            },
+        },
+    })
+
+    schema = load(write_json(spec_dir.join('swagger.json'), raw_schema))
+
+    key = 'parameters.json#/parameters/limit'
+    assert set(schema['parameters']) == set([key])
+    assert schema['parameters'][key]['maximum'] == 100
+    assert key not in schema['definitions']
+    assert schema['paths']['/pets']['get']['parameters'] == [key]
+
+    request = RequestFactory(url='http://www.example.com/pets?limit=abc')
+    with pytest.raises(ValidationError) as err:
+        validate_request(
+            request, paths=schema['paths'], base_path='', context=schema, inner=True,
+        )
+    query_errors = err.value.messages[0]['method'][0][0]['parameters'][0]['query'][0]
+    assert 'limit' in query_errors
+
+
+def test_references_to_responses_in_other_files_are_rejected(spec_dir):
+    raw_schema = get_raw_schema(None, paths={
+        '/pets': {
+            'get': {
+                'responses': {'200': {'$ref': 'responses.json#/responses/Success'}},
+            },
+        },
+    })
+
+    with pytest.raises(ValueError) as err:
+        resolve_references(raw_schema, str(spec_dir.join('swagger.json')))
+
+    assert 'responses.json#/responses/Success' in str(err.value)
+    assert 'responses may only be referenced' in str(err.value)
+
+
+@pytest.mark.parametrize(
+    'pointer,expected',
+    (
+        ('', {'a/b': [1, {'c~d': 2}]}),
+        ('/a~1b', [1, {'c~d': 2}]),
+        ('/a~1b/0', 1),
+        ('/a~1b/1/c~0d', 2),
+        ('/a%7E1b/0', 1),
+    ),
+)
+def test_resolve_pointer(pointer, expected):
+    assert resolve_pointer({'a/b': [1, {'c~d': 2}]}, pointer) == expected
+
+
+@pytest.fixture
+def spec_server(spec_dir):
+    """
+    Serves `spec_dir` over http, recording the paths that were requested.
+    """
+    requests = collections.Counter()
+
+    class Handler(SimpleHTTPServer.SimpleHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def translate_path(self, path):
+            requests[path] += 1
+            return str(spec_dir.join(path.lstrip('/')))
+
+        def log_message(self, *args):
+            pass
+
+    class Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+        daemon_threads = True
+
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    server.url = functools.partial('http://127.0.0.1:{0}/{1}'.format, server.server_port)
+    server.requests = requests
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_references_over_http(spec_server):
+    documents = DocumentCache()
+
+    schema = load(spec_server.url('swagger.json'), documents=documents)
+    load(spec_server.url('swagger.json'), documents=documents)
+
+    assert set(schema['definitions']) == set([
+        'pets.json#/definitions/Pet',
+        'pets.json#/definitions/Name',
+        'common/tags.json#/definitions/Tag',
+    ])
+    assert spec_server.requests['/pets.json'] == 1
+    assert spec_server.requests['/common/tags.json'] == 1
+
+
+def test_independent_documents_are_loaded_concurrently(tmpdir, monkeypatch):
+    names = ('a', 'b', 'c')
+    for name in names:
+        write_json(tmpdir.join('{0}.json'.format(name)), {'type': 'string'})
+    raw_schema = get_raw_schema({
+        'allOf': [{'$ref': '{0}.json#'.format(name)} for name in names],
+    })
+
+    documents = DocumentCache()
+    load_document = documents.load
+    started = []
+    all_started = threading.Event()
+
+    def waiting_load(uri):
+        # finishes only once every document has started loading.
+        started.append(uri)
+        if len(started) == len(names):
+            all_started.set()
+        all_started.wait(5)
+        return load_document(uri)
+
+    monkeypatch.setattr(documents, 'load', waiting_load)
+
+    resolve_references(raw_schema, str(tmpdir.join('swagger.json')), documents=documents)
+
+    assert all_started.is_set()
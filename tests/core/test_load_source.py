@@ -3,12 +3,16 @@ from __future__ import unicode_literals
 import tempfile
 import collections
 
+import pytest
 import six
 
 import json
 import yaml
 
-from flex.core import load_source
+from flex.core import (
+    get_source_format,
+    load_source,
+)
 
 
 def test_native_mapping_is_passthrough():
@@ -108,3 +112,41 @@ def test_url(httpbin):
     result.pop('headers')
     result.pop('url')
     assert result == native
+
+
+@pytest.mark.parametrize(
+    'raw_source,kwargs,expected',
+    (
+        ('{"foo": "bar"}', {}, 'json'),
+        ('\n  [1, 2]', {}, 'json'),
+        (b'{"foo": "bar"}', {}, 'json'),
+        ('foo: bar', {}, 'yaml'),
+        ('{"foo": "bar"}', {'name': 'schema.yaml'}, 'yaml'),
+        ('foo: bar', {'name': '/path/to/schema.JSON'}, 'json'),
+        ('foo: bar', {'name': 'schema.yml'}, 'yaml'),
+        ('foo: bar', {'name': 'schema.txt'}, 'yaml'),
+        ('foo: bar', {'content_type': 'application/json; charset=utf-8'}, 'json'),
+        ('{"foo": "bar"}', {'content_type': 'application/x-yaml'}, 'yaml'),
+        ('{"foo": "bar"}', {'content_type': 'text/plain'}, 'json'),
+    ),
+)
+def test_get_source_format(raw_source, kwargs, expected):
+    assert get_source_format(raw_source, **kwargs) == expected
+
+
+def test_yaml_string_is_not_parsed_as_json(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML sources should not be parsed as JSON")
+
+    monkeypatch.setattr(json, 'loads', fail)
+
+    assert load_source('foo: bar') == {'foo': 'bar'}
+
+
+def test_yaml_flow_mapping_that_is_not_json():
+    assert load_source('{foo: bar}') == {'foo': 'bar'}
+
+
+def test_yaml_python_object_tags_are_not_loaded():
+    with pytest.raises(ValueError):
+        load_source('!!python/object/apply:os.getcwd []')
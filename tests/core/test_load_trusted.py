@@ -0,0 +1,224 @@
+import copy
+import os
+
+import pytest
+
+from flex import core
+from flex.meta.fields import (
+    Field,
+    ObjectField,
+)
+
+
+EXAMPLE_SCHEMA = os.path.join(
+    os.path.dirname(__file__), 'example_schemas', 'api-with-examples.yaml',
+)
+
+
+def get_raw_schema(**kwargs):
+    kwargs.setdefault('swagger', '2.0')
+    kwargs.setdefault('info', {'title': 'Test API', 'version': '0.0.1'})
+    kwargs.setdefault('paths', {
+        '/get/{id}': {
+            'parameters': [
+                {'name': 'id', 'in': 'path', 'type': 'integer', 'required': True},
+            ],
+            'get': {
+                'responses': {200: {'description': 'Success'}},
+            },
+        },
+    })
+    return kwargs
+
+
+RAW_SCHEMAS = (
+    get_raw_schema(),
+    get_raw_schema(
+        host='api.example.com',
+        basePath='/v1',
+        schemes=['https'],
+        consumes=['application/json'],
+        produces=['application/json'],
+        tags=[{'name': 'pets', 'x-extension': True}],
+        externalDocs='http://docs.example.com',
+        **{'x-extension': {'ignored': True}}
+    ),
+    get_raw_schema(definitions={
+        'Pet': {
+            'type': 'object',
+            'required': ['id'],
+            'description': 'Not a declared field.',
+            'properties': {
+                'id': {'type': 'integer', 'minimum': 0, 'maximum': 100},
+                'name': {'type': 'string', 'minLength': 1, 'pattern': '^[a-z]+$'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}, 'uniqueItems': True},
+                'kind': 'Kind',
+                'empty': None,
+            },
+        },
+        'Kind': {'type': 'string', 'enum': ['cat', 'dog']},
+        'Pets': {'type': 'array', 'items': 'Pet'},
+        'PetList': {'type': 'array', 'items': ['Pet', {'type': 'integer'}]},
+        'Matrix': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'integer'}}},
+        'Named': {'allOf': [{'$ref': 'Pet'}, 'Kind']},
+    }),
+    get_raw_schema(
+        definitions={'Pet': {'type': 'object'}},
+        parameters={
+            'page': {'name': 'page', 'in': 'query', 'type': 'integer', 'default': 1},
+            'ids': {
+                'name': 'ids', 'in': 'query', 'type': 'array', 'items': {'type': 'integer'},
+                'collectionFormat': 'multi',
+            },
+        },
+        responses={
+            'NotFound': {
+                'description': 'Not found',
+                'schema': 'Pet',
+                'headers': {'X-Rate-Limit': {'type': 'integer'}},
+            },
+        },
+        securityDefinitions={
+            'api_key': {'type': 'apiKey', 'name': 'api_key', 'in': 'header'},
+            'basic': {'type': 'basic', 'description': 'Basic auth'},
+        },
+        security={'api_key': 'api_key'},
+    ),
+    get_raw_schema(
+        definitions={'Pet': {'type': 'object'}},
+        parameters={
+            'page': {'name': 'page', 'in': 'query', 'type': 'integer'},
+        },
+        paths={
+            '/pets/{id}': {
+                'parameters': ['page'],
+                'get': {
+                    'operationId': 'getPet',
+                    'deprecated': 'false',
+                    'tags': ['pets'],
+                    'parameters': [
+                        {'name': 'id', 'in': 'path', 'type': 'integer', 'required': 'true'},
+                        {
+                            'name': 'body', 'in': 'body',
+                            'schema': {'type': 'array', 'items': 'Pet'},
+                        },
+                        {
+                            'name': 'tags', 'in': 'query', 'type': 'array',
+                            'items': {'type': 'string', 'minLength': 1},
+                        },
+                    ],
+                    'responses': {
+                        200: {
+                            'description': 'Success',
+                            'schema': {
+                                'type': 'object',
+                                'properties': {
+                                    'pet': {'$ref': 'Pet'},
+                                    'others': {'type': 'array', 'items': {'$ref': 'Pet'}},
+                                },
+                                'allOf': [{'type': 'object', 'minProperties': 1}],
+                            },
+                            'headers': {
+                                'X-Total': {'type': 'integer', 'minimum': 0},
+                                'X-Ids': {'type': 'array', 'items': {'type': 'integer'}},
+                            },
+                        },
+                        'default': {'description': 'Error'},
+                    },
+                },
+                'delete': None,
+            },
+            '/empty': None,
+        },
+    ),
+)
+
+
+@pytest.mark.parametrize('raw_schema', RAW_SCHEMAS)
+def test_trusted_load_matches_validated_load(raw_schema):
+    assert core.load(copy.deepcopy(raw_schema), trusted=True) == core.load(raw_schema)
+
+
+def test_trusted_load_of_example_schema():
+    assert core.load(EXAMPLE_SCHEMA, trusted=True) == core.load(EXAMPLE_SCHEMA)
+
+
+@pytest.mark.parametrize(
+    'raw_schema',
+    (
+        get_raw_schema(paths={
+            '/get/{id}': {
+                'parameters': [{'name': 'id', 'in': 'path', 'type': 'integer'}],
+            },
+        }),
+        get_raw_schema(definitions={'Pet': {'type': 'string', 'minimum': 0}}),
+        get_raw_schema(host='http://api.example.com'),
+    ),
+)
+def test_trusted_load_skips_validation(raw_schema):
+    with pytest.raises(ValueError):
+        core.load(copy.deepcopy(raw_schema))
+
+    schema = core.load(raw_schema, trusted=True)
+
+    assert 'paths' in schema
+
+
+def test_trusted_load_skips_spec_checks(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Trusted schemas should not be checked against the spec")
+
+    monkeypatch.setattr(Field, 'validate', fail)
+    monkeypatch.setattr(Field, 'run_validators', fail)
+    monkeypatch.setattr(ObjectField, 'validate', fail)
+
+    for raw_schema in RAW_SCHEMAS:
+        schema = core.load(copy.deepcopy(raw_schema), trusted=True)
+
+        assert 'paths' in schema
+
+
+def test_trusted_load_does_not_populate_cache(tmpdir):
+    cache_dir = str(tmpdir)
+
+    core.load(get_raw_schema(), cache_dir=cache_dir, trusted=True)
+    assert not os.listdir(cache_dir)
+
+    schema = core.load(get_raw_schema(), cache_dir=cache_dir)
+    assert core.load(get_raw_schema(), cache_dir=cache_dir, trusted=True) == schema
+
+
+@pytest.mark.parametrize(
+    'raw_schema,message',
+    (
+        ('[1, 2]', 'Invalid data'),
+        ({'swagger': '2.0'}, 'This field is required.'),
+        (get_raw_schema(paths={'/get': []}), 'Invalid data'),
+        (get_raw_schema(paths={'/get': {'get': 'operation'}}), 'Invalid data'),
+        (
+            get_raw_schema(paths={'/get': {'parameters': {'name': 'id'}}}),
+            'Expected a list of items.',
+        ),
+        (
+            get_raw_schema(paths={'/get': {'parameters': [{'name': 'id'}]}}),
+            'This field is required.',
+        ),
+        (
+            get_raw_schema(paths={'/get': {'parameters': ['page']}}),
+            'Unknown reference `page`',
+        ),
+        (
+            get_raw_schema(definitions={'Pets': {'type': 'array', 'items': 'Pet'}}),
+            'Unknown references',
+        ),
+        (
+            get_raw_schema(definitions={'Pet': {'minLength': 'long'}}),
+            'Enter a whole number.',
+        ),
+    ),
+)
+def test_trusted_load_structural_errors(raw_schema, message):
+    with pytest.raises(ValueError) as err:
+        core.load(raw_schema, trusted=True)
+
+    assert message in str(err.value)
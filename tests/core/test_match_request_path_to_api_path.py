@@ -49,7 +49,7 @@ def test_regex_character_escaping(input_, expected):
 
 def test_path_to_pattern_with_single_parameter():
     input_ = '/get/{id}'
-    expected = '^/get/(?P<id>.+)$'
+    expected = '^/get/(?P<id>[^/]+)$'
 
     serializer = ParameterSerializer(
         data=[{
@@ -69,7 +69,7 @@ def test_path_to_pattern_with_single_parameter():
 
 def test_path_to_pattern_with_multiple_parameters():
     input_ = '/get/{first_id}/then/{second_id}/'
-    expected = '^/get/(?P<first_id>.+)/then/(?P<second_id>.+)/$'
+    expected = '^/get/(?P<first_id>[^/]+)/then/(?P<second_id>[^/]+)/$'
 
     serializer = ParameterSerializer(
         data=[
@@ -0,0 +1,214 @@
+import copy
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from flex.core import (
+    load_source,
+    parse,
+)
+from flex.meta.fields import Context
+from flex.meta.core import SwaggerField
+from flex.meta.definitions import (
+    SwaggerDefinitionsField,
+    get_reference_index,
+)
+from flex.serializers.core import SwaggerSerializer
+from flex.serializers.definitions import SwaggerDefinitionsSerializer
+
+
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(DIR))
+
+
+def get_raw_schema(**kwargs):
+    kwargs.setdefault('swagger', '2.0')
+    kwargs.setdefault('info', {'title': 'Test API', 'version': '0.0.1'})
+    kwargs.setdefault('paths', {
+        '/get/{id}': {
+            'parameters': [
+                {'name': 'id', 'in': 'path', 'type': 'integer', 'required': True},
+            ],
+            'get': {
+                'responses': {200: {'description': 'Success'}},
+            },
+        },
+    })
+    return kwargs
+
+
+def serializer_parse(raw_schema):
+    """
+    Parse a schema with the serializers, returning the stage that failed and
+    the errors, or the parsed schema.
+    """
+    definitions_serializer = SwaggerDefinitionsSerializer(data=raw_schema)
+    if not definitions_serializer.is_valid():
+        return 'definitions', definitions_serializer.errors
+    swagger_serializer = SwaggerSerializer(
+        definitions_serializer.object,
+        data=raw_schema,
+        context=definitions_serializer.object,
+    )
+    if not swagger_serializer.is_valid():
+        return 'swagger', swagger_serializer.errors
+    return 'valid', swagger_serializer.object
+
+
+def native_parse(raw_schema):
+    swagger_definitions, errors = SwaggerDefinitionsField().from_native(
+        raw_schema, Context(),
+    )
+    if errors:
+        return 'definitions', errors
+    swagger, errors = SwaggerField().from_native(raw_schema, Context(swagger_definitions))
+    if errors:
+        return 'swagger', errors
+    swagger_definitions.update(swagger)
+    return 'valid', swagger_definitions
+
+
+RAW_SCHEMAS = (
+    get_raw_schema(),
+    get_raw_schema(swagger='1.2'),
+    get_raw_schema(info={}),
+    get_raw_schema(info=None),
+    get_raw_schema(host='http://api.example.com', basePath='v1', schemes=['gopher']),
+    get_raw_schema(consumes='application/json', produces=['not a mimetype']),
+    get_raw_schema(tags=[{'name': 'pets'}, {'description': 'No name'}]),
+    get_raw_schema(tags={'name': 'pets'}),
+    get_raw_schema(security={'api_key': 'api_key'}),
+    get_raw_schema(definitions=[]),
+    get_raw_schema(definitions={
+        'Pet': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'minimum': 0, 'multipleOf': -1},
+                'name': {'type': 'string', 'maxItems': 3, 'format': 'unknown'},
+                'kind': 'Kind',
+                'tags': {'type': 'array', 'items': 'Tag'},
+            },
+        },
+        'Named': {'allOf': [{'$ref': 'Pet'}, 'Name']},
+        'Items': {'type': 'array', 'items': [1]},
+        'Flag': {'type': 'boolean', 'exclusiveMinimum': True, 'enum': None},
+    }),
+    get_raw_schema(parameters={
+        'page': {'name': 'page', 'in': 'query', 'type': 'integer', 'default': 'one'},
+        'ids': {'name': 'ids', 'in': 'header', 'type': 'array', 'collectionFormat': 'multi'},
+        'body': {'name': 'body', 'in': 'body', 'schema': 'Missing'},
+        'where': {'name': 'where', 'in': 'nowhere'},
+    }),
+    get_raw_schema(
+        definitions={'Pet': {'type': 'object'}},
+        responses={
+            'NotFound': {
+                'schema': 'Pet',
+                'headers': {
+                    'X-Ids': {'type': 'array'},
+                    'X-Rate-Limit': {'type': 'object', 'default': 'many'},
+                },
+            },
+        },
+    ),
+    get_raw_schema(securityDefinitions={
+        'api_key': {'type': 'apiKey'},
+        'oauth': {'type': 'oath2', 'flow': 'accessCode', 'scopes': {'read': ''}},
+        'other': {'type': 'unknown', 'in': 'cookie'},
+    }),
+    get_raw_schema(paths={
+        '/pets/{id}': {
+            'parameters': ['page', {'name': 'id', 'in': 'path', 'type': 'integer'}],
+            'get': {
+                'parameters': [{'name': 'other', 'in': 'path', 'type': 'string'}],
+                'responses': {200: {'schema': {'$ref': 'Pet'}}},
+                'security': {'api_key': 'unknown'},
+            },
+            'post': None,
+        },
+        '/empty': None,
+        '/things': [],
+    }),
+    get_raw_schema(paths={
+        '/pets': {
+            'get': {
+                'tags': 'pets',
+                'deprecated': 'maybe',
+                'parameters': {'name': 'id'},
+            },
+        },
+    }),
+)
+
+
+@pytest.mark.parametrize('raw_schema', RAW_SCHEMAS)
+def test_serializers_match_native_meta_validation(raw_schema):
+    native = native_parse(copy.deepcopy(raw_schema))
+    expected = serializer_parse(copy.deepcopy(raw_schema))
+
+    assert native == expected
+
+
+@pytest.mark.parametrize(
+    'path',
+    (
+        os.path.join(DIR, 'example_schemas', 'api-with-examples.yaml'),
+        os.path.join(DIR, 'example_schemas', 'petstore.yaml'),
+        os.path.join(DIR, 'example_schemas', 'petstore-expanded.yaml'),
+        os.path.join(DIR, 'example_schemas', 'uber.yaml'),
+        os.path.join(ROOT, 'tests', 'schemas', 'httpbin.yaml'),
+        os.path.join(ROOT, 'tests', 'schemas', 'cli-test-invalid-schema.yaml'),
+    ),
+)
+def test_serializers_match_native_meta_validation_of_example_schemas(path):
+    raw_schema = load_source(path)
+
+    native = native_parse(copy.deepcopy(raw_schema))
+    expected = serializer_parse(copy.deepcopy(raw_schema))
+
+    assert native == expected
+
+
+def test_get_reference_index():
+    reference_index = get_reference_index({
+        'definitions': {'Pet': {}, 'page': {}},
+        'parameters': {'page': {}},
+        'responses': None,
+        'securityDefinitions': {'api_key': {}},
+    })
+
+    assert sorted(reference_index) == ['Pet', 'api_key', 'page']
+    assert sorted(reference_index['page']) == ['definitions', 'parameters']
+
+
+def test_parse_returns_native_result():
+    assert parse(get_raw_schema()) == native_parse(get_raw_schema())[1]
+
+
+def test_import_without_django():
+    script = textwrap.dedent("""
+        import sys
+        sys.modules['django'] = None
+        sys.modules['rest_framework'] = None
+
+        import flex
+        from flex.core import validate
+
+        schema = flex.load({
+            'swagger': '2.0',
+            'info': {'title': 'Test API'},
+            'paths': {'/get': {'get': {'responses': {200: {'description': 'OK'}}}}},
+        })
+        assert '/get' in schema['paths']
+
+        try:
+            validate({'type': 'string', 'minLength': 3}, 'ab')
+        except ValueError as err:
+            assert 'at least 3 characters' in str(err)
+        else:
+            raise AssertionError('Expected validation to fail')
+    """)
+    subprocess.check_call([sys.executable, '-c', script], cwd=ROOT)
@@ -4,6 +4,7 @@ from flex.serializers.core import ParameterSerializer
 from flex.parameters import (
     filter_parameters,
     find_parameter,
+    get_path_parameter_names,
     merge_parameter_lists,
 )
 from flex.constants import (
@@ -160,3 +161,14 @@ def test_merge_parameters_uses_last_write_wins():
     assert find_parameter(merged_parameters, in_=PATH, name='username')
     assert find_parameter(merged_parameters, in_=QUERY, name='page')
     assert find_parameter(merged_parameters, in_=QUERY, name='page_size')
+
+
+def test_get_path_parameter_names():
+    parameters = [
+        ID_IN_PATH,
+        PAGE_IN_QUERY,
+        USERNAME_IN_PATH,
+        dict(ID_IN_PATH, description='duplicate'),
+    ]
+
+    assert get_path_parameter_names(parameters) == ['id', 'username']
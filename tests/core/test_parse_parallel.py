@@ -0,0 +1,135 @@
+import copy
+
+import pytest
+
+from flex.core import parse
+from flex.meta.fields import (
+    Context,
+    init_chunk_worker,
+)
+from flex.meta.core import SwaggerField
+from flex.meta.definitions import SwaggerDefinitionsField
+
+
+def get_raw_schema(num_paths):
+    paths = {}
+    definitions = {}
+    for i in range(num_paths):
+        definitions['Item{0}'.format(i)] = {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'next': {'$ref': 'Item{0}'.format((i + 1) % num_paths)},
+            },
+        }
+        paths['/items-{0}/{{id}}'.format(i)] = {
+            'get': {
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'type': 'integer', 'required': True},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {'$ref': 'Item{0}'.format(i)},
+                    },
+                },
+            },
+        }
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'Test API', 'version': '0.0.1'},
+        'paths': paths,
+        'definitions': definitions,
+    }
+
+
+class InProcessPool(object):
+    """
+    Stands in for a process pool, converting the chunks in this process.
+    """
+    def __init__(self):
+        self.calls = 0
+
+    def start(self, context):
+        """
+        Sets up this process the way the workers of `context.process_pool`
+        are set up.
+        """
+        init_chunk_worker(context.definitions, context.trusted)
+        context.pool = self
+        return context
+
+    def map(self, func, iterable):
+        self.calls += 1
+        return [func(item) for item in iterable]
+
+
+def native_parse(raw_schema, pool=None, **kwargs):
+    def get_context(definitions=None):
+        context = Context(definitions, **kwargs)
+        if pool is not None:
+            pool.start(context)
+        return context
+
+    definitions, errors = SwaggerDefinitionsField().from_native(raw_schema, get_context())
+    if errors:
+        return 'definitions', errors
+    swagger, errors = SwaggerField().from_native(raw_schema, get_context(definitions))
+    if errors:
+        return 'swagger', errors
+    definitions.update(swagger)
+    return 'valid', definitions
+
+
+def break_schema(raw_schema, kind):
+    raw_schema = copy.deepcopy(raw_schema)
+    if kind == 'definitions':
+        raw_schema['definitions']['Item3']['properties']['id']['type'] = 'unknown'
+        raw_schema['definitions']['Item7']['properties']['next'] = {'$ref': 'Missing'}
+    elif kind == 'paths':
+        operation = raw_schema['paths']['/items-2/{id}']['get']
+        operation['responses']['200'] = {}
+        operation = raw_schema['paths']['/items-5/{id}']['get']
+        operation['parameters'][0]['name'] = 'other'
+    return raw_schema
+
+
+@pytest.mark.parametrize('kind', ('valid', 'definitions', 'paths'))
+@pytest.mark.parametrize('trusted', (False, True))
+def test_chunked_validation_matches_serial(kind, trusted):
+    raw_schema = break_schema(get_raw_schema(10), kind)
+    pool = InProcessPool()
+
+    expected = native_parse(copy.deepcopy(raw_schema), trusted=trusted)
+    actual = native_parse(
+        copy.deepcopy(raw_schema), trusted=trusted, pool=pool, chunk_size=3,
+    )
+
+    assert actual == expected
+    assert pool.calls
+
+
+def test_small_fields_are_not_chunked():
+    pool = InProcessPool()
+
+    native_parse(get_raw_schema(10), pool=pool, chunk_size=10)
+
+    assert pool.calls == 0
+
+
+def test_parse_with_processes():
+    raw_schema = get_raw_schema(250)
+
+    assert parse(copy.deepcopy(raw_schema), processes=2) == parse(copy.deepcopy(raw_schema))
+
+
+@pytest.mark.parametrize('kind', ('definitions', 'paths'))
+def test_parse_with_processes_errors(kind):
+    raw_schema = break_schema(get_raw_schema(250), kind)
+
+    with pytest.raises(ValueError) as expected:
+        parse(copy.deepcopy(raw_schema))
+    with pytest.raises(ValueError) as actual:
+        parse(copy.deepcopy(raw_schema), processes=2)
+
+    assert str(actual.value) == str(expected.value)
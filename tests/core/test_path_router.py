@@ -0,0 +1,202 @@
+import threading
+
+import pytest
+
+from flex.paths import (
+    PathMatchCache,
+    PathRouter,
+    RegexPathRouter,
+    match_request_path_to_api_path,
+)
+from flex.constants import (
+    PATH,
+    INTEGER,
+    STRING,
+)
+
+
+ID_IN_PATH = {
+    'name': 'id', 'in': PATH, 'description': 'id', 'type': INTEGER, 'required': True,
+}
+USERNAME_IN_PATH = {
+    'name': 'username', 'in': PATH, 'description': 'username', 'type': STRING, 'required': True
+}
+FILENAME_IN_PATH = {
+    'name': 'filename', 'in': PATH, 'description': 'filename', 'type': STRING, 'required': True
+}
+
+
+PATHS = {
+    '/get': None,
+    '/get/{id}': {'parameters': [ID_IN_PATH]},
+    '/users/{username}/posts/{id}/': {'parameters': [ID_IN_PATH, USERNAME_IN_PATH]},
+    '/files/{filename}.json': {'parameters': [FILENAME_IN_PATH]},
+    '/undeclared/{username}': {'parameters': []},
+}
+
+
+ROUTERS = pytest.mark.parametrize('router_class', (PathRouter, RegexPathRouter))
+
+
+@ROUTERS
+@pytest.mark.parametrize(
+    'request_path,api_path,captures',
+    (
+        ('/get', '/get', {}),
+        ('/get/1234', '/get/{id}', {'id': '1234'}),
+        (
+            '/users/fernando/posts/1234/',
+            '/users/{username}/posts/{id}/',
+            {'username': 'fernando', 'id': '1234'},
+        ),
+        ('/files/report.json', '/files/{filename}.json', {'filename': 'report'}),
+        ('/undeclared/{username}', '/undeclared/{username}', {}),
+    ),
+)
+def test_router_returns_api_path_and_captures(router_class, request_path, api_path, captures):
+    router = router_class(PATHS)
+    assert router.match(request_path) == (api_path, captures)
+
+
+@ROUTERS
+@pytest.mark.parametrize(
+    'request_path',
+    (
+        '/get/',
+        '/post',
+        '/get/1234/extra',
+        '/files/report.xml',
+        '/undeclared/fernando',
+    ),
+)
+def test_router_with_unknown_path(router_class, request_path):
+    router = router_class(PATHS)
+    with pytest.raises(LookupError):
+        router.match(request_path)
+
+
+@ROUTERS
+def test_router_with_ambiguous_path(router_class):
+    router = router_class({
+        '/get/{id}': {'parameters': [ID_IN_PATH]},
+        '/get/main': None,
+    })
+    with pytest.raises(LookupError):
+        router.match('/get/main')
+
+    assert router.match('/get/1234') == ('/get/{id}', {'id': '1234'})
+
+
+def test_prebuilt_router_is_used_for_matching():
+    router = PathRouter(PATHS)
+
+    api_path = match_request_path_to_api_path(
+        path_definitions={},
+        request_path='/api/get/1234',
+        base_path='/api',
+        router=router,
+    )
+    assert api_path == '/get/{id}'
+
+
+@ROUTERS
+def test_router_with_empty_paths(router_class):
+    router = router_class({})
+    with pytest.raises(LookupError):
+        router.match('')
+
+
+def test_regex_router_captures_do_not_cross_segments():
+    router = RegexPathRouter({
+        '/get/{id}': {'parameters': [ID_IN_PATH]},
+        '/get/{id}/{username}': {'parameters': [ID_IN_PATH, USERNAME_IN_PATH]},
+    })
+
+    assert router.match('/get/1234/fernando') == (
+        '/get/{id}/{username}', {'id': '1234', 'username': 'fernando'},
+    )
+
+
+def test_regex_router_with_many_paths():
+    # More groups than a single expression may hold on older pythons.
+    paths = dict(
+        ('/things-{0}/{{id}}'.format(index), {'parameters': [ID_IN_PATH]})
+        for index in range(500)
+    )
+    paths['/things-{id}/main'] = {'parameters': [ID_IN_PATH]}
+    router = RegexPathRouter(paths)
+
+    for index in (0, 250, 499):
+        assert router.match('/things-{0}/1'.format(index)) == (
+            '/things-{0}/{{id}}'.format(index), {'id': '1'},
+        )
+    assert router.match('/things-main/main') == ('/things-{id}/main', {'id': 'main'})
+
+    with pytest.raises(LookupError) as err:
+        router.match('/things-1/main')
+    assert '/things-1/{id}' in str(err.value)
+    assert '/things-{id}/main' in str(err.value)
+    assert '/things-2/{id}' not in str(err.value)
+
+
+def test_match_cache_returns_the_router_matches():
+    router = PathMatchCache(PathRouter(PATHS))
+
+    for _ in range(2):
+        assert router.match('/get/1234') == ('/get/{id}', {'id': '1234'})
+        assert router.match('/files/report.json') == (
+            '/files/{filename}.json', {'filename': 'report'},
+        )
+
+    assert router.stats == {'hits': 2, 'misses': 2, 'size': 2}
+
+
+def test_match_cache_evicts_the_least_recently_used_path():
+    router = PathMatchCache(PathRouter(PATHS), max_size=2)
+
+    router.match('/get/1')
+    router.match('/get/2')
+    router.match('/get/1')
+    router.match('/get/3')
+
+    assert list(router.matches) == ['/get/1', '/get/3']
+
+
+def test_match_cache_does_not_store_unknown_paths():
+    router = PathMatchCache(PathRouter(PATHS))
+
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            router.match('/post')
+
+    assert router.stats == {'hits': 0, 'misses': 2, 'size': 0}
+
+
+def test_match_cache_captures_may_be_modified():
+    router = PathMatchCache(PathRouter(PATHS))
+
+    router.match('/get/1234')[1]['id'] = 'other'
+
+    assert router.match('/get/1234') == ('/get/{id}', {'id': '1234'})
+
+
+def test_match_cache_shared_between_threads():
+    router = PathMatchCache(PathRouter(PATHS), max_size=10)
+    results = []
+
+    def match():
+        for index in range(200):
+            request_path = '/get/{0}'.format(index % 20)
+            results.append(router.match(request_path) == (
+                '/get/{id}', {'id': str(index % 20)},
+            ))
+
+    threads = [threading.Thread(target=match) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results) and len(results) == 800
+    assert router.hits + router.misses == 800
+    assert len(router.matches) == 10
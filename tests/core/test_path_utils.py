@@ -1,5 +1,10 @@
+import pytest
+
 from flex.serializers.core import ParameterSerializer
+from flex.error_messages import MESSAGES
 from flex.paths import (
+    get_missing_path_parameter_errors,
+    get_operation_index,
     get_parameter_names_from_path,
     path_to_pattern,
 )
@@ -49,4 +54,67 @@ def test_undeclared_api_path_parameters_are_skipped():
     assert serializer.is_valid(), serializer.errors
     parameters = serializer.object
     pattern = path_to_pattern(path, parameters)
-    assert pattern == '^/get/\{username\}/posts/(?P<id>.+)/$'
+    assert pattern == '^/get/\{username\}/posts/(?P<id>[^/]+)/$'
+
+
+def test_get_missing_path_parameter_errors():
+    path_definitions = {
+        '/users/{id}': {
+            'parameters': [ID_IN_PATH, 'username'],
+            'get': {'parameters': [USERNAME_IN_PATH]},
+            'post': None,
+        },
+        '/users/{id}/{username}': {
+            'parameters': [ID_IN_PATH],
+            'get': {'parameters': [USERNAME_IN_PATH]},
+        },
+        '/users/': {
+            'parameters': [ID_IN_PATH],
+        },
+        '/empty': None,
+    }
+
+    errors = get_missing_path_parameter_errors(
+        path_definitions, {'username': USERNAME_IN_PATH},
+    )
+
+    assert errors == {
+        'GET:/users/{id}': [
+            MESSAGES['path']['missing_parameter'].format('username', '/users/{id}'),
+        ],
+        'POST:/users/{id}': [
+            MESSAGES['path']['missing_parameter'].format('username', '/users/{id}'),
+        ],
+        '/users/': [
+            MESSAGES['path']['missing_parameter'].format('id', '/users/'),
+        ],
+    }
+
+
+def test_get_operation_index():
+    paths = {
+        '/get': None,
+        '/get/{id}': {
+            'parameters': [],
+            'get': {'operationId': 'getThing', 'responses': {}},
+            'put': {'responses': {}},
+            'delete': {'operationId': 'deleteThing', 'responses': {}},
+        },
+    }
+
+    assert get_operation_index(paths) == {
+        'getThing': ('/get/{id}', 'get'),
+        'deleteThing': ('/get/{id}', 'delete'),
+    }
+
+
+def test_get_operation_index_with_duplicate_operation_ids():
+    paths = {
+        '/get': {'get': {'operationId': 'getThing', 'responses': {}}},
+        '/get/{id}': {'get': {'operationId': 'getThing', 'responses': {}}},
+    }
+
+    with pytest.raises(ValueError) as err:
+        get_operation_index(paths)
+
+    assert 'getThing' in str(err.value)
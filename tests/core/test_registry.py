@@ -0,0 +1,213 @@
+import pytest
+
+from flex.constants import (
+    INTEGER,
+    OBJECT,
+    PATH,
+    STRING,
+)
+from flex.error_messages import MESSAGES
+from flex.paths import AmbiguousPathError
+from flex.registry import (
+    SchemaRegistry,
+    iter_base_paths,
+)
+from flex.validation.schema import get_schema_validator_cache
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+)
+from tests.utils import assert_error_message_equal
+
+
+ID_IN_PATH = {'name': 'id', 'in': PATH, 'type': INTEGER, 'required': True}
+
+
+def get_schema(name, **kwargs):
+    kwargs.setdefault('definitions', {
+        'Item': {'type': OBJECT, 'properties': {'name': {'type': STRING}}},
+    })
+    return SchemaFactory(
+        paths={
+            '/{0}/{{id}}'.format(name): {
+                'parameters': [ID_IN_PATH],
+                'get': {
+                    'operationId': name,
+                    'responses': {200: {'description': 'Success'}},
+                },
+            },
+        },
+        **kwargs
+    )
+
+
+def get_registry():
+    registry = SchemaRegistry()
+    schemas = {
+        'users': get_schema('users', host='users.example.com'),
+        'orders': get_schema('orders', host='api.example.com', basePath='/orders/v1'),
+        'items': get_schema('items', host='api.example.com', basePath='/items/'),
+        'other-items': get_schema('items', host='api.example.com', basePath='/other'),
+        'any-host': get_schema('health'),
+    }
+    for schema in schemas.values():
+        registry.add(schema)
+    return registry, schemas
+
+
+@pytest.mark.parametrize(
+    'url,name,api_path',
+    (
+        ('http://users.example.com/users/1', 'users', '/users/{id}'),
+        ('http://api.example.com/orders/v1/orders/2', 'orders', '/orders/{id}'),
+        ('http://api.example.com/items/items/3', 'items', '/items/{id}'),
+        ('http://api.example.com/other/items/3', 'other-items', '/items/{id}'),
+        ('http://api.example.com/health/4', 'any-host', '/health/{id}'),
+        ('http://else.example.com/health/4', 'any-host', '/health/{id}'),
+    ),
+)
+def test_match_finds_the_schema_for_the_request(url, name, api_path):
+    registry, schemas = get_registry()
+
+    schema, matched_api_path, path_parameters = registry.match(RequestFactory(url=url))
+
+    assert schema is schemas[name]
+    assert matched_api_path == api_path
+    assert list(path_parameters) == ['id']
+
+
+@pytest.mark.parametrize(
+    'url',
+    (
+        'http://users.example.com/orders/v1/orders/2',
+        'http://api.example.com/users/1',
+        'http://api.example.com/orders/orders/2',
+    ),
+)
+def test_match_with_unknown_request(url):
+    registry, _ = get_registry()
+
+    with pytest.raises(LookupError):
+        registry.match(RequestFactory(url=url))
+
+
+def get_ambiguous_registry():
+    """
+    A registry in which `users.example.com/pets/...` matches two api paths of
+    that host, and one of the schema without a host.
+    """
+    registry = SchemaRegistry()
+    registry.add(get_schema('pets', host='users.example.com'))
+    registry.add(SchemaFactory(
+        host='users.example.com',
+        paths={
+            '/pets/{name}': {
+                'parameters': [
+                    {'name': 'name', 'in': PATH, 'type': STRING, 'required': True},
+                ],
+                'get': {'responses': {200: {'description': 'Success'}}},
+            },
+        },
+    ))
+    registry.add(get_schema('pets'))
+    return registry
+
+
+def test_ambiguous_match_is_not_routed_to_another_schema():
+    registry = get_ambiguous_registry()
+
+    with pytest.raises(AmbiguousPathError) as err:
+        registry.match(RequestFactory(url='http://users.example.com/pets/1'))
+
+    assert sorted(err.value.api_paths) == ['/pets/{id}', '/pets/{name}']
+
+
+def test_validate_request_reports_ambiguous_match():
+    from flex.exceptions import ValidationError
+
+    registry = get_ambiguous_registry()
+
+    with pytest.raises(ValidationError) as err:
+        registry.validate_request(
+            RequestFactory(url='http://users.example.com/pets/1'),
+            inner=True,
+        )
+    assert err.value.messages[0]['path'][0] == (
+        MESSAGES['request']['ambiguous_path'].format(['/pets/{id}', '/pets/{name}'])
+    )
+
+
+def test_schemas_added_after_matching_are_routed():
+    registry = SchemaRegistry()
+    registry.add(get_schema('users', host='api.example.com'))
+    request = RequestFactory(url='http://api.example.com/orders/2')
+
+    with pytest.raises(LookupError):
+        registry.match(request)
+
+    orders = registry.add(get_schema('orders', host='api.example.com'))
+
+    schema, api_path, _ = registry.match(request)
+    assert schema is orders
+    assert api_path == '/orders/{id}'
+
+
+def test_duplicate_api_paths_are_rejected():
+    registry = SchemaRegistry()
+    registry.add(get_schema('users', basePath='/api'))
+
+    with pytest.raises(ValueError):
+        registry.add(get_schema('users', basePath='/api/'))
+
+    registry.add(get_schema('users', basePath='/v2'))
+
+
+def test_validate_request():
+    from flex.exceptions import ValidationError
+
+    registry, schemas = get_registry()
+
+    schema, operation_definition = registry.validate_request(
+        RequestFactory(url='http://api.example.com/orders/v1/orders/2'),
+    )
+    assert schema is schemas['orders']
+    assert operation_definition['operationId'] == 'orders'
+
+    with pytest.raises(ValidationError) as err:
+        registry.validate_request(
+            RequestFactory(url='http://api.example.com/orders/v1/orders/abc'),
+            inner=True,
+        )
+    assert 'parameters' in err.value.messages[0]['method'][0][0]
+
+    with pytest.raises(ValidationError) as err:
+        registry.validate_request(
+            RequestFactory(url='http://api.example.com/orders/v2/orders/2'),
+            inner=True,
+        )
+    assert_error_message_equal(
+        err.value.messages[0]['path'][0],
+        MESSAGES['request']['unknown_path'],
+    )
+
+
+def test_schemas_with_identical_definitions_share_validators():
+    registry, schemas = get_registry()
+    different = registry.add(get_schema('other', definitions={'Item': {'type': STRING}}))
+
+    cache = get_schema_validator_cache(schemas['users'])
+    assert get_schema_validator_cache(schemas['orders']) is cache
+    assert get_schema_validator_cache(different) is not cache
+
+
+@pytest.mark.parametrize(
+    'request_path,base_paths',
+    (
+        ('/', ['']),
+        ('/a/b/', ['/a/b', '/a', '']),
+        ('/a/b', ['/a/b', '/a', '']),
+    ),
+)
+def test_iter_base_paths(request_path, base_paths):
+    assert list(iter_base_paths(request_path)) == base_paths
@@ -3,12 +3,17 @@ from __future__ import unicode_literals
 import six
 import pytest
 import collections
+import decimal
 import operator
 import random
 
 from flex.utils import (
     is_non_string_iterable,
     is_value_of_type,
+    is_value_of_any_type,
+    get_known_types,
+    get_types_for_value,
+    TYPES_FOR_CLASS,
     format_errors,
     get_type_for_value,
     cast_value_to_type,
@@ -22,6 +27,7 @@ from flex.constants import (
     STRING,
     ARRAY,
     OBJECT,
+    PRIMATIVE_TYPES,
 )
 
 
@@ -138,6 +144,45 @@ def test_non_object_types():
     assert not is_value_of_type(tuple(), OBJECT)
 
 
+def test_value_types_of_subclasses_and_abstract_types():
+    class Text(six.text_type):
+        pass
+
+    assert get_types_for_value(collections.OrderedDict()) == frozenset([OBJECT])
+    assert get_types_for_value(decimal.Decimal('1.5')) == frozenset([NUMBER])
+    assert get_types_for_value(Text('abc')) == frozenset([STRING])
+    assert get_types_for_value(set()) == frozenset()
+
+
+@pytest.mark.parametrize(
+    'value',
+    (None, True, False, 0, 1, 1.5, '', b'', [], (), {}),
+)
+def test_precomputed_value_types_match_isinstance_checks(value):
+    assert type(value) in TYPES_FOR_CLASS
+    for type_ in (NULL, BOOLEAN, INTEGER, NUMBER, STRING, ARRAY, OBJECT):
+        expected = isinstance(value, PRIMATIVE_TYPES[type_])
+        if type_ == ARRAY:
+            expected = expected and not isinstance(value, PRIMATIVE_TYPES[STRING])
+        if type_ in (INTEGER, NUMBER):
+            expected = expected and not isinstance(value, bool)
+        assert is_value_of_type(value, type_) is expected
+
+
+def test_is_value_of_any_type_with_unknown_type():
+    assert is_value_of_any_type(1, (INTEGER, 'not-a-type'))
+
+    with pytest.raises(ValueError):
+        is_value_of_any_type(1, (STRING, 'not-a-type'))
+
+
+def test_get_known_types():
+    assert get_known_types((INTEGER, NUMBER, INTEGER)) == frozenset((INTEGER, NUMBER))
+
+    with pytest.raises(ValueError):
+        get_known_types((STRING, 'not-a-type'))
+
+
 #
 # format_errors tests
 #
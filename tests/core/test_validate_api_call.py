@@ -0,0 +1,97 @@
+import json
+import pytest
+
+from flex.core import (
+    generate_api_call_validator,
+    validate_api_call,
+)
+from flex.constants import (
+    INTEGER,
+    STRING,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+    ResponseFactory,
+)
+
+
+def get_schema():
+    return SchemaFactory(
+        produces=['application/json'],
+        paths={
+            '/get': {
+                'get': {
+                    'responses': {
+                        200: {
+                            'description': 'Success',
+                            'schema': {'type': INTEGER},
+                        }
+                    },
+                },
+            },
+        },
+    )
+
+
+def test_validate_api_call_with_valid_request_and_response():
+    request = RequestFactory(url='http://www.example.com/get')
+    response = ResponseFactory(request=request, content=json.dumps(1))
+
+    validate_api_call(get_schema(), request=request, response=response)
+
+
+def test_validate_api_call_with_invalid_response():
+    request = RequestFactory(url='http://www.example.com/get')
+    response = ResponseFactory(request=request, content=json.dumps('not-an-integer'))
+
+    with pytest.raises(ValueError) as err:
+        validate_api_call(get_schema(), request=request, response=response)
+
+    assert 'response' in str(err.value)
+
+
+def test_generated_validator_with_valid_request_and_response():
+    validator = generate_api_call_validator(get_schema())
+    request = RequestFactory(url='http://www.example.com/get')
+
+    for value in (1, 2):
+        response = ResponseFactory(request=request, content=json.dumps(value))
+        validator(request, response)
+
+
+def test_generated_validator_with_invalid_response():
+    validator = generate_api_call_validator(get_schema())
+    request = RequestFactory(url='http://www.example.com/get')
+    response = ResponseFactory(request=request, content=json.dumps('not-an-integer'))
+
+    with pytest.raises(ValueError) as err:
+        validator(request, response)
+
+    assert 'response' in str(err.value)
+
+
+def test_generated_validator_reuses_response_validators():
+    validator = generate_api_call_validator(get_schema())
+    request = RequestFactory(url='http://www.example.com/get')
+    response = ResponseFactory(request=request, content=json.dumps(1))
+
+    validator(request, response)
+    validator(request, response)
+
+    response_validator = validator.keywords['response_validator']
+    response_validators = response_validator.keywords['response_validators']
+    assert len(response_validators.response_validators) == 1
+
+
+def test_validate_api_call_sees_changes_to_the_schema():
+    schema = get_schema()
+    request = RequestFactory(url='http://www.example.com/get')
+    response = ResponseFactory(request=request, content=json.dumps('a-string'))
+
+    with pytest.raises(ValueError):
+        validate_api_call(schema, request=request, response=response)
+
+    schema['paths']['/get']['get']['responses'][200]['schema'] = {'type': STRING}
+    validate_api_call(schema, request=request, response=response)
@@ -1,7 +1,6 @@
 import factory
 
-from flex.serializers.definitions import SwaggerDefinitionsSerializer
-from flex.serializers.core import SwaggerSerializer
+from flex.core import parse
 from flex.constants import EMPTY
 from flex.http import (
     Request,
@@ -41,17 +40,4 @@ def SchemaFactory(**kwargs):
     kwargs.setdefault('info', {'title': 'Test API', 'version': '0.0.1'})
     kwargs.setdefault('paths', {})
 
-
-    definitions_serializer = SwaggerDefinitionsSerializer(
-        data=kwargs,
-    )
-    assert definitions_serializer.is_valid(), definitions_serializer.errors
-
-    swagger_serializer = SwaggerSerializer(
-        definitions_serializer.object,
-        data=kwargs,
-        context=definitions_serializer.object,
-    )
-
-    assert swagger_serializer.is_valid(), swagger_serializer.errors
-    return swagger_serializer.object
+    return parse(kwargs)
@@ -1,15 +1,16 @@
 import pytest
 
+from flex.exceptions import ValidationError
 from flex.utils import is_non_string_iterable
+from flex.meta.fields import (
+    Context,
+    ObjectField,
+)
 from flex.serializers.fields import (
     MaybeListCharField,
     SecurityRequirementReferenceField,
 )
 
-from django.core.exceptions import ValidationError
-
-from rest_framework import serializers
-
 from tests.utils import assert_error_message_equal
 
 
@@ -20,7 +21,7 @@ def test_maybe_list_char_field_accepts_strings():
     field = MaybeListCharField()
     data = {'foo': 'a-string'}
     into = {}
-    field.field_from_native(data, {}, 'foo', into)
+    field.field_from_native(data, 'foo', into, Context())
     assert data['foo'] == into.get('foo')
 
 
@@ -28,7 +29,7 @@ def test_maybe_list_char_field_accepts_lists():
     field = MaybeListCharField()
     data = {'foo': ['a-string', 'another-string']}
     into = {}
-    field.field_from_native(data, {}, 'foo', into)
+    field.field_from_native(data, 'foo', into, Context())
     assert data['foo'] == into.get('foo')
 
 
@@ -45,7 +46,7 @@ def test_maybe_list_char_field_runs_validators_on_singular_strings():
     data = {'foo': 'not-bar'}
     into = {}
     with pytest.raises(ValidationError):
-        field.field_from_native(data, {}, 'foo', into)
+        field.field_from_native(data, 'foo', into, Context())
 
 
 def test_maybe_list_char_field_runs_validators_on_lists():
@@ -61,40 +62,35 @@ def test_maybe_list_char_field_runs_validators_on_lists():
     data = {'foo': ['a-string', 'another-string']}
     into = {}
     with pytest.raises(ValidationError):
-        field.field_from_native(data, {}, 'foo', into)
+        field.field_from_native(data, 'foo', into, Context())
 
 
 #
 # SecurityRequirementReferenceField tests
 #
 def test_invalid_with_unknown_reference():
-    class TestSerializer(serializers.Serializer):
+    class TestField(ObjectField):
         foo = SecurityRequirementReferenceField()
 
-    serializer = TestSerializer(
-        data={'foo': 'SomeReference'},
-        context={
-            'securityDefinitions': {},
-        },
+    _, errors = TestField().from_native(
+        {'foo': 'SomeReference'},
+        Context({'securityDefinitions': {}}),
     )
 
-    assert not serializer.is_valid()
-    assert 'foo' in serializer.errors
+    assert 'foo' in errors
     assert_error_message_equal(
-        serializer.errors['foo'][0],
-        SecurityRequirementReferenceField.default_error_messages['unknown_reference'],
+        errors['foo'][0],
+        SecurityRequirementReferenceField.error_messages['unknown_reference'],
     )
 
 
 def test_valid_with_known_reference():
-    class TestSerializer(serializers.Serializer):
+    class TestField(ObjectField):
         foo = SecurityRequirementReferenceField()
 
-    serializer = TestSerializer(
-        data={'foo': 'SomeReference'},
-        context={
-            'securityDefinitions': {'SomeReference': {}},
-        },
+    _, errors = TestField().from_native(
+        {'foo': 'SomeReference'},
+        Context({'securityDefinitions': {'SomeReference': {}}}),
     )
 
-    assert serializer.is_valid()
+    assert not errors
@@ -3,6 +3,7 @@ import pytest
 
 import six
 
+from flex.exceptions import ValidationError
 from flex.serializers.validators import (
     host_validator,
     path_validator,
@@ -33,8 +34,6 @@ from flex.constants import (
     SECURITY_FLOWS,
 )
 
-from rest_framework import serializers
-
 
 #
 # type_validator tests
@@ -54,12 +53,12 @@ def test_type_validator_accepts_single_type():
 
 
 def test_invalid_singular_type():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         type_validator('not-a-real-type')
 
 
 def test_invalid_type_in_iterable_of_types():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         value = [
             NULL,
             'not-a-real-type',
@@ -72,7 +71,7 @@ def test_invalid_type_in_iterable_of_types():
 # format_validator tests
 #
 def test_format_sanity_check():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         format_validator('not-a-real-format')
 
 
@@ -87,10 +86,10 @@ def test_raises_for_non_strings():
     """
     Mostly just sanity checking
     """
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         string_type_validator(1)
 
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         string_type_validator(None)
 
 
@@ -139,7 +138,7 @@ def test_mimetype_validator_on_valid_mimetypes(mimetype):
     )
 )
 def test_mimetype_validator_on_invalid_mimetypes(mimetype):
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         mimetype_validator(mimetype)
 
 
@@ -147,7 +146,7 @@ def test_mimetype_validator_on_invalid_mimetypes(mimetype):
 # scheme_validator tests
 #
 def test_scheme_invalid_value():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         scheme_validator('not-a-real-scheme')
 
 
@@ -166,7 +165,7 @@ def test_no_leading_slash():
     """
     Must begin with a leading `/`
     """
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         path_validator('no-leading/slash/')
 
 
@@ -178,7 +177,7 @@ def test_with_non_path_component():
     """
     Invalid if it contains extra stuff that isn't part of the path.
     """
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         path_validator('/no-leading/slash/?foo=3')
 
 
@@ -186,7 +185,7 @@ def test_with_non_path_component():
 # host_validator tests
 #
 def test_invalid_with_scheme():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         host_validator('http://www.example.com')
 
 
@@ -206,7 +205,7 @@ def test_valid_with_port():
 # parameter_in_validator tests
 #
 def test_invalid_in_value():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         parameter_in_validator('not-a-valid-in-value')
 
 
@@ -218,7 +217,7 @@ def test_valid_in_value():
 # collection_format_validator tests
 #
 def test_invalid_collection_format():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         collection_format_validator('not-a-valid-collection-format')
 
 
@@ -236,7 +235,7 @@ def test_inclusive_minimum():
     validator(5)
     validator(100)
 
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         validator(4)
 
 
@@ -246,7 +245,7 @@ def test_exclusive_minimum():
     validator(6)
     validator(100)
 
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         validator(5)
 
 
@@ -259,7 +258,7 @@ def test_inclusive_maximum():
     validator(5)
     validator(0)
 
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         validator(6)
 
 
@@ -269,7 +268,7 @@ def test_exclusive_maximum():
     validator(4)
     validator(0)
 
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         validator(5)
 
 
@@ -277,7 +276,7 @@ def test_exclusive_maximum():
 # security_type_validator tests
 #
 def test_unknown_security_type():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         security_type_validator('not-a-real-security-type')
 
 
@@ -289,7 +288,7 @@ def test_with_known_security_type():
 # security_api_key_location_validator tests
 #
 def test_with_unkown_api_key_location():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         security_api_key_location_validator('not-a-real-security-api-key-location')
 
 
@@ -301,7 +300,7 @@ def test_with_known_api_key_location():
 # security_flow_validator tests
 #
 def test_with_unknown_flow():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         security_flow_validator('not-a-real-security-flow')
 
 
@@ -313,7 +312,7 @@ def test_with_known_flow():
 # regex_validator
 #
 def test_with_invalid_regex():
-    with pytest.raises(serializers.ValidationError):
+    with pytest.raises(ValidationError):
         regex_validator('[abc')
 
 
@@ -1,3 +1,4 @@
+import functools
 import re
 import six
 
@@ -34,11 +35,15 @@ def assert_error_message_equal(formatted_msg, unformatted_msg):
         )
 
 
-def generate_validator_from_schema(schema, **kwargs):
-    from flex.serializers.core import SchemaSerializer
+def generate_validator_from_schema(schema, context=None):
+    from flex.meta.core import SchemaField
+    from flex.meta.fields import Context
+    from flex.validation.common import validate_object
+    from flex.validation.schema import construct_schema_validators
 
-    serializer = SchemaSerializer(data=schema, **kwargs)
-    assert serializer.is_valid(), serializer.errors
+    context = context or {}
+    schema, errors = SchemaField().from_native(schema, Context(context))
+    assert not errors, errors
 
-    validator = serializer.save()
-    return validator
+    validators = construct_schema_validators(schema, context)
+    return functools.partial(validate_object, validators=validators)
@@ -161,3 +161,21 @@ def test_array_header_type_casting_with_multiple_items():
     actual = value_processor('1,a,true,2')
     expected = [1, 'a', True, '2']
     assert actual == expected
+
+
+def test_array_header_type_casting_with_multiple_items_is_reusable():
+    serializer = HeaderSerializer(
+        data={
+            'type': ARRAY,
+            'collectionFormat': CSV,
+            'items': [
+                {'type': INTEGER},
+                {'type': BOOLEAN},
+            ]
+        }
+    )
+    assert serializer.is_valid(), serializer.errors
+    value_processor = generate_value_processor(context={}, **serializer.object)
+
+    assert value_processor('1,true') == [1, True]
+    assert value_processor('2,false,3') == [2, False, '3']
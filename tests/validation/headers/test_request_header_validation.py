@@ -24,7 +24,7 @@ from tests.utils import assert_error_message_equal
     )
 )
 def test_header_type_validation_for_invalid_values(type_, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = HeaderSerializer(
         data={
             'type': type_,
@@ -0,0 +1,79 @@
+import pytest
+
+from flex.validation import operation
+from flex.validation.request import generate_request_validator
+from flex.constants import (
+    PATH,
+    INTEGER,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+)
+
+
+def get_schema():
+    return SchemaFactory(
+        paths={
+            '/get/{id}/': {
+                'parameters': [
+                    {
+                        'name': 'id',
+                        'in': PATH,
+                        'description': 'id',
+                        'required': True,
+                        'type': INTEGER,
+                    },
+                ],
+                'get': {
+                    'responses': {200: {'description': 'Success'}},
+                },
+            },
+        },
+    )
+
+
+def test_operation_validators_are_constructed_once(monkeypatch):
+    schema = get_schema()
+    calls = []
+    construct_operation_validators = operation.construct_operation_validators
+
+    def counting_construct_operation_validators(**kwargs):
+        calls.append((kwargs['api_path'], kwargs['operation_definition']))
+        return construct_operation_validators(**kwargs)
+
+    monkeypatch.setattr(
+        operation, 'construct_operation_validators', counting_construct_operation_validators,
+    )
+
+    validator = generate_request_validator(schema)
+    for _ in range(3):
+        validator(RequestFactory(url='http://www.example.com/get/1234/'))
+
+    assert len(calls) == 1
+
+
+def test_cached_operation_validators_still_detect_errors():
+    schema = get_schema()
+    validator = generate_request_validator(schema)
+
+    validator(RequestFactory(url='http://www.example.com/get/1234/'))
+
+    with pytest.raises(ValueError):
+        validator(RequestFactory(url='http://www.example.com/get/abcd/'))
+
+    validator(RequestFactory(url='http://www.example.com/get/5678/'))
+
+
+def test_operation_validator_cache_keys():
+    schema = get_schema()
+    cache = operation.OperationValidatorCache(schema['paths'], context=schema)
+
+    validators = cache['/get/{id}/', 'get']
+
+    assert 'parameters' in validators
+    assert cache['/get/{id}/', 'get'] is validators
+
+    with pytest.raises(KeyError):
+        cache['/get/{id}/', 'post']
@@ -32,7 +32,7 @@ def test_operation_parameter_validation_uses_correct_parameter_definitions():
     This test also serves as a *smoke* test to see that parameter validation is
     working as expected.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     schema = SchemaFactory(
         produces=['application/json'],
         paths={
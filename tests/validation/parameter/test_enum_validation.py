@@ -35,7 +35,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_enum_validation_with_invalid_values(enum, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -25,7 +25,7 @@ from tests.utils import assert_error_message_equal
     )
 )
 def test_parameter_format_validation_on_invalid_values(format_, value, error_key):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -15,7 +15,7 @@ from tests.utils import assert_error_message_equal
 
 
 def test_parameter_items_validation_on_invalid_array():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
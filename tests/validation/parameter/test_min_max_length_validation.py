@@ -22,7 +22,7 @@ from flex.constants import (
     ),
 )
 def test_minimum_length_validation_with_too_short_values(min_length, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -87,7 +87,7 @@ def test_minimum_length_validation_with_valid_lengths(min_length, value):
     ),
 )
 def test_maximum_length_validation_with_too_long_values(max_length, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -25,7 +25,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_minimum_validation_for_invalid_values(minimum, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -65,7 +65,7 @@ def test_minimum_validation_for_invalid_values(minimum, value):
     ),
 )
 def test_exclusive_minimum_validation_for_invalid_values(minimum, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -165,7 +165,7 @@ def test_exclusive_minimum_validation_for_valid_values(minimum, value):
     ),
 )
 def test_maximum_validation_for_invalid_values(maximum, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
@@ -205,7 +205,7 @@ def test_maximum_validation_for_invalid_values(maximum, value):
     ),
 )
 def test_exclusive_maximum_validation_for_invalid_values(maximum, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
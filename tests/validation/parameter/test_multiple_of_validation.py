@@ -23,7 +23,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_multiple_of_validation_for_invalid_values(divisor, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
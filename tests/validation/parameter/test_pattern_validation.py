@@ -24,7 +24,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_pattern_validation_with_invalid_values(pattern, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
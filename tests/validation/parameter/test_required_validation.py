@@ -15,7 +15,7 @@ from tests.utils import assert_error_message_equal
 
 
 def test_required_parameters_invalid_when_not_present():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {'name': 'id', 'in': PATH, 'description': 'id', 'type': STRING, 'required': True},
     ))
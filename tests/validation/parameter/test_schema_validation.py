@@ -23,7 +23,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_parameter_schema_as_reference_validation_for_invalid_value(value, error_key, message_key):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     context = {
         'definitions': {'UUID': {'type': STRING, 'format': 'uuid'}},
     }
@@ -61,7 +61,7 @@ def test_parameter_schema_as_reference_validation_for_invalid_value(value, error
     ),
 )
 def test_parameter_schema_validation_for_invalid_value(value, error_key, message_key):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
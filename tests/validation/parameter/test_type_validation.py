@@ -25,7 +25,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_parameter_validation_enforces_type(type_, value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {'name': 'id', 'in': PATH, 'description': 'id', 'type': type_, 'required': True},
     ))
@@ -28,7 +28,7 @@ from tests.utils import assert_error_message_equal
     ),
 )
 def test_unique_items_validation_with_duplicates(value):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = ParameterSerializer(many=True, data=(
         {
             'name': 'id',
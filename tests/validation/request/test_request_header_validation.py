@@ -22,7 +22,7 @@ from tests.utils import assert_error_message_equal
 
 
 def test_request_header_validation():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = SchemaFactory(
         paths={
@@ -17,7 +17,7 @@ def test_request_validation_with_invalid_operation_on_path():
     Test that request validation detects request paths that are not declared
     in the schema.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = SchemaFactory(
         paths={
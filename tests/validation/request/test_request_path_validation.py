@@ -1,7 +1,12 @@
 import pytest
 
 from flex.serializers.core import PathsSerializer
+from flex.paths import (
+    PathRouter,
+    RegexPathRouter,
+)
 from flex.validation.request import (
+    generate_request_validator,
     validate_request,
     validate_request_to_path,
 )
@@ -24,7 +29,7 @@ def test_request_validation_with_invalid_request_path():
     Test that request validation detects request paths that are not declared
     in the schema.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = SchemaFactory()
     assert not schema['paths']
@@ -73,7 +78,7 @@ def test_basic_request_path_validation():
     )
 )
 def test_basic_request_path_validation_with_unspecified_paths(request_path):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     serializer = PathsSerializer(data={
         '/get': None,
     })
@@ -162,3 +167,81 @@ def test_parametrized_path_with_multiple_prameters():
         context={},
     )
     assert path == '/users/{username}/posts/{id}'
+
+
+def test_path_parameters_are_captured_when_matching_the_path():
+    serializer = PathsSerializer(data={
+        '/users/{username}/posts/{id}': {
+            'parameters': [
+                {'name': 'id', 'in': PATH, 'description': 'The id', 'type': INTEGER, 'required': True},
+                {'name': 'username', 'in': PATH, 'description': 'The username', 'type': STRING, 'required': True},
+            ],
+        }
+    })
+    assert serializer.is_valid(), serializer.errors
+
+    paths = serializer.object
+
+    request = RequestFactory(url='http://www.example.com/api/users/john-smith/posts/47')
+    validate_request_to_path(
+        request,
+        paths=paths,
+        base_path='/api',
+        context={},
+    )
+    assert request.path_parameters == {'username': 'john-smith', 'id': '47'}
+
+
+@pytest.mark.parametrize('router', (PathRouter, RegexPathRouter))
+def test_path_parameters_are_validated_with_a_base_path(router):
+    from flex.exceptions import ValidationError
+
+    schema = SchemaFactory(
+        basePath='/api',
+        paths={
+            '/get/{id}': {
+                'parameters': [
+                    {'name': 'id', 'in': PATH, 'description': 'The id', 'type': INTEGER, 'required': True},
+                ],
+                'get': {'responses': {200: {'description': 'Success'}}},
+            },
+        },
+    )
+
+    validator = generate_request_validator(schema, inner=True, router=router)
+    validator(RequestFactory(url='http://www.example.com/api/get/25'))
+
+    with pytest.raises(ValidationError) as err:
+        validator(RequestFactory(url='http://www.example.com/api/get/abc'))
+
+    assert 'id' in err.value.messages[0]['method'][0][0]['parameters'][0]['path'][0]
+
+
+def test_request_validator_uses_the_given_router():
+    from flex.exceptions import ValidationError
+
+    matched = []
+
+    class RecordingRouter(RegexPathRouter):
+        def match(self, request_path):
+            matched.append(request_path)
+            return super(RecordingRouter, self).match(request_path)
+
+    schema = SchemaFactory(
+        paths={
+            '/get/{id}': {
+                'parameters': [
+                    {'name': 'id', 'in': PATH, 'description': 'The id', 'type': INTEGER, 'required': True},
+                ],
+                'get': {'responses': {200: {'description': 'Success'}}},
+            },
+        },
+    )
+
+    validator = generate_request_validator(schema, inner=True, router=RecordingRouter)
+    validator(RequestFactory(url='http://www.example.com/get/25'))
+
+    with pytest.raises(ValidationError):
+        validator(RequestFactory(url='http://www.example.com/post/25'))
+
+    assert matched == ['/get/25', '/post/25']
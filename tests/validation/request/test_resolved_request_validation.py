@@ -0,0 +1,133 @@
+import pytest
+
+from flex.validation.request import generate_resolved_request_validator
+from flex.error_messages import MESSAGES
+from flex.constants import (
+    PATH,
+    QUERY,
+    INTEGER,
+    STRING,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+)
+from tests.utils import assert_error_message_equal
+
+
+def get_schema():
+    return SchemaFactory(
+        basePath='/api',
+        paths={
+            '/pets/{id}': {
+                'parameters': [
+                    {'name': 'id', 'in': PATH, 'type': INTEGER, 'required': True},
+                ],
+                'get': {
+                    'operationId': 'showPetById',
+                    'parameters': [
+                        {'name': 'sort', 'in': QUERY, 'type': STRING, 'enum': ['name', 'age']},
+                    ],
+                    'responses': {200: {'description': 'Success'}},
+                },
+                'delete': {
+                    'operationId': 'deletePet',
+                    'responses': {204: {'description': 'Deleted'}},
+                },
+            },
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    'route',
+    (
+        {'operation_id': 'showPetById'},
+        {'api_path': '/pets/{id}', 'method': 'get'},
+        {'api_path': '/pets/{id}', 'method': 'GET'},
+    ),
+)
+def test_resolved_request_is_validated(route):
+    validator = generate_resolved_request_validator(get_schema())
+    # the request path is never matched, so it does not need to match.
+    request = RequestFactory(url='http://www.example.com/routed-elsewhere?sort=age')
+
+    operation_definition = validator(request, path_parameters={'id': '25'}, **route)
+
+    assert operation_definition['operationId'] == 'showPetById'
+
+
+def test_operation_id_selects_the_method():
+    validator = generate_resolved_request_validator(get_schema())
+    request = RequestFactory(url='http://www.example.com/api/pets/25', method='post')
+
+    operation_definition = validator(
+        request, operation_id='deletePet', path_parameters={'id': 25},
+    )
+
+    assert operation_definition['operationId'] == 'deletePet'
+
+
+@pytest.mark.parametrize(
+    'url,path_parameters',
+    (
+        ('/api/pets/abc', {'id': 'abc'}),
+        ('/api/pets/25?sort=color', {'id': '25'}),
+    ),
+)
+def test_resolved_request_with_invalid_parameters(url, path_parameters):
+    from flex.exceptions import ValidationError
+
+    validator = generate_resolved_request_validator(get_schema(), inner=True)
+    request = RequestFactory(url='http://www.example.com' + url)
+
+    with pytest.raises(ValidationError) as err:
+        validator(request, operation_id='showPetById', path_parameters=path_parameters)
+
+    assert 'parameters' in err.value.messages[0]['method'][0][0]
+
+
+def test_resolved_request_with_unknown_operation_id():
+    from flex.exceptions import ValidationError
+
+    validator = generate_resolved_request_validator(get_schema(), inner=True)
+    request = RequestFactory(url='http://www.example.com/api/pets/25')
+
+    with pytest.raises(ValidationError) as err:
+        validator(request, operation_id='listPets')
+
+    assert_error_message_equal(
+        err.value.messages[0]['operation'][0],
+        MESSAGES['request']['unknown_operation'],
+    )
+
+
+def test_resolved_request_with_unknown_api_path():
+    from flex.exceptions import ValidationError
+
+    validator = generate_resolved_request_validator(get_schema(), inner=True)
+    request = RequestFactory(url='http://www.example.com/api/pets/25')
+
+    with pytest.raises(ValidationError) as err:
+        validator(request, api_path='/pets', method='get')
+
+    assert_error_message_equal(
+        err.value.messages[0]['path'][0],
+        MESSAGES['request']['unknown_path'],
+    )
+
+
+def test_resolved_request_with_unknown_method():
+    from flex.exceptions import ValidationError
+
+    validator = generate_resolved_request_validator(get_schema(), inner=True)
+    request = RequestFactory(url='http://www.example.com/api/pets/25')
+
+    with pytest.raises(ValidationError) as err:
+        validator(request, api_path='/pets/{id}', method='put', path_parameters={'id': '25'})
+
+    assert_error_message_equal(
+        err.value.messages[0]['method'][0],
+        MESSAGES['request']['invalid_method'],
+    )
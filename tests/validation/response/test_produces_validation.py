@@ -39,7 +39,7 @@ def test_produces_validation_invalid_mimetype_from_global_definition():
     Test that a response content_type that is in the global api produces
     definitions is valid.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     response = ResponseFactory(content_type='application/json')
 
@@ -88,7 +88,7 @@ def test_produces_validation_for_invalid_mimetype_from_operation_definition():
     Test the situation when the operation definition has overridden the global
     allowed mimetypes, that that the local value is used for validation.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     response = ResponseFactory(content_type='application/xml')
 
     schema = SchemaFactory(
@@ -16,7 +16,7 @@ from tests.utils import assert_error_message_equal
 
 
 def test_response_header_validation():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = SchemaFactory(
         paths={
@@ -18,7 +18,7 @@ def test_response_parameter_validation():
     smoke test to ensure that parameter validation is wired into request
     validation correctly.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = SchemaFactory(
         paths={
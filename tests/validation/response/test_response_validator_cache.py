@@ -0,0 +1,112 @@
+import json
+import pytest
+
+from flex.constants import (
+    INTEGER,
+)
+from flex.validation import response as response_module
+from flex.validation.response import (
+    ResponseValidatorCache,
+    validate_response,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    ResponseFactory,
+)
+
+
+def get_schema():
+    return SchemaFactory(
+        produces=['application/json'],
+        paths={
+            '/get': {
+                'get': {
+                    'responses': {
+                        200: {
+                            'description': 'Success',
+                            'schema': {'type': INTEGER},
+                        }
+                    },
+                },
+            },
+        },
+    )
+
+
+def test_response_validators_are_constructed_once(monkeypatch):
+    schema = get_schema()
+    calls = []
+    generate_response_validator = response_module.generate_response_validator
+
+    def counting_generate_response_validator(*args, **kwargs):
+        calls.append(args)
+        return generate_response_validator(*args, **kwargs)
+
+    monkeypatch.setattr(
+        response_module, 'generate_response_validator', counting_generate_response_validator,
+    )
+
+    response_validators = ResponseValidatorCache(schema)
+    for _ in range(3):
+        validate_response(
+            ResponseFactory(content=json.dumps(1)),
+            operation_definition=schema['paths']['/get']['get'],
+            context=schema,
+            response_validators=response_validators,
+        )
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('compiled', (False, True))
+def test_cached_response_validators_still_detect_errors(compiled):
+    from flex.exceptions import ValidationError
+    schema = get_schema()
+    response_validators = ResponseValidatorCache(schema, compiled=compiled)
+    operation_definition = schema['paths']['/get']['get']
+
+    validate_response(
+        ResponseFactory(content=json.dumps(1)),
+        operation_definition=operation_definition,
+        context=schema,
+        response_validators=response_validators,
+    )
+
+    with pytest.raises(ValidationError) as err:
+        validate_response(
+            ResponseFactory(content=json.dumps('not-an-integer')),
+            operation_definition=operation_definition,
+            context=schema,
+            response_validators=response_validators,
+            inner=True,
+        )
+
+    assert 'body' in err.value.messages[0]
+
+    with pytest.raises(ValidationError) as err:
+        validate_response(
+            ResponseFactory(content_type='text/html'),
+            operation_definition=operation_definition,
+            context=schema,
+            response_validators=response_validators,
+            inner=True,
+        )
+
+    assert 'produces' in err.value.messages[0]
+
+
+def test_operations_from_other_schemas_are_not_cached():
+    schema = get_schema()
+    response_validators = ResponseValidatorCache(schema)
+    operation_definition = get_schema()['paths']['/get']['get']
+
+    validate_response(
+        ResponseFactory(content=json.dumps(1)),
+        operation_definition=operation_definition,
+        context=schema,
+        response_validators=response_validators,
+    )
+
+    assert not response_validators.response_validators
+    assert not response_validators.content_type_validators
@@ -17,7 +17,7 @@ from tests.utils import assert_error_message_equal
 
 
 def test_basic_response_body_schema_validation_with_invalid_value():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
     schema = SchemaFactory(
         paths={
             '/get': {
@@ -0,0 +1,267 @@
+import collections
+import copy
+import decimal
+import uuid
+
+import pytest
+
+from flex.exceptions import ValidationError
+
+from flex.constants import (
+    EMPTY,
+    NULL,
+    BOOLEAN,
+    INTEGER,
+    NUMBER,
+    STRING,
+    ARRAY,
+    OBJECT,
+)
+from flex.validation.common import validate_object
+from flex.validation.schema import construct_schema_validators
+from flex.validation.codegen import (
+    SchemaCompiler,
+    compile_schema_validator,
+)
+
+
+DEFINITIONS = {
+    'Name': {
+        'type': STRING,
+        'minLength': 2,
+    },
+    'Node': {
+        'type': OBJECT,
+        'properties': {
+            'parent': {'$ref': 'Node'},
+            'value': {'type': STRING, 'required': True},
+        },
+    },
+    'Alias': {
+        '$ref': 'Name',
+        'maxLength': 4,
+    },
+}
+
+
+def get_errors(validator, value):
+    try:
+        validator(value)
+    except ValidationError as err:
+        return err.messages
+    return None
+
+
+def assert_same_errors(schema, value, definitions=DEFINITIONS):
+    """
+    Validate the value with both the regular validators and the compiled
+    validator and assert that they agree.
+    """
+    context = {'definitions': copy.deepcopy(definitions)}
+    validators = construct_schema_validators(schema, context)
+    expected = get_errors(
+        lambda v: validate_object(v, validators, inner=True),
+        value,
+    )
+
+    context = {'definitions': copy.deepcopy(definitions)}
+    actual = get_errors(compile_schema_validator(schema, context), value)
+
+    assert actual == expected
+    return actual
+
+
+VALUES = (
+    EMPTY,
+    None,
+    True,
+    False,
+    0,
+    1,
+    -3,
+    2.5,
+    decimal.Decimal('7.5'),
+    '',
+    'abc',
+    'abcdefgh',
+    [],
+    [1, 2, 2],
+    ('a', 'b'),
+    {},
+    {'a': 1},
+    collections.OrderedDict([('a', 1)]),
+)
+
+
+@pytest.mark.parametrize('value', VALUES)
+@pytest.mark.parametrize(
+    'schema',
+    (
+        {'type': NULL},
+        {'type': BOOLEAN},
+        {'type': INTEGER},
+        {'type': NUMBER},
+        {'type': STRING},
+        {'type': ARRAY},
+        {'type': OBJECT},
+        {'type': [STRING, NULL]},
+        {'type': [INTEGER, ARRAY]},
+        {'minimum': 0},
+        {'minimum': 1, 'exclusiveMinimum': True},
+        {'maximum': 1},
+        {'maximum': 1, 'exclusiveMaximum': True},
+        {'multipleOf': 2},
+        {'multipleOf': 0.5},
+        {'minLength': 3},
+        {'maxLength': 3},
+        {'pattern': '^a'},
+        {'minItems': 1},
+        {'maxItems': 2},
+        {'uniqueItems': True},
+        {'minProperties': 1},
+        {'maxProperties': 0},
+        {'enum': [1, 'abc', None, True, [1, 2, 2]]},
+        {'required': True},
+        {'required': False},
+        {'format': 'int32'},
+        {'type': INTEGER, 'minimum': 0, 'maximum': 1, 'enum': [0, 1]},
+    ),
+)
+def test_compiled_keyword_validation_matches(schema, value):
+    assert_same_errors(schema, value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        'abc',
+        'ab',
+        'not-a-uuid',
+        str(uuid.uuid4()),
+        '2011-13-18T10:29:47+03:00',
+        '2011-10-18T10:29:47+03:00',
+        1234,
+    ),
+)
+@pytest.mark.parametrize('format_', ('uuid', 'date-time', 'unknown-format'))
+def test_compiled_format_validation_matches(format_, value):
+    assert_same_errors({'format': format_}, value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        EMPTY,
+        [],
+        ['ab', 'cd'],
+        ['ab', 'c', 3, 'def'],
+        'abc',
+    ),
+)
+@pytest.mark.parametrize(
+    'schema',
+    (
+        {'items': {'type': STRING, 'minLength': 2}},
+        {'items': 'Name'},
+        {'items': [{'type': STRING}, {'type': INTEGER}]},
+        {'type': ARRAY, 'minItems': 3, 'items': {'$ref': 'Name'}},
+    ),
+)
+def test_compiled_items_validation_matches(schema, value):
+    assert_same_errors(schema, value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        EMPTY,
+        {},
+        {'name': 'Piper', 'age': 28},
+        {'name': 'P', 'age': -1},
+        {'name': 1, 'age': '28', 'extra': True},
+        collections.OrderedDict([('name', 'P')]),
+        {'nested': {'alias': 'toolong', 'tags': ['a', 'bc']}},
+    ),
+)
+def test_compiled_properties_validation_matches(value):
+    schema = {
+        'type': OBJECT,
+        'properties': {
+            'name': {'$ref': 'Name', 'required': True},
+            'age': {'type': INTEGER, 'minimum': 0},
+            'nested': {
+                'properties': {
+                    'alias': {'$ref': 'Alias'},
+                    'tags': {'items': {'$ref': 'Name'}},
+                },
+            },
+        },
+    }
+    assert_same_errors(schema, value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        'abc',
+        'a',
+        'abcdefg',
+        1234,
+    ),
+)
+def test_compiled_reference_merging_matches(value):
+    assert_same_errors({'$ref': 'Alias'}, value)
+    assert_same_errors({'$ref': 'Name', 'minLength': 5}, value)
+
+
+def test_compiled_recursive_reference_validation():
+    value = {
+        'value': 'a',
+        'parent': {
+            'value': 1234,
+            'parent': {
+                'parent': {
+                    'value': 'b',
+                },
+            },
+        },
+    }
+    errors = assert_same_errors({'$ref': 'Node'}, value)
+    assert errors
+
+
+def test_compiled_validators_can_be_reused():
+    compiler = SchemaCompiler({'definitions': DEFINITIONS})
+    validator = compiler.compile({'items': {'$ref': 'Node'}})
+    other_validator = compiler.compile({'$ref': 'Node'})
+
+    for _ in range(3):
+        validator([{'value': 'a'}, {'value': 'b', 'parent': {'value': 'c'}}])
+        other_validator({'value': 'a'})
+        with pytest.raises(ValidationError):
+            validator([{'value': 'a'}, {'parent': {'value': 3}}])
+
+    # The `Node` definition is only compiled once.
+    function_count = sum(source.count('def ') for source in compiler.source)
+    assert function_count == len(compiler.nodes)
+
+
+def test_compiled_checks_are_grouped_by_type():
+    compiler = SchemaCompiler({})
+    compiler.compile({
+        'format': 'uuid',
+        'minimum': 0,
+        'multipleOf': 3,
+        'minLength': 2,
+        'minItems': 1,
+    })
+    source = compiler.source[0]
+
+    # Each check appears in the branch of the types it applies to, and in
+    # the fallback branch for values of unknown types.
+    assert source.count("record_error(errors, 'format'") == 2
+    assert source.count("record_error(errors, 'minLength'") == 2
+    assert source.count("record_error(errors, 'minItems'") == 2
+    assert source.count("record_error(errors, 'minimum'") == 3
+    assert source.count("record_error(errors, 'multipleOf'") == 3
+    assert "kind == 'object'" not in source
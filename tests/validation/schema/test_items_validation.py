@@ -18,7 +18,7 @@ from tests.utils import generate_validator_from_schema
     )
 )
 def test_invalid_values_against_single_schema(items):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = {
         'type': ARRAY,
@@ -47,7 +47,7 @@ def test_invalid_values_against_single_schema(items):
     )
 )
 def test_invalid_values_against_schema_reference(items):
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = {
         'type': ARRAY,
@@ -73,7 +73,7 @@ def test_invalid_values_against_schema_reference(items):
 
 
 def test_invalid_values_against_list_of_schemas():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = {
         'type': ARRAY,
@@ -106,7 +106,7 @@ def test_invalid_values_against_list_of_schemas():
 
 
 def test_items_past_the_number_of_schemas_provided_are_skipped():
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = {
         'type': ARRAY,
@@ -124,3 +124,25 @@ def test_items_past_the_number_of_schemas_provided_are_skipped():
         # 20, 30, and 40 don't conform, but are beyond the declared number of schemas.
         inner=True,
     )
+
+
+def test_list_of_schemas_validator_can_be_reused():
+    from flex.exceptions import ValidationError
+
+    schema = {
+        'type': ARRAY,
+        'items': [
+            {'type': INTEGER},
+            {'type': STRING},
+        ],
+    }
+
+    validator = generate_validator_from_schema(schema)
+
+    for _ in range(3):
+        validator([1, 'a', 'extra'], inner=True)
+
+        with pytest.raises(ValidationError) as err:
+            validator(['a', 1], inner=True)
+
+        assert len(err.value.messages[0]['items']) == 2
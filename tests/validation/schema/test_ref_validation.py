@@ -3,6 +3,7 @@ import pytest
 from flex.serializers.definitions import DefinitionsSerializer
 from flex.constants import (
     STRING,
+    OBJECT,
     EMPTY,
 )
 from flex.error_messages import MESSAGES
@@ -176,7 +177,7 @@ def test_required_circular_reference():
     deep.  This test ensures that we can handle that case without ending up in
     an infinite recursion situation.
     """
-    from django.core.exceptions import ValidationError
+    from flex.exceptions import ValidationError
 
     schema = {
         '$ref': 'Node',
@@ -261,3 +262,122 @@ def test_nested_references_are_validated():
 
     assert '1234' in str(e.value)
     assert '54321' in str(e.value)
+
+
+def test_references_to_the_same_definition_share_a_validator():
+    from flex.validation.schema import construct_schema_validators
+
+    context = {
+        'definitions': {
+            'Name': {'type': STRING},
+        },
+    }
+    first = construct_schema_validators({'$ref': 'Name'}, context)
+    second = construct_schema_validators(
+        {'properties': {'name': {'$ref': 'Name'}}}, context,
+    )
+
+    assert first['$ref'] is second['name'].keywords['validators']['$ref']
+    assert first['$ref'].validators is first['$ref'].validators
+
+
+def test_referenced_definition_is_compiled_once(monkeypatch):
+    from flex.validation import schema as schema_module
+
+    calls = []
+    construct_schema_validators = schema_module.construct_schema_validators
+
+    def counting_construct_schema_validators(schema, context, **kwargs):
+        calls.append(schema)
+        return construct_schema_validators(schema, context, **kwargs)
+
+    monkeypatch.setattr(
+        schema_module, 'construct_schema_validators', counting_construct_schema_validators,
+    )
+
+    context = {
+        'definitions': {
+            'Name': {'type': STRING, 'minLength': 2},
+        },
+    }
+    schema = {
+        'properties': {
+            'first_name': {'$ref': 'Name'},
+            'last_name': {'$ref': 'Name'},
+        },
+    }
+    people_validator = generate_validator_from_schema({'items': schema}, context=context)
+    person_validator = generate_validator_from_schema(schema, context=context)
+
+    people_validator([{'first_name': 'Piper', 'last_name': 'Merriam'}] * 1000)
+    person_validator({'first_name': 'Lindsey', 'last_name': 'Merriam'})
+
+    assert calls.count(context['definitions']['Name']) == 1
+
+    with pytest.raises(ValueError):
+        person_validator({'first_name': 'L', 'last_name': 'Merriam'})
+
+
+def test_validators_are_not_mutated_by_validation():
+    from flex.exceptions import ValidationError
+    from flex.validation.common import validate_object
+    from flex.validation.schema import construct_schema_validators
+
+    context = {
+        'definitions': {
+            'Name': {'type': STRING, 'minLength': 2},
+            'Alias': {'$ref': 'Name', 'maxLength': 4},
+        },
+    }
+    validators = construct_schema_validators({'$ref': 'Alias'}, context)
+    before = dict(validators)
+
+    messages = []
+    for _ in range(3):
+        with pytest.raises(ValidationError) as err:
+            validate_object('a', validators, inner=True)
+        messages.append(err.value.messages)
+
+    assert validators == before
+    assert messages[0] == messages[1] == messages[2]
+
+
+def test_validator_can_be_shared_between_threads():
+    import threading
+
+    context = {
+        'definitions': {
+            'Node': {
+                'type': OBJECT,
+                'properties': {
+                    'parent': {'$ref': 'Node'},
+                    'value': {'type': STRING, 'required': True},
+                },
+            },
+        },
+    }
+    validator = generate_validator_from_schema({'$ref': 'Node'}, context=context)
+    valid = {'value': 'a', 'parent': {'value': 'b', 'parent': {'value': 'c'}}}
+    invalid = {'value': 'a', 'parent': {'parent': {'value': 1}}}
+    failures = []
+
+    def run():
+        for _ in range(200):
+            try:
+                validator(valid)
+            except ValueError:
+                failures.append('valid')
+            try:
+                validator(invalid)
+            except ValueError:
+                pass
+            else:
+                failures.append('invalid')
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
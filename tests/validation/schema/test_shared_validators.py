@@ -0,0 +1,155 @@
+import pytest
+
+from flex.exceptions import ValidationError
+
+from flex.constants import (
+    ARRAY,
+    INTEGER,
+    OBJECT,
+    STRING,
+)
+from flex.validation import schema as schema_module
+from flex.validation.common import validate_object
+from flex.validation.schema import (
+    construct_schema_validators,
+    get_schema_key,
+    get_schema_validator_cache,
+)
+from flex.validation.codegen import SchemaCompiler
+
+
+def get_address():
+    return {
+        'type': OBJECT,
+        'properties': {
+            'street': {'type': STRING, 'minLength': 1},
+            'zip': {'type': STRING, 'pattern': '^[0-9]{5}$'},
+        },
+    }
+
+
+def get_deep_schema(depth):
+    schema = {'type': STRING}
+    for _ in range(depth):
+        schema = {'type': OBJECT, 'properties': {'child': schema}}
+    return schema
+
+
+def get_schema():
+    return {
+        'type': OBJECT,
+        'properties': {
+            'home': get_address(),
+            'work': get_address(),
+            'previous': {'type': ARRAY, 'items': get_address()},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    'left,right',
+    (
+        ({'enum': [1]}, {'enum': [True]}),
+        ({'enum': [1]}, {'enum': [1.0]}),
+        ({'enum': [[1]]}, {'enum': [(1,)]}),
+        ({'type': STRING}, {'type': INTEGER}),
+        ({'minimum': 1}, {'minimum': 1, 'exclusiveMinimum': True}),
+    ),
+)
+def test_schemas_that_validate_differently_have_different_keys(left, right):
+    assert get_schema_key(left) != get_schema_key(right)
+
+
+def test_identical_schemas_have_the_same_key():
+    assert get_schema_key(get_schema()) == get_schema_key(get_schema())
+
+
+def test_identical_sub_schemas_share_validators():
+    context = {}
+    cache = get_schema_validator_cache(context)
+    validators = construct_schema_validators(get_schema(), context)
+
+    assert validators['home'].keywords['validators'] is validators['work'].keywords['validators']
+    assert cache.stats == {
+        'schemas': 7,
+        'distinct': 5,
+        'shared': 2,
+    }
+
+
+def test_validators_are_not_shared_between_contexts():
+    validators = construct_schema_validators(get_address(), {})
+    other_validators = construct_schema_validators(get_address(), {})
+
+    assert validators is not other_validators
+
+
+def test_shared_validators_report_errors_for_each_property():
+    validators = construct_schema_validators(get_schema(), {})
+
+    with pytest.raises(ValidationError) as err:
+        validate_object(
+            {'home': {'zip': '1'}, 'work': {'street': ''}, 'previous': [{'zip': '12345'}]},
+            validators,
+            inner=True,
+        )
+
+    errors = err.value.messages[0]
+    assert 'home' in errors
+    assert 'work' in errors
+    assert 'previous' not in errors
+
+
+def test_identical_sub_schemas_are_compiled_once():
+    compiler = SchemaCompiler({})
+    validator = compiler.compile(get_schema())
+
+    validator({'home': {'zip': '12345'}, 'previous': [{'street': 'Main St'}]})
+    with pytest.raises(ValidationError):
+        validator({'previous': [{'zip': '1'}]})
+
+    assert compiler.stats == {
+        'schemas': 7,
+        'distinct': 5,
+        'shared': 2,
+    }
+
+
+def count_schema_key_calls(monkeypatch):
+    calls = []
+
+    def counting_get_schema_key(value, schema_keys=None):
+        calls.append(value)
+        return get_schema_key(value, schema_keys)
+
+    monkeypatch.setattr(schema_module, 'get_schema_key', counting_get_schema_key)
+    return calls
+
+
+def test_deep_schema_keys_are_computed_once(monkeypatch):
+    calls = count_schema_key_calls(monkeypatch)
+
+    validators = construct_schema_validators(get_deep_schema(200), {})
+
+    # each level is a schema, its properties and its type.
+    assert len(calls) <= 3 * 201 + 200
+    validate_object({'child': {'child': {}}}, validators, inner=True)
+
+
+def test_deep_schema_keys_are_computed_once_when_compiled(monkeypatch):
+    calls = count_schema_key_calls(monkeypatch)
+
+    SchemaCompiler({}).compile(get_deep_schema(200))
+
+    assert len(calls) <= 3 * 201 + 2 * 200
+
+
+def test_deep_schema_items_keys_are_computed_once(monkeypatch):
+    schema = {'type': STRING}
+    for _ in range(100):
+        schema = {'type': ARRAY, 'items': schema}
+    calls = count_schema_key_calls(monkeypatch)
+
+    construct_schema_validators(schema, {})
+
+    assert len(calls) <= 2 * 101 + 100
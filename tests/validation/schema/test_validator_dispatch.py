@@ -0,0 +1,116 @@
+import pytest
+
+from flex.exceptions import ValidationError
+from flex.constants import (
+    EMPTY,
+    INTEGER,
+    NUMBER,
+    STRING,
+)
+from flex.formats import registry
+from flex.utils import get_types_for_value
+from flex.validation.common import (
+    get_validators_for_value,
+    validate_object,
+)
+from flex.validation.schema import construct_schema_validators
+
+
+WIDE_SCHEMA = {
+    'type': [STRING, INTEGER, NUMBER],
+    'format': 'uuid',
+    'minimum': 0,
+    'multipleOf': 3,
+    'minLength': 2,
+}
+
+
+def get_keys(validators, value):
+    return set(key for key, _ in get_validators_for_value(validators, value))
+
+
+@pytest.mark.parametrize(
+    'value,keys',
+    (
+        (6, set(['type', 'minimum', 'multipleOf'])),
+        (6.0, set(['type', 'minimum', 'multipleOf'])),
+        ('abc', set(['type', 'format', 'minLength'])),
+        (None, set(['type'])),
+        (EMPTY, set(WIDE_SCHEMA)),
+    ),
+)
+def test_only_validators_for_the_type_of_the_value_are_run(value, keys):
+    validators = construct_schema_validators(WIDE_SCHEMA, {})
+
+    assert get_keys(validators, value) == keys
+
+
+def test_validators_are_grouped_once_for_each_type():
+    validators = construct_schema_validators(WIDE_SCHEMA, {})
+
+    for value in (3, 6, 9):
+        validate_object(value, validators, inner=True)
+    with pytest.raises(ValidationError):
+        validate_object('a', validators, inner=True)
+
+    assert set(validators.dispatch) == set([
+        get_types_for_value(3), get_types_for_value('a'),
+    ])
+
+
+def test_format_validators_are_not_called_for_other_types():
+    calls = []
+
+    @registry.register('test-dispatch', STRING)
+    def test_dispatch_format_validator(value):
+        calls.append(value)
+
+    try:
+        validators = construct_schema_validators({'format': 'test-dispatch'}, {})
+        for value in (1, 1.5, None, [], {}, 'abc'):
+            validate_object(value, validators, inner=True)
+    finally:
+        del registry.formats['test-dispatch']
+        del registry.types['test-dispatch']
+
+    assert calls == ['abc']
+
+
+def test_referenced_validators_are_dispatched_by_type():
+    context = {'definitions': {'Wide': WIDE_SCHEMA}}
+    validators = construct_schema_validators({'$ref': 'Wide', 'maximum': 10}, context)
+
+    assert get_keys(validators, 6) == set(['type', 'minimum', 'maximum', 'multipleOf'])
+
+    with pytest.raises(ValidationError) as err:
+        validate_object(12, validators, inner=True)
+    assert set(err.value.messages[0]) == set(['maximum'])
+
+    with pytest.raises(ValidationError) as err:
+        validate_object('a', validators, inner=True)
+    assert set(err.value.messages[0]) == set(['format', 'minLength'])
+
+
+@pytest.mark.parametrize(
+    'value,divisor,valid',
+    (
+        (9, 3, True),
+        (10, 3, False),
+        (-9, 3, True),
+        (0, 3, True),
+        (9, 1.5, True),
+        (10, 1.5, False),
+        (4.5, 3, False),
+        (12.0, 3, True),
+        (10 ** 20 + 1, 10 ** 20, False),
+    ),
+)
+def test_multiple_of(value, divisor, valid):
+    validators = construct_schema_validators({'multipleOf': divisor}, {})
+
+    if valid:
+        validate_object(value, validators, inner=True)
+    else:
+        with pytest.raises(ValidationError) as err:
+            validate_object(value, validators, inner=True)
+        assert 'multipleOf' in err.value.messages[0]